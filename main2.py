@@ -18,7 +18,11 @@ dengan dukungan heuristik Minimum Remaining Value (MRV) dan animasi proses solvi
 🎯 Fitur Utama:
 - Pemilihan level kesulitan puzzle (Mudah, Menengah, Sulit)
 - Opsi seed acak atau manual untuk reproducibility
-- Mode solving: Backtracking Biasa atau Backtracking + MRV
+- Ukuran papan 9x9, 16x16, atau 25x25
+- Store puzzle SQLite (tingkat + seed -> puzzle & solusi terverifikasi) dengan perintah prewarm
+- Mode solving: Backtracking Biasa, Backtracking + MRV, MRV Incremental, Dancing Links, atau
+  Backjumping (conflict-directed backjumping + nogood learning)
+- Constraint propagation opsional (naked/hidden singles, locked candidates) untuk semua mode
 - Tampilan animasi solving langsung di terminal
 - Logging otomatis ke file CSV (timestamp, level, langkah, durasi, seed, mode, dll.)
 - Validasi bahwa puzzle hanya memiliki satu solusi sebelum diselesaikan
@@ -32,14 +36,21 @@ pada masalah Constraint Satisfaction Problem (CSP), khususnya penyelesaian Sudok
 # ===============================================================================
 
 import time     # Untuk jeda animasi antar langkah solver
+import math     # isqrt untuk menghitung ukuran kotak dari ukuran papan
 import os       # Membersihkan layar terminal
 import sys      # Akses dan kontrol argumen terminal & keluar program
-import copy     # Duplikasi objek puzzle tanpa ngubah yang asli (deep copy)
-import csv      # Ekspor hasil solving ke file CSV
-import random   # Digunakan untuk acak angka (generate puzzle)
-from colorama import init, Fore, Style  # Untuk mewarnai teks di terminal / CLI
-from sudoku import Sudoku  # Library untuk generate puzzle sudoku
-from datetime import datetime  # Format tanggal, waktu sekarang, atau menghitung durasi
+import struct   # Header biner file trace solver
+import threading  # Lock memo keunikan (dipakai bersama thread producer AntreanPuzzle)
+from array import array  # Buffer event trace yang padat (uint32 per event)
+
+# Modul lain di-import di dalam fungsi yang memakainya, supaya solve headless (batch / serve)
+# tidak ikut membayar import yang hanya dibutuhkan generator, animasi, atau logging:
+# colorama (warna terminal), random (generator), csv + datetime (log & output batch),
+# threading + queue (producer puzzle), json, argparse, sqlite3, mmap, dll.
+
+# Hasil cek warna di-cache per objek stdout (cek isatty cukup sekali, bukan per sel)
+CACHE_WARNA = {}
+
 
 def apakah_support_warna(): 
     '''
@@ -47,353 +58,4281 @@ def apakah_support_warna():
     Caranya dengan memeriksa apakah stdout memiliki atribut isatty,
     dan apakah terminal yang digunakan adalah terminal interaktif (bukan file atau pipe).
     Jika keduanya True, maka warna bisa ditampilkan dengan aman.
+    Hasilnya di-cache per objek sys.stdout, jadi syscall isatty hanya terjadi sekali.
+    '''
+
+    kunci = id(sys.stdout)  # stdout bisa diganti (redirect), jadi cache per objek
+    if kunci not in CACHE_WARNA:
+        # Mengecek apakah sys.stdout memiliki atribut/fungsi isatty
+        # Ini penting karena jika output di-redirect ke file atau objek lain, bisa saja nggak ada isatty
+        CACHE_WARNA[kunci] = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+        # sys.stdout.isatty() akan True jika output mengarah ke terminal asli
+        # Jika False, berarti output ke file/pipe dan sebaiknya hindari print dengan warna
+    return CACHE_WARNA[kunci]
+
+
+def salin_papan(papan):
+    '''Salinan papan per baris (cukup untuk list of list int, jauh lebih murah dari deepcopy).'''
+    return [list(b) for b in papan]
+
+
+# Bitmask semua angka 1-9 (bit ke-1 sampai bit ke-9), bit ke-0 sengaja tidak dipakai
+SEMUA_ANGKA = 0b1111111110
+
+# Tabel popcount untuk semua mask 10-bit, biar hitung jumlah kandidat cukup sekali lookup
+JUMLAH_BIT = [bin(i).count('1') for i in range(1 << 10)]
+
+
+class HitungBitLebar:
+    '''
+    Pengganti tabel JUMLAH_BIT untuk grid besar (16x16, 25x25).
+    Mask-nya terlalu lebar untuk ditabelkan, jadi popcount dihitung langsung,
+    tapi cara pakainya tetap sama: jumlah_bit[mask].
+    '''
+
+    __slots__ = ()
+
+    def __getitem__(self, mask):
+        return bin(mask).count('1')
+
+
+class Geometri:
+    '''
+    Data statis untuk papan berukuran n x n (n = k*k, misalnya 9, 16, atau 25):
+    mask semua angka, tabel popcount, tetangga tiap sel, daftar unit, dan
+    lookup nomor kotak. Dibuat sekali per ukuran lewat geometri(ukuran).
+    '''
+
+    __slots__ = ('n', 'k', 'jumlah_sel', 'semua', 'jumlah_bit', 'kotak_baris', 'kotak_kolom',
+                 'tetangga', 'tetangga_rk', 'unit_baris', 'unit_kolom', 'unit_kotak', 'semua_unit')
+
+    def __init__(self, n):
+        k = math.isqrt(n)
+        if k * k != n or k < 2:
+            raise ValueError(f"Ukuran papan {n} tidak valid (harus kuadrat: 9, 16, 25, ...)")
+        self.n, self.k = n, k
+        self.jumlah_sel = n * n
+        self.semua = ((1 << n) - 1) << 1  # Bit 1 sampai n
+        self.jumlah_bit = JUMLAH_BIT if n <= 9 else HitungBitLebar()
+
+        # Nomor kotak = kotak_baris[baris] + kotak_kolom[kolom]
+        self.kotak_baris = [(b // k) * k for b in range(n)]
+        self.kotak_kolom = [c // k for c in range(n)]
+
+        self.unit_baris = [tuple((b, c) for c in range(n)) for b in range(n)]
+        self.unit_kolom = [tuple((b, c) for b in range(n)) for c in range(n)]
+        self.unit_kotak = [
+            tuple((kb * k + b, kk * k + c) for b in range(k) for c in range(k))
+            for kb in range(k) for kk in range(k)
+        ]
+        self.semua_unit = self.unit_baris + self.unit_kolom + self.unit_kotak
+
+        # Tetangga (peer) tiap sel: sel lain di baris, kolom, dan kotak yang sama
+        self.tetangga = []
+        for i in range(self.jumlah_sel):
+            b, c = divmod(i, n)
+            kotak = self.unit_kotak[self.kotak_baris[b] + self.kotak_kolom[c]]
+            peer = set(self.unit_baris[b]) | set(self.unit_kolom[c]) | set(kotak)
+            peer.discard((b, c))
+            self.tetangga.append(tuple(sorted(pb * n + pc for pb, pc in peer)))
+        # Versi yang sudah dipecah jadi (indeks, baris, kolom), biar loop panas tidak perlu // dan %
+        self.tetangga_rk = [tuple((t, t // n, t % n) for t in peer) for peer in self.tetangga]
+
+
+# Cache Geometri per ukuran papan
+CACHE_GEOMETRI = {}
+
+
+def geometri(ukuran=9):
+    '''Ambil (atau buat sekali) objek Geometri untuk papan ukuran x ukuran.'''
+    geo = CACHE_GEOMETRI.get(ukuran)
+    if geo is None:
+        geo = CACHE_GEOMETRI[ukuran] = Geometri(ukuran)
+    return geo
+
+
+class PapanBitmask:
+    '''
+    Engine status papan berbasis bitmask untuk mempercepat cek validitas.
+    Setiap baris, kolom, dan kotak punya satu integer yang bit ke-n-nya
+    menyala jika angka n sudah dipakai di unit tersebut.
+
+    Dengan begitu, kandidat angka untuk sebuah sel cukup dihitung dengan
+    beberapa operasi OR/AND, tanpa perlu scan ulang baris, kolom, dan kotak
+    sel demi sel. Mask di-update secara incremental lewat isi()
+    dan hapus(), sementara list papan aslinya tetap ikut diubah.
+
+    Ukuran papan dibaca dari len(papan); untuk 16x16 dan 25x25 mask-nya
+    cukup berupa int Python yang lebih lebar.
+    '''
+
+    __slots__ = ('papan', 'geo', 'semua', 'kotak_baris', 'kotak_kolom', 'mask_baris', 'mask_kolom', 'mask_kotak',
+                 'bentrok')
+
+    def __init__(self, papan):
+        self.papan = papan  # Referensi ke papan asli (bukan salinan)
+        self.geo = geo = geometri(len(papan))
+        self.semua = geo.semua
+        self.kotak_baris, self.kotak_kolom = geo.kotak_baris, geo.kotak_kolom
+        self.mask_baris = [0] * geo.n
+        self.mask_kolom = [0] * geo.n
+        self.mask_kotak = [0] * geo.n
+        self.bentrok = None  # (baris, kolom) petunjuk pertama yang angkanya sudah ada di baris/kolom/kotaknya
+
+        # Bangun mask awal dari angka-angka yang sudah terisi di papan
+        for baris in range(geo.n):
+            for kolom in range(geo.n):
+                angka = papan[baris][kolom]
+                if angka:
+                    bit = 1 << angka
+                    kotak = self.kotak_baris[baris] + self.kotak_kolom[kolom]
+                    if self.bentrok is None and (self.mask_baris[baris] | self.mask_kolom[kolom]
+                                                 | self.mask_kotak[kotak]) & bit:
+                        self.bentrok = (baris, kolom)
+                    self.mask_baris[baris] |= bit
+                    self.mask_kolom[kolom] |= bit
+                    self.mask_kotak[kotak] |= bit
+
+    def kandidat(self, baris, kolom):
+        '''Return bitmask angka yang masih sah untuk sel (baris, kolom).'''
+        terpakai = (self.mask_baris[baris] | self.mask_kolom[kolom]
+                    | self.mask_kotak[self.kotak_baris[baris] + self.kotak_kolom[kolom]])
+        return ~terpakai & self.semua
+
+    def isi(self, baris, kolom, angka):
+        '''Isi sel dengan angka dan nyalakan bit-nya di baris, kolom, dan kotak.'''
+        bit = 1 << angka
+        self.papan[baris][kolom] = angka
+        self.mask_baris[baris] |= bit
+        self.mask_kolom[kolom] |= bit
+        self.mask_kotak[self.kotak_baris[baris] + self.kotak_kolom[kolom]] |= bit
+
+    def hapus(self, baris, kolom):
+        '''Kosongkan sel (undo) dan matikan lagi bit angkanya.'''
+        bit = ~(1 << self.papan[baris][kolom])
+        self.papan[baris][kolom] = 0
+        self.mask_baris[baris] &= bit
+        self.mask_kolom[kolom] &= bit
+        self.mask_kotak[self.kotak_baris[baris] + self.kotak_kolom[kolom]] &= bit
+
+
+# Tetangga tiap sel papan 9x9 dalam indeks 0-80 (alias dari geometri(9), dipertahankan untuk kompatibilitas)
+TETANGGA = geometri(9).tetangga
+TETANGGA_RK = geometri(9).tetangga_rk
+
+
+class PapanMRV(PapanBitmask):
+    '''
+    Turunan PapanBitmask yang menjaga struktur MRV secara incremental.
+    Alih-alih scan ulang semua sel di setiap level rekursi (seperti cari_sel_kosong_mrv),
+    kelas ini menyimpan:
+    - opsi: mask kandidat tiap sel kosong
+    - ember: bucket sel kosong berdasarkan jumlah kandidat (0 sampai n)
+    - derajat: jumlah tetangga yang masih kosong (dipakai untuk tie-break)
+
+    Saat isi() atau hapus(), hanya tetangga dari sel yang berubah yang di-update.
+    Perubahan dicatat di jejak (trail) supaya undo bisa mengembalikan kondisi persis.
+    '''
+
+    __slots__ = ('opsi', 'ember', 'derajat', 'jejak', 'n', 'jumlah_bit', 'tetangga_rk')
+
+    def __init__(self, papan):
+        super().__init__(papan)
+        geo = self.geo
+        self.n = n = geo.n
+        self.jumlah_bit = jumlah_bit = geo.jumlah_bit
+        self.tetangga_rk = geo.tetangga_rk
+        self.opsi = [0] * geo.jumlah_sel
+        self.ember = [set() for _ in range(n + 1)]
+        self.derajat = [0] * geo.jumlah_sel
+        self.jejak = []  # Stack berisi daftar tetangga yang bit-nya dicabut di tiap isi()
+
+        for idx in range(geo.jumlah_sel):
+            if papan[idx // n][idx % n] == 0:
+                self.opsi[idx] = self.kandidat(idx // n, idx % n)
+                self.ember[jumlah_bit[self.opsi[idx]]].add(idx)
+                self.derajat[idx] = sum(1 for _, b, k in self.tetangga_rk[idx] if papan[b][k] == 0)
+
+    def isi(self, baris, kolom, angka):
+        '''Isi sel, lalu cabut angka tsb dari kandidat tetangga yang masih kosong.'''
+        idx = baris * self.n + kolom
+        jumlah_bit = self.jumlah_bit
+        self.ember[jumlah_bit[self.opsi[idx]]].discard(idx)  # Sel sudah terisi, keluar dari bucket
+        super().isi(baris, kolom, angka)
+
+        bit = 1 << angka
+        papan, opsi, ember, derajat = self.papan, self.opsi, self.ember, self.derajat
+        dicabut = []  # Tetangga yang kehilangan kandidat 'angka'
+        for t, b, k in self.tetangga_rk[idx]:
+            if papan[b][k] == 0:
+                derajat[t] -= 1
+                if opsi[t] & bit:
+                    jumlah = jumlah_bit[opsi[t]]
+                    ember[jumlah].discard(t)
+                    ember[jumlah - 1].add(t)
+                    opsi[t] ^= bit
+                    dicabut.append(t)
+        self.jejak.append(dicabut)
+
+    def hapus(self, baris, kolom):
+        '''Undo isi(): kembalikan kandidat tetangga sesuai jejak, lalu kosongkan sel.'''
+        idx = baris * self.n + kolom
+        bit = 1 << self.papan[baris][kolom]
+        opsi, ember, jumlah_bit = self.opsi, self.ember, self.jumlah_bit
+        for t in self.jejak.pop():
+            jumlah = jumlah_bit[opsi[t]]
+            ember[jumlah].discard(t)
+            ember[jumlah + 1].add(t)
+            opsi[t] |= bit
+
+        super().hapus(baris, kolom)
+        papan, derajat = self.papan, self.derajat
+        for t, b, k in self.tetangga_rk[idx]:
+            if papan[b][k] == 0:
+                derajat[t] += 1
+        ember[jumlah_bit[opsi[idx]]].add(idx)  # Sel kosong lagi, masuk bucket semula
+
+    def pilih_sel(self):
+        '''
+        Pilih sel kosong dengan kandidat paling sedikit (bucket terendah yang tidak kosong).
+        Jika seri, ambil sel dengan derajat terbesar (paling banyak membatasi tetangga),
+        lalu indeks terkecil supaya hasilnya deterministik.
+        Sel dengan tepat 1 kandidat pasti harus diisi semua, jadi cukup ambil indeks terkecil.
+        Return (None, None) jika papan sudah penuh.
+        '''
+        for jumlah, sel in enumerate(self.ember):
+            if sel:
+                if jumlah == 1:
+                    idx = min(sel)
+                else:
+                    derajat = self.derajat
+                    idx = min(sel, key=lambda i: (-derajat[i], i))
+                return divmod(idx, self.n)
+        return (None, None)
+
+
+def angka_dari_mask(mask):
+    '''
+    Generator yang mengubah bitmask kandidat jadi urutan angka dari kecil ke besar.
+    Urutannya sama dengan loop range(1, 10) di versi lama, jadi jumlah langkah tetap identik.
+    '''
+    while mask:
+        bit = mask & -mask  # Ambil bit paling rendah yang menyala
+        mask ^= bit  # Matikan bit tersebut
+        yield bit.bit_length() - 1  # Posisi bit = angka kandidat
+
+
+# 27 unit Sudoku 9x9 (9 baris, 9 kolom, 9 kotak), masing-masing berisi 9 pasangan (baris, kolom)
+UNIT_BARIS = geometri(9).unit_baris
+UNIT_KOLOM = geometri(9).unit_kolom
+UNIT_KOTAK = geometri(9).unit_kotak
+SEMUA_UNIT = geometri(9).semua_unit
+
+
+class PropagasiKendala:
+    '''
+    Lapisan constraint propagation yang dijalankan sampai fixpoint di atas engine bitmask:
+    - Naked single  : sel yang kandidatnya tinggal satu langsung diisi
+    - Hidden single : angka yang cuma punya satu tempat di suatu unit langsung diisi
+    - Locked candidates (pointing/claiming): jika angka di sebuah kotak hanya bisa ada di satu
+      baris/kolom (atau sebaliknya), angka itu dicoret dari sel lain di baris/kolom/kotak tersebut
+
+    Semua perubahan (isian dan coretan) dicatat di jejak, sehingga backtracking cukup memanggil
+    kembalikan(tanda) untuk membatalkan semua deduksi sejak tanda itu diambil.
+    '''
+
+    __slots__ = ('status', 'geo', 'coret', 'jejak', 'jumlah_isi', 'callback')
+
+    def __init__(self, status, callback=None):
+        self.status = status  # PapanBitmask / PapanMRV yang dipakai solver
+        self.geo = status.geo
+        self.coret = [0] * self.geo.jumlah_sel  # Kandidat yang sudah dicoret oleh locked candidates per sel
+        self.jejak = []  # Isi: (indeks, None) untuk isian, (indeks, mask_lama) untuk coretan
+        self.jumlah_isi = 0  # Total sel yang terisi lewat propagasi (bukan tebakan)
+        self.callback = callback  # Dipanggil callback(baris, kolom, angka) setiap isian (angka 0 = isian dibatalkan)
+
+    def kandidat(self, baris, kolom):
+        '''Kandidat sel setelah memperhitungkan coretan dari locked candidates.'''
+        return self.status.kandidat(baris, kolom) & ~self.coret[baris * self.geo.n + kolom]
+
+    def tanda(self):
+        '''Ambil posisi jejak saat ini, untuk di-undo nanti.'''
+        return len(self.jejak)
+
+    def kembalikan(self, tanda):
+        '''Batalkan semua isian dan coretan sejak tanda (urutan terbalik / LIFO).'''
+        jejak, status, coret, n = self.jejak, self.status, self.coret, self.geo.n
+        while len(jejak) > tanda:
+            idx, mask_lama = jejak.pop()
+            if mask_lama is None:
+                status.hapus(idx // n, idx % n)
+                if self.callback:
+                    self.callback(idx // n, idx % n, 0)
+            else:
+                coret[idx] = mask_lama
+
+    def isi(self, baris, kolom, angka):
+        self.status.isi(baris, kolom, angka)
+        self.jejak.append((baris * self.geo.n + kolom, None))
+        self.jumlah_isi += 1
+        if self.callback:
+            self.callback(baris, kolom, angka)
+
+    def coret_kandidat(self, baris, kolom, mask):
+        '''Coret bit-bit di mask dari kandidat sel. Return True kalau ada yang benar-benar berubah.'''
+        idx = baris * self.geo.n + kolom
+        if self.status.papan[baris][kolom] or not (self.kandidat(baris, kolom) & mask):
+            return False
+        self.jejak.append((idx, self.coret[idx]))
+        self.coret[idx] |= mask
+        return True
+
+    def singles(self):
+        '''
+        Satu putaran naked single + hidden single.
+        Return None jika ketemu kontradiksi, selain itu True/False apakah ada sel yang terisi.
+        '''
+        papan = self.status.papan
+        n = self.geo.n
+        berubah = False
+
+        # Naked single: sel kosong dengan tepat satu kandidat
+        for baris in range(n):
+            for kolom in range(n):
+                if papan[baris][kolom] == 0:
+                    mask = self.kandidat(baris, kolom)
+                    if mask == 0:
+                        return None  # Sel tanpa kandidat: jalan buntu
+                    if mask & (mask - 1) == 0:
+                        self.isi(baris, kolom, mask.bit_length() - 1)
+                        berubah = True
+
+        # Hidden single: angka yang hanya punya satu posisi di unitnya
+        for unit in self.geo.semua_unit:
+            sekali = dua_kali = terisi = 0
+            for baris, kolom in unit:
+                angka = papan[baris][kolom]
+                if angka:
+                    terisi |= 1 << angka
+                else:
+                    mask = self.kandidat(baris, kolom)
+                    dua_kali |= sekali & mask
+                    sekali |= mask
+            if (sekali | terisi) != self.geo.semua:
+                return None  # Ada angka yang tidak punya tempat sama sekali di unit ini
+            tunggal = sekali & ~dua_kali & ~terisi
+            for baris, kolom in unit:
+                if tunggal == 0:
+                    break
+                if papan[baris][kolom] == 0:
+                    cocok = self.kandidat(baris, kolom) & tunggal
+                    if cocok:
+                        # Ambil bit terendah; bit lain (jika ada) berarti kontradiksi, dicek di putaran berikutnya
+                        bit = cocok & -cocok
+                        self.isi(baris, kolom, bit.bit_length() - 1)
+                        tunggal &= ~cocok
+                        berubah = True
+        return berubah
+
+    def locked_candidates(self):
+        '''
+        Pointing: angka di kotak yang hanya muncul di satu baris/kolom, dicoret dari sisa baris/kolom itu.
+        Claiming: angka di baris/kolom yang hanya muncul di satu kotak, dicoret dari sisa kotak itu.
+        Return True jika ada kandidat yang dicoret.
+        '''
+        papan = self.status.papan
+        geo = self.geo
+        berubah = False
+
+        for nomor_unit, unit in enumerate(geo.semua_unit):
+            adalah_kotak = nomor_unit >= 2 * geo.n  # Sepertiga terakhir SEMUA_UNIT adalah kotak
+            # Untuk tiap angka, kumpulkan baris, kolom, dan kotak tempat angka itu masih mungkin
+            for angka in range(1, geo.n + 1):
+                bit = 1 << angka
+                posisi = [(b, k) for b, k in unit if papan[b][k] == 0 and self.kandidat(b, k) & bit]
+                if len(posisi) < 2:
+                    continue  # 0 atau 1 posisi sudah ditangani singles()
+                semua_baris = {b for b, _ in posisi}
+                semua_kolom = {k for _, k in posisi}
+                semua_kotak = {geo.kotak_baris[b] + geo.kotak_kolom[k] for b, k in posisi}
+
+                target = []
+                if not adalah_kotak and len(semua_kotak) == 1:
+                    target.append(geo.unit_kotak[semua_kotak.pop()])  # Claiming (baris/kolom -> kotak)
+                elif adalah_kotak:
+                    if len(semua_baris) == 1:
+                        target.append(geo.unit_baris[semua_baris.pop()])  # Pointing (kotak -> baris)
+                    if len(semua_kolom) == 1:
+                        target.append(geo.unit_kolom[semua_kolom.pop()])  # Pointing (kotak -> kolom)
+
+                for unit_target in target:
+                    for b, k in unit_target:
+                        if (b, k) not in unit and self.coret_kandidat(b, k, bit):
+                            berubah = True
+        return berubah
+
+    def jalankan(self):
+        '''
+        Jalankan propagasi sampai fixpoint (tidak ada lagi perubahan).
+        Singles diulang dulu sampai habis, baru locked candidates dicoba.
+        Return False jika papan ternyata kontradiksi (pemanggil wajib kembalikan ke tanda sebelumnya).
+        '''
+        while True:
+            hasil = self.singles()
+            if hasil is None:
+                return False
+            if hasil:
+                continue
+            if not self.locked_candidates():
+                return True
+
+
+def cari_sel_kosong_biasa(papan):
+    '''
+    Fungsi ini digunakan untuk mencari posisi sel kosong (yang bernilai 0) 
+    di papan Sudoku secara urut dari kiri ke kanan, atas ke bawah (Naive/Basic).
+    Jika ditemukan, fungsi langsung mengembalikan indeks (baris, kolom) dari sel kosong pertama.
+    jika tidak ada sel kosong lagi, berarti papan sudah penuh, dan fungsi return (None, None).
+    '''
+    
+    # Looping baris dari atas ke bawah
+    for baris, isi_baris in enumerate(papan):
+        # Cek apakah baris ini masih punya sel kosong (bernilai 0)
+        if 0 in isi_baris:
+            return (baris, isi_baris.index(0))  # Return posisi sel kosong pertama
+
+    # jika tidak ada sel kosong, return (None, None) sebagai penanda papan sudah penuh
+    return (None, None)
+
+
+def cari_sel_kosong_mrv(papan, status=None):
+    '''
+    Fungsi ini menerapkan heuristik Minimum Remaining Value (MRV),
+    yaitu mencari sel kosong yang memiliki kemungkinan tebakan paling sedikit.
+    Tujuannya adalah meminimalkan kemungkinan salah, karena semakin sedikit opsi,
+    semakin besar kemungkinan kita memilih angka yang benar di awal.
+    
+    Fungsi akan mengembalikan posisi (baris, kolom) dari sel kosong
+    dengan jumlah opsi terkecil. Jika ada sel dengan hanya 1 kemungkinan valid,
+    langsung dikembalikan karena itu paling prioritas.
+    jika tidak ada sel kosong, fungsi akan return (None, None).
+
+    Parameter status (PapanBitmask) opsional: kalau solver sudah punya engine bitmask,
+    kirim saja supaya tidak perlu membangun ulang mask dari papan.
+    '''
+
+    if status is None:
+        status = PapanBitmask(papan)  # Bangun mask sekali di awal pemanggilan
+
+    n = len(papan)
+    jumlah_bit = status.geo.jumlah_bit
+    min_opsi = n + 1  # Jumlah kemungkinan minimum, inisialisasi dengan nilai maksimal
+    kandidat = None  # Menyimpan posisi kandidat terbaik (sel dengan opsi paling sedikit)
+
+    # Looping semua baris dan kolom
+    for baris in range(n):
+        for kolom in range(n):
+            # Cek hanya sel yang kosong (bernilai 0)
+            if papan[baris][kolom] == 0:
+                # Hitung jumlah kemungkinan angka valid untuk sel ini (popcount dari mask kandidat)
+                opsi = jumlah_bit[status.kandidat(baris, kolom)]
+
+                # Update jika jumlah opsi lebih sedikit dari sebelumnya
+                if opsi < min_opsi:
+                    min_opsi = opsi
+                    kandidat = (baris, kolom)
+
+                    # Jika cuma punya 1 opsi, langsung balikin (paling optimal)
+                    if min_opsi == 1:
+                        return kandidat
+                    
+    # Return kandidat terbaik, atau (None, None) jika tidak ada sel kosong
+    return kandidat if kandidat else (None, None)
+
+
+class PencarianIteratif:
+    '''
+    Engine backtracking iteratif dengan stack keputusan eksplisit (tanpa rekursi).
+    Dipakai oleh pecahkan_sudoku_anim (mode 1-3).
+
+    - Stack keputusan dialokasikan sekali di awal (ukuran = jumlah sel, jadi papan
+      16x16 / 25x25 tidak terbentur batas rekursi Python), isinya:
+      sel yang dipilih, mask kandidat yang belum dicoba, tanda jejak propagasi,
+      dan apakah sel tersebut sedang terisi tebakan.
+    - Semua state disimpan di objek, jadi pencarian bisa dihentikan kapan saja
+      (budget node / tenggat waktu habis) lalu dilanjutkan dengan memanggil event()
+      atau jalankan() lagi.
+    - event() adalah generator yang menghasilkan tuple (jenis, baris, kolom, angka)
+      dengan jenis 'isi', 'hapus', atau 'propagasi'. Pemanggil (misal animasi) bebas
+      menampilkan/menjeda tiap event tanpa solver ikut tidur.
+
+    Urutan pemilihan sel dan angka sama persis dengan versi rekursif sebelumnya,
+    sehingga jumlah langkah tetap identik.
+
+    Untuk pencarian split (cari_split):
+    - batas_kedalaman: simpul di kedalaman ini tidak dibuka, jalurnya (angka tebakan per kedalaman)
+      dicatat di self.cabang sebagai (awalan, None) lalu diperlakukan seperti jalan buntu.
+      Solusi yang sudah ketemu di atas kedalaman itu dicatat sebagai (awalan, salinan_papan).
+    - awalan: tuple angka tebakan yang dipaksakan di kedalaman 0..len(awalan)-1, jadi pencarian
+      hanya menjelajah satu subtree dengan state (MRV, propagasi) yang sama persis dengan versi sekuensial.
+    '''
+
+    def __init__(self, papan, mode='2', propagasi=False, batas_solusi=1, acak=False, awalan=(),
+                 batas_kedalaman=None):
+        self.papan = papan
+        self.mode = mode
+        self.batas_solusi = batas_solusi  # Berhenti setelah menemukan solusi sebanyak ini
+        self.acak = acak  # True = urutan angka diacak
+        self.awalan = awalan
+        self.batas_kedalaman = batas_kedalaman
+        self.cabang = []  # Frontier / solusi dangkal yang dicatat kalau batas_kedalaman diisi
+        self.status = PapanMRV(papan) if mode == '3' else PapanBitmask(papan)
+
+        self.antrean_event = []  # Event propagasi yang belum di-yield
+        self.prop = PropagasiKendala(self.status, self.catat_propagasi) if propagasi else None
+
+        # Stack keputusan yang sudah dialokasikan di depan (kedalaman maksimal = jumlah sel)
+        jumlah_sel = self.status.geo.jumlah_sel
+        self.tumpukan_baris = [0] * jumlah_sel
+        self.tumpukan_kolom = [0] * jumlah_sel
+        self.tumpukan_sisa = [0] * jumlah_sel
+        self.tumpukan_tanda = [0] * jumlah_sel
+        self.tumpukan_terisi = [False] * jumlah_sel
+        self.kedalaman = 0
+
+        self.langkah = 0  # Jumlah tebakan (angka yang dicoba)
+        self.backtrack = 0  # Jumlah tebakan yang di-undo
+        self.kedalaman_maks = 0  # Kedalaman stack keputusan terdalam
+        self.cek_validitas = 0  # Jumlah perhitungan mask kandidat sel (setara satu cek validitas per sel)
+        self.jumlah_solusi = 0
+        self.solusi_pertama = None  # Salinan papan saat solusi pertama ditemukan
+        self.perlu_pilih = True  # True = langkah berikutnya adalah memilih sel kosong baru
+        self.selesai = False  # True = ruang pencarian habis atau batas solusi tercapai
+        self.sukses = False
+
+        # Propagasi awal sebelum pencarian; kalau langsung kontradiksi, puzzle tidak bisa diselesaikan
+        if self.prop and not self.prop.jalankan():
+            self.prop.kembalikan(0)
+            self.selesai = True
+
+    def catat_propagasi(self, baris, kolom, angka):
+        # angka 0 = isian propagasi dibatalkan saat backtrack, dilaporkan sebagai event 'hapus'
+        self.antrean_event.append(('propagasi' if angka else 'hapus', baris, kolom, angka))
+
+    @property
+    def jumlah_propagasi(self):
+        return self.prop.jumlah_isi if self.prop else 0
+
+    def pilih_sel(self):
+        '''Pilih sel kosong berikutnya sesuai mode (biasa, MRV scan, atau MRV incremental).'''
+        if self.mode == '1':
+            return cari_sel_kosong_biasa(self.papan)
+        if self.mode == '3':
+            return self.status.pilih_sel()
+        return cari_sel_kosong_mrv(self.papan, self.status)
+
+    def event(self, batas_node=None, tenggat=None):
+        '''
+        Generator utama pencarian. Berhenti (return) jika:
+        - pencarian selesai (cek atribut selesai / sukses / jumlah_solusi), atau
+        - batas_node tebakan sejak pemanggilan ini habis, atau
+        - tenggat (nilai time.perf_counter()) sudah lewat.
+        Jika berhenti karena budget, panggil event()/jalankan() lagi untuk melanjutkan.
+        '''
+        status, prop = self.status, self.prop
+        tumpukan_baris, tumpukan_kolom = self.tumpukan_baris, self.tumpukan_kolom
+        tumpukan_sisa, tumpukan_tanda, tumpukan_terisi = self.tumpukan_sisa, self.tumpukan_tanda, self.tumpukan_terisi
+        antrean = self.antrean_event
+        batas_langkah = self.langkah + batas_node if batas_node is not None else None
+        awalan, panjang_awalan, batas_kedalaman = self.awalan, len(self.awalan), self.batas_kedalaman
+
+        while antrean:
+            yield antrean.pop(0)  # Sisa event propagasi awal
+
+        while not self.selesai:
+            # Cek budget sebelum membuka node baru
+            if batas_langkah is not None and self.langkah >= batas_langkah:
+                return
+            if tenggat is not None and self.langkah % 64 == 0 and time.perf_counter() >= tenggat:
+                return
+
+            if self.perlu_pilih:
+                self.perlu_pilih = False
+                baris, kolom = self.pilih_sel()
+                if baris is None:
+                    # Tidak ada sel kosong: satu solusi ditemukan
+                    self.jumlah_solusi += 1
+                    if self.solusi_pertama is None:
+                        self.solusi_pertama = salin_papan(self.papan)
+                    if batas_kedalaman is not None:
+                        self.cabang.append((self.jalur(), salin_papan(self.papan)))
+                    if self.jumlah_solusi >= self.batas_solusi or self.kedalaman == 0:
+                        self.selesai = True
+                        self.sukses = True
+                        return
+                    continue  # Cari solusi berikutnya: tebakan teratas akan di-undo
+
+                d = self.kedalaman
+                if d == batas_kedalaman:
+                    self.cabang.append((self.jalur(), None))  # Simpul frontier: dikerjakan worker lain
+                    continue  # Seperti jalan buntu: tebakan teratas akan di-undo
+                tumpukan_baris[d], tumpukan_kolom[d] = baris, kolom
+                tumpukan_sisa[d] = prop.kandidat(baris, kolom) if prop else status.kandidat(baris, kolom)
+                if d < panjang_awalan:
+                    tumpukan_sisa[d] &= 1 << awalan[d]  # Subtree split: hanya angka dari awalan
+                tumpukan_terisi[d] = False
+                self.kedalaman = d + 1
+                self.cek_validitas += 1
+                if d >= self.kedalaman_maks:
+                    self.kedalaman_maks = d + 1
+
+            d = self.kedalaman - 1
+            baris, kolom = tumpukan_baris[d], tumpukan_kolom[d]
+
+            # Undo tebakan sebelumnya di sel ini (kalau ada) sebelum mencoba angka berikutnya
+            if tumpukan_terisi[d]:
+                if prop:
+                    prop.kembalikan(tumpukan_tanda[d])
+                    while antrean:
+                        yield antrean.pop(0)  # Isian propagasi yang ikut dibatalkan
+                status.hapus(baris, kolom)
+                tumpukan_terisi[d] = False
+                self.backtrack += 1
+                yield ('hapus', baris, kolom, 0)
+
+            sisa = tumpukan_sisa[d]
+            if sisa == 0:
+                # Semua angka di sel ini gagal: pop frame, tebakan di frame induk akan di-undo
+                self.kedalaman = d
+                if d == 0:
+                    self.selesai = True  # Ruang pencarian habis, tidak ada solusi (lagi)
+                    self.sukses = self.jumlah_solusi > 0
+                    return
+                continue
+
+            if self.acak:
+                import random
+                bit = 1 << random.choice(list(angka_dari_mask(sisa)))
+            else:
+                bit = sisa & -sisa  # Angka terkecil dulu, sama seperti range(1, 10)
+            tumpukan_sisa[d] = sisa ^ bit
+            tebakan = bit.bit_length() - 1
+
+            status.isi(baris, kolom, tebakan)
+            tumpukan_terisi[d] = True
+            self.langkah += 1
+            yield ('isi', baris, kolom, tebakan)
+
+            # Jalankan propagasi setelah tebakan; tanda dipakai untuk undo deduksinya nanti
+            if prop:
+                tumpukan_tanda[d] = prop.tanda()
+                berhasil = prop.jalankan()
+                while antrean:
+                    yield antrean.pop(0)
+                if not berhasil:
+                    continue  # Kontradiksi: tebakan ini akan di-undo di iterasi berikutnya
+            self.perlu_pilih = True
+
+    def jalur(self):
+        '''Angka tebakan di setiap kedalaman stack keputusan saat ini (dipakai sebagai awalan subtree).'''
+        papan = self.papan
+        return tuple(papan[self.tumpukan_baris[d]][self.tumpukan_kolom[d]] for d in range(self.kedalaman))
+
+    def jalankan(self, batas_node=None, tenggat=None):
+        '''
+        Jalankan pencarian tanpa mengonsumsi event satu per satu (headless).
+        Return True jika pencarian sudah selesai, False jika berhenti karena budget
+        (state tetap tersimpan dan bisa dilanjutkan).
+        '''
+        for _ in self.event(batas_node, tenggat):
+            pass
+        return self.selesai
+
+
+# Tabel nogood mode CBJ: jumlah maksimum nogood yang disimpan (yang tertua dibuang kalau penuh),
+# dan panjang maksimum nogood yang dipelajari (nogood panjang jarang terpicu lagi, jadi tidak disimpan)
+BATAS_NOGOOD = 4096
+MAKS_PANJANG_NOGOOD = 12
+
+
+class PencarianCBJ:
+    '''
+    Engine backtracking dengan conflict-directed backjumping (CBJ) dan pencatatan nogood (mode 5).
+
+    Setiap keputusan punya tingkat (kedalaman stack). Saat sel dipilih, untuk tiap angka yang
+    sudah tidak sah dicatat tingkat keputusan paling awal yang memblokirnya (petunjuk tidak punya
+    tingkat, jadi tidak pernah jadi penyebab). Himpunan tingkat ini adalah conflict set sel tersebut.
+    Kalau semua angka di sebuah sel gagal, pencarian tidak mundur satu tingkat seperti
+    PencarianIteratif, tapi langsung melompat ke tingkat terdalam di conflict set-nya; tingkat di
+    antaranya dibatalkan tanpa dicoba ulang karena tidak ikut menyebabkan kegagalan. Conflict set
+    yang tersisa digabung ke conflict set tingkat tujuan.
+
+    Conflict set kegagalan itu juga dicatat sebagai nogood: kombinasi (sel, angka) yang pasti tidak
+    bisa diperluas jadi solusi. Tabel nogood dibatasi BATAS_NOGOOD entri; tiap nogood memantau dua
+    literalnya (seperti watched literals di SAT solver), jadi tebakan yang melengkapi nogood yang sudah
+    diketahui langsung ditolak tanpa dijelajah, tanpa memeriksa semua nogood di setiap tebakan.
+
+    Antarmukanya sama dengan PencarianIteratif (event(), jalankan(), langkah, backtrack, ...) plus
+    statistik backjump (lompatan yang melewati lebih dari satu tingkat), tingkat_dilompati,
+    nogood (jumlah nogood yang dipelajari), dan pangkas_nogood (tebakan yang ditolak nogood).
+    Urutan sel memakai MRV (scan bitmask), angka dicoba dari kecil ke besar.
+    Propagasi (kalau aktif) hanya dijalankan di root, seperti mode DLX: isiannya diperlakukan
+    sebagai petunjuk. Hanya mencari solusi pertama (tidak dipakai untuk menghitung solusi).
+    '''
+
+    def __init__(self, papan, propagasi=False):
+        self.papan = papan
+        self.status = PapanBitmask(papan)
+        geo = self.status.geo
+        self.n = geo.n
+        self.tetangga_rk = geo.tetangga_rk
+
+        self.antrean_event = []  # Event propagasi root yang belum di-yield
+        self.prop = None
+        self.selesai = self.status.bentrok is not None  # Petunjuk saling bentrok: tidak ada solusi
+        self.sukses = False
+        if propagasi and not self.selesai:
+            self.prop = PropagasiKendala(self.status, self.catat_propagasi)
+            if not self.prop.jalankan():
+                self.prop.kembalikan(0)
+                self.selesai = True
+
+        jumlah_sel = geo.jumlah_sel
+        self.tingkat = [-1] * jumlah_sel  # Tingkat keputusan tiap sel (-1 = petunjuk / kosong)
+        self.tumpukan_sel = [0] * jumlah_sel
+        self.tumpukan_sisa = [0] * jumlah_sel
+        self.tumpukan_konflik = [None] * jumlah_sel  # set tingkat penyebab kegagalan per frame
+        self.tumpukan_terisi = [False] * jumlah_sel
+        self.kedalaman = 0
+        self.perlu_pilih = True
+
+        # Nogood: tuple literal (indeks_sel * 64 + angka, urut) -> [dua literal yang dipantau].
+        # dict urut insert = antrean FIFO untuk pembuangan. pantau: literal -> list nogood yang memantaunya.
+        self.nogood = {}
+        self.pantau = {}
+        self.berlaku = set()  # Literal tebakan yang sedang terisi di papan
+
+        self.langkah = 0
+        self.backtrack = 0
+        self.backjump = 0  # Jumlah lompatan mundur yang melewati lebih dari satu tingkat
+        self.tingkat_dilompati = 0  # Total tingkat yang dibatalkan tanpa dicoba ulang
+        self.jumlah_nogood = 0  # Jumlah nogood yang dipelajari
+        self.pangkas_nogood = 0  # Tebakan yang langsung ditolak karena melengkapi nogood
+        self.kedalaman_maks = 0
+        self.cek_validitas = 0
+        self.jumlah_solusi = 0
+        self.solusi_pertama = None
+
+    def catat_propagasi(self, baris, kolom, angka):
+        self.antrean_event.append(('propagasi' if angka else 'hapus', baris, kolom, angka))
+
+    @property
+    def jumlah_propagasi(self):
+        return self.prop.jumlah_isi if self.prop else 0
+
+    def konflik_sel(self, idx):
+        '''
+        Return (mask kandidat, conflict set) sel kosong idx: untuk tiap angka yang diblokir tetangga,
+        tingkat keputusan paling awal yang memblokirnya. Angka yang diblokir petunjuk tidak punya penyebab.
+        '''
+        n, papan, tingkat = self.n, self.papan, self.tingkat
+        sisa = self.status.kandidat(idx // n, idx % n)
+        tetap = 0  # Angka yang diblokir petunjuk
+        paling_awal = {}
+        for t, b, k in self.tetangga_rk[idx]:
+            angka = papan[b][k]
+            if angka:
+                lv = tingkat[t]
+                if lv < 0:
+                    tetap |= 1 << angka
+                elif lv < paling_awal.get(angka, lv + 1):
+                    paling_awal[angka] = lv
+        return sisa, {lv for angka, lv in paling_awal.items() if not tetap >> angka & 1}
+
+    def langgar_nogood(self, idx, angka):
+        '''
+        Cek apakah mengisi angka di sel idx melengkapi salah satu nogood. Return set tingkat literal
+        lain di nogood itu (alasan penolakan), atau None kalau tebakan boleh dicoba.
+        Cukup nogood yang memantau literal ini: nogood yang tinggal kurang satu literal selalu memantaunya.
+        '''
+        literal = idx * 64 + angka
+        daftar = self.pantau.get(literal)
+        if not daftar:
+            return None
+        berlaku = self.berlaku
+        for ng in daftar:
+            w0, w1 = self.nogood[ng]
+            if w0 == w1:
+                return set()  # Nogood satu literal: angka ini tidak pernah sah di sel ini, apa pun tebakan lainnya
+            if (w1 if w0 == literal else w0) not in berlaku:
+                continue  # Literal pantauan yang lain belum berlaku: nogood belum lengkap
+            if all(lain == literal or lain in berlaku for lain in ng):
+                return {self.tingkat[lain >> 6] for lain in ng if lain != literal}
+        return None
+
+    def geser_pantauan(self, idx, angka):
+        '''
+        Dipanggil setelah tebakan diisi: nogood yang memantau literal ini dipindah ke literal lain
+        yang belum berlaku. Kalau tidak ada, pantauan tetap (literal pantauan satunya tinggal satu-satunya
+        yang belum berlaku). Tidak perlu di-undo saat backtrack.
+        '''
+        literal = idx * 64 + angka
+        daftar = self.pantau.get(literal)
+        if not daftar:
+            return
+        berlaku, nogood, pantau = self.berlaku, self.nogood, self.pantau
+        tetap = []
+        for ng in daftar:
+            pantauan = nogood[ng]
+            posisi = 0 if pantauan[0] == literal else 1
+            for lain in ng:
+                if lain not in berlaku and lain != pantauan[1 - posisi]:
+                    pantauan[posisi] = lain
+                    pantau.setdefault(lain, []).append(ng)
+                    break
+            else:
+                tetap.append(ng)
+        daftar[:] = tetap
+
+    def pelajari(self, konflik):
+        '''
+        Simpan conflict set kegagalan sebagai nogood (literal sel+angka di tiap tingkatnya).
+        Pantauan awalnya literal di dua tingkat terdalam: yang terdalam langsung dibatalkan oleh backjump.
+        '''
+        if not konflik or len(konflik) > MAKS_PANJANG_NOGOOD:
+            return
+        n, papan, sel = self.n, self.papan, self.tumpukan_sel
+        urut = sorted(konflik, reverse=True)
+        literal = [sel[lv] * 64 + papan[sel[lv] // n][sel[lv] % n] for lv in urut]
+        ng = tuple(sorted(literal))
+        if ng in self.nogood:
+            return
+        if len(self.nogood) >= BATAS_NOGOOD:
+            # Buang nogood tertua (dict urut insert) beserta pantauannya
+            lama = next(iter(self.nogood))
+            for w in set(self.nogood.pop(lama)):
+                self.pantau[w].remove(lama)
+        pantauan = [literal[0], literal[1] if len(literal) > 1 else literal[0]]
+        self.nogood[ng] = pantauan
+        for w in set(pantauan):
+            self.pantau.setdefault(w, []).append(ng)
+        self.jumlah_nogood += 1
+
+    def event(self, batas_node=None, tenggat=None):
+        '''
+        Generator pencarian dengan event yang sama seperti PencarianIteratif.event ('isi', 'hapus',
+        'propagasi'); satu backjump menghasilkan satu event 'hapus' untuk setiap tingkat yang dibatalkan.
+        Berhenti karena budget bisa dilanjutkan dengan memanggil event()/jalankan() lagi.
+        '''
+        status, papan, n = self.status, self.papan, self.n
+        tingkat, berlaku = self.tingkat, self.berlaku
+        tumpukan_sel, tumpukan_sisa = self.tumpukan_sel, self.tumpukan_sisa
+        tumpukan_konflik, tumpukan_terisi = self.tumpukan_konflik, self.tumpukan_terisi
+        antrean = self.antrean_event
+        batas_langkah = self.langkah + batas_node if batas_node is not None else None
+
+        while antrean:
+            yield antrean.pop(0)
+
+        while not self.selesai:
+            if batas_langkah is not None and self.langkah >= batas_langkah:
+                return
+            if tenggat is not None and self.langkah % 64 == 0 and time.perf_counter() >= tenggat:
+                return
+
+            if self.perlu_pilih:
+                self.perlu_pilih = False
+                baris, kolom = cari_sel_kosong_mrv(papan, status)
+                if baris is None:
+                    self.jumlah_solusi = 1
+                    self.solusi_pertama = salin_papan(papan)
+                    self.selesai = self.sukses = True
+                    return
+                d = self.kedalaman
+                idx = baris * n + kolom
+                tumpukan_sel[d] = idx
+                tumpukan_sisa[d], tumpukan_konflik[d] = self.konflik_sel(idx)
+                tumpukan_terisi[d] = False
+                self.kedalaman = d + 1
+                self.cek_validitas += 1
+                if d >= self.kedalaman_maks:
+                    self.kedalaman_maks = d + 1
+
+            d = self.kedalaman - 1
+            idx = tumpukan_sel[d]
+            baris, kolom = divmod(idx, n)
+
+            if tumpukan_terisi[d]:
+                berlaku.discard(idx * 64 + papan[baris][kolom])
+                status.hapus(baris, kolom)
+                tingkat[idx] = -1
+                tumpukan_terisi[d] = False
+                self.backtrack += 1
+                yield ('hapus', baris, kolom, 0)
+
+            sisa = tumpukan_sisa[d]
+            if sisa == 0:
+                # Jalan buntu: lompat ke tingkat terdalam yang ikut menyebabkan kegagalan
+                konflik = tumpukan_konflik[d]
+                self.pelajari(konflik)
+                tujuan = max(konflik) if konflik else -1
+                for lv in range(d - 1, tujuan, -1):
+                    # Tingkat di antara tujuan dan d tidak relevan: batalkan tanpa mencoba angka lain
+                    sel = tumpukan_sel[lv]
+                    b, k = divmod(sel, n)
+                    berlaku.discard(sel * 64 + papan[b][k])
+                    status.hapus(b, k)
+                    tingkat[sel] = -1
+                    tumpukan_terisi[lv] = False
+                    self.backtrack += 1
+                    yield ('hapus', b, k, 0)
+                if tujuan < d - 1:
+                    self.backjump += 1
+                    self.tingkat_dilompati += d - 1 - tujuan
+                if tujuan < 0:
+                    # Conflict set kosong: kegagalan hanya disebabkan petunjuk, puzzle tidak punya solusi
+                    self.kedalaman = 0
+                    self.selesai = True
+                    return
+                konflik.discard(tujuan)
+                tumpukan_konflik[tujuan] |= konflik
+                self.kedalaman = tujuan + 1
+                continue
+
+            bit = sisa & -sisa
+            tumpukan_sisa[d] = sisa ^ bit
+            tebakan = bit.bit_length() - 1
+
+            alasan = self.langgar_nogood(idx, tebakan)
+            if alasan is not None:
+                tumpukan_konflik[d] |= alasan  # Ditolak nogood: penyebabnya ikut jadi penyebab kegagalan sel ini
+                self.pangkas_nogood += 1
+                continue
+
+            status.isi(baris, kolom, tebakan)
+            tingkat[idx] = d
+            tumpukan_terisi[d] = True
+            berlaku.add(idx * 64 + tebakan)
+            self.geser_pantauan(idx, tebakan)
+            self.langkah += 1
+            yield ('isi', baris, kolom, tebakan)
+            self.perlu_pilih = True
+
+    def jalankan(self, batas_node=None, tenggat=None):
+        '''Jalankan pencarian headless. Return True kalau selesai, False kalau berhenti karena budget.'''
+        for _ in self.event(batas_node, tenggat):
+            pass
+        return self.selesai
+
+
+def pecahkan_sudoku_anim(papan, delay=0.03, papan_awal=None, deskripsi_mode=None, mode='1',
+                         propagasi=False, statistik=None, trace=None, batas_node=None, batas_waktu=None):
+    '''
+    Fungsi utama untuk menyelesaikan Sudoku dengan metode backtracking, 
+    sekaligus menampilkan animasi proses solving-nya di terminal.
+    
+    Parameter:
+    - papan: papan sudoku n x n (9x9, 16x16, atau 25x25) yang ingin dipecahkan.
+    - delay: waktu tunda antar langkah animasi (0 = tanpa animasi).
+    - papan_awal: referensi posisi angka asli (tidak bisa diubah).
+    - deskripsi_mode: label yang menunjukkan mode solving (Naive / MRV).
+                      None = headless, hasil akhir tidak ditampilkan ke terminal.
+    - mode: '1' untuk Backtracking Biasa, '2' untuk MRV heuristik (scan ulang),
+            '3' untuk MRV incremental (bucket kandidat + tie-break derajat),
+            '4' untuk Dancing Links (exact cover),
+            '5' untuk conflict-directed backjumping + nogood (PencarianCBJ, propagasi hanya di root).
+    - propagasi: jika True, jalankan PropagasiKendala (singles + locked candidates)
+                 sebelum pencarian dan setelah setiap tebakan.
+    - statistik: dict opsional yang akan diisi metrik solver:
+                 'propagasi' = jumlah sel yang terisi lewat propagasi (bukan tebakan),
+                 'backtrack', 'kedalaman_maks', 'cek_validitas', dan 'solve_ns'
+                 (waktu solve dari perf_counter_ns, tanpa tampilan hasil akhir).
+    - trace: RekamanTrace opsional; setiap event isi/hapus/propagasi dicatat ke situ
+             supaya bisa di-replay nanti (perintah replay) tanpa solve ulang.
+    - batas_node: budget jumlah tebakan (langkah) untuk solve ini, None = tanpa batas.
+    - batas_waktu: budget waktu solve dalam detik, None = tanpa batas.
+
+    Mode 1-3 dijalankan oleh PencarianIteratif dan mode 5 oleh PencarianCBJ
+    (statistik ditambah backjump, tingkat_dilompati, nogood, pangkas_nogood); animasi hanya mengonsumsi event-nya,
+    jadi solver sendiri tidak pernah tidur. Animasi digambar oleh RendererANSI dengan batas
+    1/delay frame per detik; langkah di antara dua frame dilewati (tidak ditunggu).
+
+    Return:
+    - sukses: True jika puzzle berhasil dipecahkan, False jika tidak punya solusi,
+              None jika budget habis sebelum pencarian selesai (papan dikembalikan ke kondisi awal)
+    - langkah: jumlah langkah percobaan angka (tebakan, tidak termasuk isian propagasi)
+    - durasi: waktu total eksekusi solving
+    statistik['status'] berisi 'sukses', 'gagal', atau 'budget' (nilai yang sama dengan kolom Status di log).
+    '''
+
+    start = time.perf_counter_ns()  # Mulai stopwatch (resolusi nanodetik)
+    tenggat = time.perf_counter() + batas_waktu if batas_waktu is not None else None
+    # Salinan papan hanya dibutuhkan kalau solve bisa terpotong budget (untuk dikembalikan ke awal)
+    papan_asli = salin_papan(papan) if batas_node is not None or tenggat is not None else None
+    if statistik is not None:
+        statistik.update(propagasi=0, backtrack=0, kedalaman_maks=0, cek_validitas=0, solve_ns=0)
+
+    def hasil(sukses, langkah, durasi_ns):
+        if sukses is None:
+            for baris, isi_asli in zip(papan, papan_asli):
+                baris[:] = isi_asli  # Budget habis: buang isian setengah jalan (list baris tetap sama)
+        if statistik is not None:
+            statistik['status'] = STATUS_SOLVE[sukses]
+        return sukses, langkah, durasi_ns / 1e9
+
+    if mode == '4':
+        # Mode DLX punya engine pencarian sendiri (bukan backtracking per sel)
+        prop = None
+        if propagasi:
+            # Propagasi hanya di root, sisanya diserahkan ke DLX
+            renderer = RendererANSI(papan, papan_awal, deskripsi_mode, fps=1 / delay) if delay > 0 else None
+
+            def animasi_propagasi(baris, kolom, angka):
+                if trace is not None:
+                    trace.catat('propagasi' if angka else 'hapus', baris, kolom, angka)
+                if renderer is not None and angka and renderer.perlu_gambar():
+                    renderer.gambar((baris, kolom), f"Langkah 0: Propagasi {angka} di ({baris}, {kolom})")
+
+            prop = PropagasiKendala(PapanBitmask(papan),
+                                    animasi_propagasi if delay > 0 or trace is not None else None)
+            if not prop.jalankan():
+                prop.kembalikan(0)
+                durasi_ns = time.perf_counter_ns() - start
+                if statistik is not None:
+                    statistik.update(propagasi=prop.jumlah_isi, solve_ns=durasi_ns)
+                return hasil(False, 0, durasi_ns)
+        prop_ns = time.perf_counter_ns() - start  # Waktu propagasi root, ditambah ke waktu DLX
+        statistik_dlx = {}
+        sukses, langkah, _ = pecahkan_sudoku_dlx(papan, delay, papan_awal, deskripsi_mode, trace, statistik_dlx,
+                                                 batas_node, tenggat)
+        durasi_ns = prop_ns + statistik_dlx['solve_ns']
+        if statistik is not None:
+            statistik.update(statistik_dlx, solve_ns=durasi_ns)
+            if prop:
+                statistik['propagasi'] = prop.jumlah_isi
+        return hasil(sukses, langkah, durasi_ns)
+
+    pencarian = PencarianCBJ(papan, propagasi) if mode == '5' else PencarianIteratif(papan, mode, propagasi)
+    pesan = {'isi': "Coba {angka} di", 'hapus': "Backtrack dari", 'propagasi': "Propagasi {angka} di"}
+    renderer = RendererANSI(papan, papan_awal, deskripsi_mode, fps=1 / delay) if delay > 0 else None
+
+    for jenis, baris, kolom, angka in pencarian.event(batas_node, tenggat):
+        if trace is not None:
+            trace.catat(jenis, baris, kolom, angka)
+        if renderer is not None and renderer.perlu_gambar():
+            renderer.gambar((baris, kolom), f"Langkah {pencarian.langkah}: " + pesan[jenis].format(angka=angka)
+                            + f" ({baris}, {kolom})")
+
+    durasi_ns = time.perf_counter_ns() - start  # Hitung durasi solve (sebelum tampilan hasil akhir)
+    if pencarian.sukses:
+        tampilkan_hasil_akhir(papan, papan_awal, deskripsi_mode)  # Tampilkan hasil akhir
+
+    if statistik is not None:
+        statistik.update(
+            propagasi=pencarian.jumlah_propagasi,  # Catat isian propagasi terpisah dari tebakan
+            backtrack=pencarian.backtrack,
+            kedalaman_maks=pencarian.kedalaman_maks,
+            cek_validitas=pencarian.cek_validitas,
+            solve_ns=durasi_ns
+        )
+        if mode == '5':
+            statistik.update(backjump=pencarian.backjump, tingkat_dilompati=pencarian.tingkat_dilompati,
+                             nogood=pencarian.jumlah_nogood, pangkas_nogood=pencarian.pangkas_nogood)
+    # Generator berhenti tanpa selesai = budget node / waktu habis
+    return hasil(pencarian.sukses if pencarian.selesai else None, pencarian.langkah, durasi_ns)
+
+
+# Nilai statistik['status'] / kolom Status di log untuk setiap nilai sukses
+STATUS_SOLVE = {True: 'sukses', False: 'gagal', None: 'budget'}
+
+# Mode berikutnya yang dicoba kalau budget habis: naive -> MRV -> DLX, MRV incremental / CBJ -> DLX
+ESKALASI_MODE = {'1': '2', '2': '4', '3': '4', '5': '4'}
+
+
+def pecahkan_dengan_eskalasi(papan, mode='1', eskalasi=True, statistik=None, trace=None, **opsi):
+    '''
+    Jalankan pecahkan_sudoku_anim dengan budget (opsi batas_node / batas_waktu berlaku per percobaan).
+    Kalau budget habis dan eskalasi aktif, papan sudah dikembalikan ke awal oleh pecahkan_sudoku_anim,
+    lalu solve diulang dengan mode yang lebih kuat sesuai ESKALASI_MODE, sampai berhasil atau
+    tidak ada mode lagi. Jadi waktu terburuk per puzzle tetap terbatas (budget x panjang rantai).
+
+    Return (sukses, langkah, durasi) seperti pecahkan_sudoku_anim, tapi langkah dan durasi
+    dijumlah dari semua percobaan. statistik['jalur_mode'] berisi urutan mode yang dicoba, misal "1>2>4";
+    metrik lainnya dari percobaan terakhir, kecuali solve_ns yang juga total.
+    trace hanya menyimpan event percobaan terakhir supaya replay tetap konsisten.
+    '''
+    statistik = {} if statistik is None else statistik
+    jalur, total_langkah, total_ns = [], 0, 0
+    while True:
+        jalur.append(mode)
+        if trace is not None:
+            del trace.data[:]
+        sukses, langkah, _ = pecahkan_sudoku_anim(papan, mode=mode, statistik=statistik, trace=trace, **opsi)
+        total_langkah += langkah
+        total_ns += statistik['solve_ns']
+        if sukses is not None or not eskalasi or mode not in ESKALASI_MODE:
+            break
+        mode = ESKALASI_MODE[mode]
+    statistik.update(jalur_mode=">".join(jalur), solve_ns=total_ns)
+    return sukses, total_langkah, total_ns / 1e9
+
+
+def hitung_solusi(papan, jobs=1):
+    '''
+    Fungsi ini digunakan untuk menghitung jumlah solusi dari sebuah papan Sudoku.
+    
+    Tujuannya adalah untuk memastikan bahwa puzzle yang kita proses hanya punya 
+    satu solusi (unik). Pengecekan diserahkan ke cek_keunikan (Dancing Links,
+    deterministik, berhenti begitu ketemu solusi kedua), jadi puzzle yang sama
+    selalu butuh waktu yang sama dan panggilan berulang langsung diambil dari cache.
+    jobs > 1: pencarian dipecah ke beberapa proses (cari_split), untuk puzzle yang sangat berat.
+    '''
+    return cek_keunikan(papan, jobs)[0]
+
+
+class SolverDLX:
     '''
+    Solver Sudoku berbasis Dancing Links (Algorithm X dari Knuth).
+    Sudoku dimodelkan sebagai masalah exact cover: pilih sekumpulan pilihan (baris, kolom, angka)
+    sehingga setiap constraint tertutup tepat satu kali. Untuk papan 9x9 ada 324 kolom constraint:
+    - 0-80    : setiap sel harus terisi
+    - 81-161  : setiap baris punya angka 1-9
+    - 162-242 : setiap kolom punya angka 1-9
+    - 243-323 : setiap kotak 3x3 punya angka 1-9
+    Dan 729 pilihan (baris, kolom, angka), masing-masing menutup 4 kolom.
+    Untuk papan n x n jumlahnya jadi 4*n*n kolom dan n*n*n pilihan.
+
+    Matriks dibangun langsung dalam bentuk yang sudah tereduksi: header constraint yang sudah
+    dipenuhi angka awal tidak disambungkan, dan hanya pilihan yang masih jadi kandidat sel kosong
+    yang dibuatkan node. Hasilnya identik dengan matriks penuh yang angka awalnya di-cover satu per satu
+    (urutan header dan node sama), tapi jauh lebih murah untuk puzzle yang petunjuknya banyak.
+    Node 0 adalah root, node 1 sampai 4*n*n adalah header kolom, sisanya node isi matriks.
+    '''
+
+    __slots__ = ('L', 'R', 'U', 'D', 'S', 'C', 'baris_node', 'n', 'papan', 'valid', 'langkah', 'jumlah_solusi',
+                 'solusi_pertama', 'terpotong', 'backtrack', 'kedalaman_maks', 'cek_validitas', 'cabang')
+
+    def __init__(self, papan):
+        self.n = n = len(papan)
+        self.papan = papan
+        self.valid = True  # False jika angka awal saling bentrok
+        self.langkah = 0
+        self.jumlah_solusi = 0
+        self.solusi_pertama = None  # Salinan papan saat solusi pertama ditemukan
+        self.terpotong = False  # True jika pencarian dihentikan karena batas_langkah habis
+        self.backtrack = 0  # Jumlah pilihan yang di-undo
+        self.kedalaman_maks = 0  # Kedalaman pencarian terdalam
+        self.cek_validitas = 0  # Jumlah pemilihan kolom constraint (setara cek kandidat satu sel/unit)
+        self.cabang = []  # Frontier / solusi dangkal untuk pencarian split (lihat cari)
+
+        geo = geometri(n)
+        jumlah_sel = geo.jumlah_sel
+        jumlah_kolom = 4 * jumlah_sel
+        kotak_baris, kotak_kolom = geo.kotak_baris, geo.kotak_kolom
+
+        # Mask angka yang sudah dipakai angka awal per baris/kolom/kotak (sekalian deteksi bentrok)
+        mask_baris, mask_kolom, mask_kotak = [0] * n, [0] * n, [0] * n
+        for baris in range(n):
+            for kolom in range(n):
+                angka = papan[baris][kolom]
+                if angka:
+                    bit = 1 << angka
+                    kotak = kotak_baris[baris] + kotak_kolom[kolom]
+                    if (mask_baris[baris] | mask_kolom[kolom] | mask_kotak[kotak]) & bit:
+                        self.valid = False  # Angka awal bentrok: puzzle tidak punya solusi
+                        return
+                    mask_baris[baris] |= bit
+                    mask_kolom[kolom] |= bit
+                    mask_kotak[kotak] |= bit
+
+        # Header: hanya constraint yang belum dipenuhi yang disambungkan ke list root (urutan tetap naik)
+        aktif = [0] * (jumlah_kolom + 1)
+        for baris in range(n):
+            for kolom in range(n):
+                if not papan[baris][kolom]:
+                    aktif[1 + baris * n + kolom] = 1
+        for unit in range(n):
+            for angka in range(n):
+                bit = 1 << (angka + 1)
+                aktif[1 + jumlah_sel + unit * n + angka] = not mask_baris[unit] & bit
+                aktif[1 + 2 * jumlah_sel + unit * n + angka] = not mask_kolom[unit] & bit
+                aktif[1 + 3 * jumlah_sel + unit * n + angka] = not mask_kotak[unit] & bit
+
+        L = list(range(-1, jumlah_kolom))
+        R = list(range(1, jumlah_kolom + 2))
+        sebelumnya = 0
+        for header in range(1, jumlah_kolom + 1):
+            if aktif[header]:
+                R[sebelumnya] = header  # Header saling terhubung melingkar
+                L[header] = sebelumnya
+                sebelumnya = header
+        R[sebelumnya] = 0
+        L[0] = sebelumnya
+        U = list(range(jumlah_kolom + 1))  # Kolom kosong: U/D header menunjuk ke dirinya sendiri
+        D = list(range(jumlah_kolom + 1))
+        C = list(range(jumlah_kolom + 1))  # Header kolom untuk setiap node
+        S = [0] * (jumlah_kolom + 1)  # Jumlah node aktif per kolom
+        baris_node = [-1] * (jumlah_kolom + 1)  # Indeks pilihan (0 sampai n^3-1) pemilik node
+
+        # Node isi: satu baris pilihan (4 node) per kandidat sel kosong, urut sesuai indeks pilihan
+        for baris in range(n):
+            for kolom in range(n):
+                if papan[baris][kolom]:
+                    continue
+                kotak = kotak_baris[baris] + kotak_kolom[kolom]
+                bebas = ~(mask_baris[baris] | mask_kolom[kolom] | mask_kotak[kotak])
+                for angka in range(n):
+                    if not bebas & (1 << (angka + 1)):
+                        continue
+                    kolom_constraint = (
+                        baris * n + kolom,
+                        jumlah_sel + baris * n + angka,
+                        2 * jumlah_sel + kolom * n + angka,
+                        3 * jumlah_sel + kotak * n + angka,
+                    )
+                    pilihan = (baris * n + kolom) * n + angka
+                    awal = len(C)
+                    for i, c in enumerate(kolom_constraint):
+                        header = c + 1
+                        node = awal + i
+                        # Sambungkan node ke bawah kolom (sebelum header, karena melingkar)
+                        U.append(U[header])
+                        D.append(header)
+                        D[U[header]] = node
+                        U[header] = node
+                        C.append(header)
+                        S[header] += 1
+                        baris_node.append(pilihan)
+                        # Sambungkan node ke kiri-kanan dalam satu baris pilihan (melingkar 4 node)
+                        L.append(awal + (i - 1) % 4)
+                        R.append(awal + (i + 1) % 4)
+
+        self.L, self.R, self.U, self.D, self.S, self.C, self.baris_node = L, R, U, D, S, C, baris_node
+
+    def tutup(self, c):
+        '''Cover kolom c: lepas header-nya, lalu lepas semua baris yang memakai kolom itu.'''
+        L, R, U, D, S, C = self.L, self.R, self.U, self.D, self.S, self.C
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def buka(self, c):
+        '''Uncover kolom c: kebalikan persis dari tutup(), urutannya dibalik.'''
+        L, R, U, D, S, C = self.L, self.R, self.U, self.D, self.S, self.C
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def cari(self, batas=1, tulis=True, callback=None, batas_langkah=None, tenggat=None, awalan=(),
+             batas_kedalaman=None, berhenti=None):
+        '''
+        Jalankan Algorithm X sampai menemukan 'batas' solusi (atau ruang pencarian habis).
+        - tulis: jika True, pilihan yang sedang dicoba ditulis ke papan (solusi pertama tetap tertinggal di papan).
+        - callback(baris, kolom, angka_atau_0): dipanggil setiap isi/undo, dipakai untuk animasi.
+        Solusi pertama selalu disimpan di self.solusi_pertama (juga saat tulis=False).
+        - batas_langkah: jika diisi, pencarian dihentikan setelah sekian langkah dan self.terpotong = True
+          (struktur link dibiarkan setengah jalan, jadi solver tidak boleh dipakai lagi).
+        - tenggat: nilai time.perf_counter(); sama seperti batas_langkah tapi berdasarkan waktu (dicek tiap 64 langkah).
+        - berhenti: callable tanpa argumen, dicek tiap 1024 langkah; return True = hentikan (terpotong).
+        - awalan / batas_kedalaman: sama seperti di PencarianIteratif, tapi isinya indeks pilihan
+          (baris_node) per kedalaman; frontier dan solusi dangkal dicatat di self.cabang.
+        Return jumlah solusi yang ditemukan (maksimal 'batas').
+        '''
+        if not self.valid:
+            return 0
+
+        L, R, U, D, S = self.L, self.R, self.U, self.D, self.S
+        C, baris_node = self.C, self.baris_node
+        papan, n = self.papan, self.n
+        ubah_papan = tulis or callback is not None
+        # Stack eksplisit (bukan rekursi, seperti PencarianIteratif): papan 25x25 dengan ratusan sel kosong
+        # bisa sedalam batas rekursi Python. Per kedalaman disimpan pilihan aktif, kolom yang di-cover,
+        # dan node baris yang sedang dicoba; semuanya dialokasikan sekali, bukan per node.
+        jalur = [0] * (n * n)
+        tumpukan_kolom = [0] * (n * n + 1)
+        tumpukan_node = [0] * (n * n + 1)
+        panjang_awalan = len(awalan)
+        tutup, buka = self.tutup, self.buka
+
+        kedalaman = 0
+        turun = True  # True = baru masuk kedalaman ini, False = kembali dari anak (undo pilihan aktif dulu)
+        while kedalaman >= 0:
+            if turun:
+                # Semua constraint sudah tertutup: ketemu satu solusi
+                if R[0] == 0:
+                    self.jumlah_solusi += 1
+                    if self.solusi_pertama is None or batas_kedalaman is not None:
+                        solusi = salin_papan(papan)
+                        for pilihan in jalur[:kedalaman]:
+                            baris, sisa = divmod(pilihan, n * n)
+                            kolom, angka = divmod(sisa, n)
+                            solusi[baris][kolom] = angka + 1
+                        if self.solusi_pertama is None:
+                            self.solusi_pertama = solusi
+                        if batas_kedalaman is not None:
+                            self.cabang.append((tuple(jalur[:kedalaman]), solusi))
+                    if self.jumlah_solusi >= batas:
+                        break
+                    kedalaman -= 1
+                    turun = False
+                    continue
+                if kedalaman == batas_kedalaman:
+                    self.cabang.append((tuple(jalur[:kedalaman]), None))  # Simpul frontier: dikerjakan worker lain
+                    kedalaman -= 1
+                    turun = False
+                    continue
+
+                # Heuristik S: pilih kolom dengan node aktif paling sedikit (setara MRV)
+                self.cek_validitas += 1
+                if kedalaman >= self.kedalaman_maks:
+                    self.kedalaman_maks = kedalaman + 1
+                c = R[0]
+                terbaik, minimum = c, S[c]
+                while c != 0 and minimum > 1:
+                    if S[c] < minimum:
+                        terbaik, minimum = c, S[c]
+                    c = R[c]
+                if minimum == 0:
+                    kedalaman -= 1  # Ada constraint yang tidak mungkin dipenuhi, jalan buntu
+                    turun = False
+                    continue
+
+                tutup(terbaik)
+                tumpukan_kolom[kedalaman] = terbaik
+                r = D[terbaik]
+            else:
+                # Undo pilihan aktif di kedalaman ini, lalu lanjut ke baris berikutnya di kolom yang sama
+                terbaik, r = tumpukan_kolom[kedalaman], tumpukan_node[kedalaman]
+                j = L[r]
+                while j != r:
+                    buka(C[j])
+                    j = L[j]
+                self.backtrack += 1
+
+                if ubah_papan:
+                    baris, sisa = divmod(jalur[kedalaman], n * n)
+                    kolom = sisa // n
+                    if tulis:
+                        papan[baris][kolom] = 0  # Backtrack: kosongkan sel lagi
+                    if callback:
+                        callback(baris, kolom, 0)
+                r = D[r]
+
+            paksa = awalan[kedalaman] if kedalaman < panjang_awalan else -1  # Subtree split: satu pilihan saja
+            while r != terbaik:
+                pilihan = baris_node[r]
+                if paksa >= 0 and pilihan != paksa:
+                    r = D[r]
+                    continue
+                self.langkah += 1
+                if (batas_langkah is not None and self.langkah > batas_langkah) or \
+                        (tenggat is not None and self.langkah % 64 == 0 and time.perf_counter() >= tenggat) or \
+                        (berhenti is not None and self.langkah % 1024 == 0 and berhenti()):
+                    self.terpotong = True
+                    return self.jumlah_solusi  # Berhenti tanpa buka(): solver ini tidak dipakai lagi
+                jalur[kedalaman] = pilihan
+                if ubah_papan:
+                    baris, sisa = divmod(pilihan, n * n)
+                    kolom, angka = divmod(sisa, n)
+                    if tulis:
+                        papan[baris][kolom] = angka + 1
+                    if callback:
+                        callback(baris, kolom, angka + 1)
+
+                j = R[r]
+                while j != r:
+                    tutup(C[j])
+                    j = R[j]
+                break
+
+            if r != terbaik:
+                tumpukan_node[kedalaman] = r
+                kedalaman += 1
+                turun = True
+            else:
+                buka(terbaik)  # Semua baris kolom ini sudah dicoba
+                kedalaman -= 1
+                turun = False
+
+        return self.jumlah_solusi
+
+
+def pecahkan_sudoku_dlx(papan, delay=0.03, papan_awal=None, deskripsi_mode=None, trace=None, statistik=None,
+                        batas_node=None, tenggat=None):
+    '''
+    Versi Dancing Links dari pecahkan_sudoku_anim.
+    Papan diisi langsung oleh solver, dan jika delay > 0 isi/undo dianimasikan
+    dengan RendererANSI yang sama seperti mode lainnya (maksimal 1/delay frame per detik).
+
+    Return tuple yang sama: (sukses, langkah, durasi), jadi log CSV dan visualisasi.py
+    bisa langsung membandingkan DLX dengan mode naive dan MRV. Jika statistik diberikan,
+    metrik solver (backtrack, kedalaman_maks, cek_validitas, solve_ns) ikut diisi.
+    batas_node / tenggat diteruskan ke SolverDLX.cari; kalau terpotong, sukses = None
+    (papan dibiarkan setengah terisi, pemanggil yang mengembalikannya).
+    '''
+
+    start = time.perf_counter_ns()  # Mulai stopwatch
+    solver = SolverDLX(papan)
+    renderer = RendererANSI(papan, papan_awal, deskripsi_mode, fps=1 / delay) if delay > 0 else None
+
+    def animasi_langkah(baris, kolom, angka):
+        if trace is not None:
+            trace.catat('isi' if angka else 'hapus', baris, kolom, angka)
+        if renderer is None or not renderer.perlu_gambar():
+            return  # Frame dibuang, solver jalan terus
+        if angka:
+            renderer.gambar((baris, kolom), f"Langkah {solver.langkah}: Coba {angka} di ({baris}, {kolom})")
+        else:
+            renderer.gambar((baris, kolom), f"Langkah {solver.langkah}: Backtrack dari ({baris}, {kolom})")
+
+    sukses = solver.cari(batas=1, callback=animasi_langkah if delay > 0 or trace is not None else None,
+                         batas_langkah=batas_node, tenggat=tenggat) == 1
+    durasi_ns = time.perf_counter_ns() - start  # Hitung durasi solve
+    if solver.terpotong:
+        sukses = None  # Budget habis sebelum pencarian selesai
+
+    if sukses:
+        tampilkan_hasil_akhir(papan, papan_awal, deskripsi_mode)  # Tampilkan hasil akhir
+
+    if statistik is not None:
+        statistik.update(backtrack=solver.backtrack, kedalaman_maks=solver.kedalaman_maks,
+                         cek_validitas=solver.cek_validitas, solve_ns=durasi_ns)
+    return sukses, solver.langkah, durasi_ns / 1e9
+
+
+def hitung_solusi_dlx(papan, batas=2, jobs=1):
+    '''
+    Pengganti hitung_solusi berbasis Dancing Links.
+    Menghitung solusi sampai 'batas' (default 2, cukup untuk tahu unik atau tidak),
+    tanpa mengubah papan asli dan tanpa deepcopy.
+    jobs > 1: subtree pencarian disebar ke beberapa proses (cari_split), hasilnya sama.
+    '''
+    if jobs > 1:
+        return cari_split(papan, '4', jobs=jobs, batas=batas)[0]
+    return SolverDLX(papan).cari(batas=batas, tulis=False)
+
+
+# Pencarian split: pohon keputusan satu puzzle dipecah jadi subtree yang dikerjakan paralel
+FAKTOR_CABANG_SPLIT = 8  # Target jumlah subtree = jobs x faktor ini (subtree tidak sama berat)
+BATAS_KEDALAMAN_SPLIT = 12  # Kedalaman ekspansi maksimum di proses utama
+LANGKAH_PER_CEK_SPLIT = 1024  # Worker mode 1-3 cek pembatalan tiap sekian langkah
+STATUS_SPLIT = {}  # Diisi siapkan_worker_split di tiap worker: nilai bersama antar proses
+
+
+def pecah_cabang(papan, mode, propagasi, batas, target):
+    '''
+    Kembangkan level teratas pohon keputusan dengan engine yang sama seperti solve sekuensial
+    (urutan sel, angka, dan propagasi identik), kedalaman dinaikkan sampai frontier >= target.
+    Return (cabang, langkah): cabang = list (awalan, solusi) urut DFS, solusi None = subtree
+    yang belum dijelajah, selain itu solusi yang sudah ketemu di level dangkal.
+    '''
+    langkah = 0
+    for kedalaman in range(1, BATAS_KEDALAMAN_SPLIT + 1):
+        if mode == '4':
+            engine = SolverDLX(papan)
+            engine.cari(batas=batas, tulis=False, batas_kedalaman=kedalaman)
+        else:
+            engine = PencarianIteratif(salin_papan(papan), mode, propagasi, batas_solusi=batas,
+                                       batas_kedalaman=kedalaman)
+            engine.jalankan()
+        langkah += engine.langkah
+        frontier = sum(1 for _, solusi in engine.cabang if solusi is None)
+        if frontier >= target or frontier == 0 or engine.jumlah_solusi >= batas:
+            break
+    return engine.cabang, langkah
+
+
+def siapkan_worker_split(terbaik, total):
+    '''
+    Initializer worker pencarian split. terbaik = indeks subtree terkecil yang sudah menemukan solusi
+    (subtree sesudahnya tidak perlu diteruskan), total = jumlah solusi yang sudah ditemukan semua worker.
+    '''
+    geometri(9)
+    STATUS_SPLIT.update(terbaik=terbaik, total=total)
+
+
+def selesaikan_cabang(indeks, teks, mode, propagasi, awalan, batas):
+    '''
+    Dijalankan di worker: jelajahi satu subtree (papan root + awalan tebakan) sampai 'batas' solusi,
+    berhenti lebih awal kalau hasilnya sudah tidak dibutuhkan.
+    Return (indeks, jumlah_solusi, solusi_string, langkah).
+    '''
+    terbaik, total = STATUS_SPLIT['terbaik'], STATUS_SPLIT['total']
+    dilaporkan = 0
+
+    def berhenti(jumlah_solusi):
+        nonlocal dilaporkan
+        if jumlah_solusi > dilaporkan:
+            # Umumkan solusi baru ke worker lain
+            with total.get_lock():
+                total.value += jumlah_solusi - dilaporkan
+            dilaporkan = jumlah_solusi
+            if batas == 1:
+                with terbaik.get_lock():
+                    terbaik.value = min(terbaik.value, indeks)
+        # Solve: subtree sesudah subtree yang sudah punya solusi tidak bisa menang urutan DFS.
+        # Hitung: cukup berhenti kalau total sudah mencapai batas.
+        return indeks > terbaik.value if batas == 1 else total.value >= batas
+
+    papan = string_ke_papan(teks)
+    if mode == '4':
+        engine = SolverDLX(papan)
+        engine.cari(batas=batas, tulis=False, awalan=awalan, berhenti=lambda: berhenti(engine.jumlah_solusi))
+    else:
+        engine = PencarianIteratif(papan, mode, propagasi, batas_solusi=batas, awalan=awalan)
+        while not engine.jalankan(batas_node=LANGKAH_PER_CEK_SPLIT):
+            if berhenti(engine.jumlah_solusi):
+                break
+    berhenti(engine.jumlah_solusi)
+    solusi = papan_ke_string(engine.solusi_pertama) if engine.solusi_pertama else ""
+    return indeks, engine.jumlah_solusi, solusi, engine.langkah
+
+
+def cari_split(papan, mode='4', propagasi=False, jobs=None, batas=1):
+    '''
+    Pencarian paralel untuk SATU puzzle: level teratas pohon keputusan dikembangkan (pecah_cabang)
+    jadi subtree-subtree independen, lalu disebar ke ProcessPoolExecutor (antrean bersama: worker
+    yang selesai langsung mengambil subtree berikutnya). Setiap worker membangun ulang engine dari
+    papan root dan memaksakan awalan tebakan, jadi state-nya sama persis dengan solve sekuensial.
+
+    - batas=1 (solve): hasil = solusi dari subtree pertama (urutan DFS) yang punya solusi, sama persis
+      dengan solusi pertama versi sekuensial. Subtree sesudahnya dibatalkan begitu ada yang menemukan solusi.
+    - batas=2 (hitung, seperti hitung_solusi): semua worker berhenti begitu total solusi mencapai batas.
+      Jumlahnya selalu sama dengan versi sekuensial; solusi yang dikembalikan sama kalau puzzle unik.
+
+    Papan asli tidak diubah. Return (jumlah_solusi, solusi_papan atau None, langkah_total).
+    '''
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    jobs = jobs or os.cpu_count() or 1
+    papan = salin_papan(papan)
+    if mode == '4' and propagasi:
+        # Sama seperti pecahkan_sudoku_anim: propagasi hanya di root, sisanya DLX
+        if not PropagasiKendala(PapanBitmask(papan)).jalankan():
+            return 0, None, 0
+        propagasi = False
+
+    cabang, langkah = pecah_cabang(papan, mode, propagasi, batas, jobs * FAKTOR_CABANG_SPLIT)
+    hasil = {i: (1, papan_ke_string(solusi)) for i, (_, solusi) in enumerate(cabang) if solusi is not None}
+    # Solve: subtree sesudah solusi dangkal pertama tidak perlu dikerjakan
+    akhir = min(hasil) if batas == 1 and hasil else len(cabang)
+    terbaik = multiprocessing.Value('l', akhir)
+    total = multiprocessing.Value('l', len(hasil))
+
+    teks = papan_ke_string(papan)
+    tugas = [i for i in range(akhir) if cabang[i][1] is None]
+    if tugas and not (batas > 1 and len(hasil) >= batas):
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tugas)), initializer=siapkan_worker_split,
+                                 initargs=(terbaik, total)) as pool:
+            futures = [pool.submit(selesaikan_cabang, i, teks, mode, propagasi, cabang[i][0], batas) for i in tugas]
+            berikut = 0  # Subtree terkecil yang hasilnya belum diketahui (solve)
+            try:
+                for future in as_completed(futures):
+                    indeks, jumlah, solusi, langkah_cabang = future.result()
+                    langkah += langkah_cabang
+                    hasil[indeks] = (jumlah, solusi)
+                    if batas == 1:
+                        while berikut in hasil and not hasil[berikut][0]:
+                            berikut += 1
+                        if berikut in hasil or berikut >= akhir:
+                            break  # Subtree pertama yang punya solusi sudah pasti (atau semua habis)
+                    elif sum(j for j, _ in hasil.values()) >= batas:
+                        break
+            finally:
+                # Batalkan subtree yang belum mulai; yang sedang jalan berhenti di cek berikutnya
+                terbaik.value = -1
+                total.value = batas
+                for future in futures:
+                    future.cancel()
+
+    jumlah = min(sum(j for j, _ in hasil.values()), batas)
+    for i in sorted(hasil):
+        if hasil[i][0]:
+            return jumlah, string_ke_papan(hasil[i][1]), langkah
+    return 0, None, langkah
+
+
+def pecahkan_sudoku_split(papan, mode='4', propagasi=False, jobs=None, statistik=None):
+    '''
+    Versi headless pecahkan_sudoku_anim yang memakai cari_split: papan diisi solusi (sama persis dengan
+    solusi mode sekuensial yang sama). Return (sukses, langkah, durasi); langkah = total tebakan semua
+    worker (termasuk ekspansi awal dan subtree yang dibatalkan), jadi tidak sama dengan versi sekuensial.
+    '''
+    start = time.perf_counter_ns()
+    jumlah, solusi, langkah = cari_split(papan, mode, propagasi, jobs)
+    durasi_ns = time.perf_counter_ns() - start
+    if solusi is not None:
+        for baris, baris_solusi in zip(papan, solusi):
+            baris[:] = baris_solusi
+    if statistik is not None:
+        statistik.update(solve_ns=durasi_ns, status=STATUS_SOLVE[jumlah > 0])
+    return jumlah > 0, langkah, durasi_ns / 1e9
+
+
+# Memo hasil cek_keunikan: string puzzle -> (jumlah_solusi, solusi_pertama_string)
+CACHE_KEUNIKAN = {}
+BATAS_CACHE_KEUNIKAN = 4096  # Entri paling lama dibuang kalau cache sudah penuh
+KUNCI_CACHE_KEUNIKAN = threading.Lock()  # Penulisan memo dari thread utama dan producer AntreanPuzzle
+
+
+def cek_keunikan(papan, jobs=1):
+    '''
+    Layanan cek keunikan puzzle: hitung solusi sampai 2 dengan Dancing Links (deterministik,
+    tanpa deepcopy, papan asli tidak diubah) dan sekalian kembalikan solusi pertamanya.
+
+    Return tuple (jumlah_solusi, solusi) dengan jumlah_solusi 0, 1, atau 2 (2 = lebih dari satu)
+    dan solusi berupa string papan_ke_string (kosong jika tidak ada solusi).
+    Hasil di-memo per puzzle, jadi cek kedua untuk puzzle yang sama (misal di main()) gratis.
+    jobs > 1: hitungan disebar ke beberapa proses dengan cari_split (jumlahnya sama persis).
+    papan boleh list-of-list atau PapanDatar.
+    '''
+    papan = sebagai_list(papan)
+    kunci = papan_ke_string(papan)
+    hasil = CACHE_KEUNIKAN.get(kunci)
+    if hasil is not None:
+        return hasil
+
+    # Lapis kedua (opsional): cache kanonik, kena juga untuk puzzle yang setara (dipermutasi / relabel)
+    if CACHE_SOLUSI is not None:
+        kanonik, transformasi = kanonisasi(papan)
+        data = CACHE_SOLUSI.ambil(kanonik)
+        if data is not None and data[0] is not None:
+            jumlah, solusi = data
+            if solusi:
+                solusi = papan_ke_string(balik_transformasi(string_ke_papan(solusi), transformasi))
+            hasil = (jumlah, solusi)
+            ingat_keunikan(kunci, hasil)
+            return hasil
+
+    if jobs > 1:
+        jumlah, solusi, _ = cari_split(papan, '4', jobs=jobs, batas=2)
+    else:
+        solver = SolverDLX(papan)
+        jumlah = solver.cari(batas=2, tulis=False)
+        solusi = solver.solusi_pertama
+    hasil = (jumlah, papan_ke_string(solusi) if solusi else "")
+    ingat_keunikan(kunci, hasil)
+    if CACHE_SOLUSI is not None:
+        CACHE_SOLUSI.simpan(kanonik, jumlah,
+                            papan_ke_string(terapkan_transformasi(solusi, transformasi)) if solusi else "")
+    return hasil
+
+
+def ingat_keunikan(kunci, hasil):
+    '''
+    Simpan hasil (jumlah_solusi, solusi) ke memo CACHE_KEUNIKAN, buang entri tertua kalau penuh.
+    Dipanggil juga dari thread producer AntreanPuzzle, jadi semua perubahan memo lewat KUNCI_CACHE_KEUNIKAN
+    (next(iter(...)) bisa gagal kalau dict berubah ukuran di thread lain). Pembacaan cukup dict.get.
+    '''
+    with KUNCI_CACHE_KEUNIKAN:
+        if len(CACHE_KEUNIKAN) >= BATAS_CACHE_KEUNIKAN:
+            del CACHE_KEUNIKAN[next(iter(CACHE_KEUNIKAN))]  # dict urut sesuai insert: buang yang tertua
+        CACHE_KEUNIKAN[kunci] = hasil
+
+
+# Papan dengan petunjuk kurang dari ini tidak mungkin punya solusi unik; kanonisasi geometrinya juga meledak
+# (baris kosong seri di semua 1296 urutan kolom), jadi cukup di-relabel
+BATAS_PETUNJUK_KANONIK = 17
+# Batas kandidat (urutan baris + kolom yang seri) yang dibawa antar baris output kanonisasi.
+# Puzzle normal paling banyak beberapa ribu; lewat dari ini kanonisasi menyerah ke bentuk relabel saja.
+BATAS_KANDIDAT_KANONIK = 4096
+
+# Semua urutan kolom 9x9 yang menjaga validitas: permutasi stack (3!) x permutasi kolom di tiap stack (3!^3) = 1296
+PERMUTASI_KOLOM_9 = []
+
+
+def permutasi_kolom_9():
+    '''Isi PERMUTASI_KOLOM_9 sekali (lazy), return list tuple urutan kolom.'''
+    if not PERMUTASI_KOLOM_9:
+        import itertools
+        perm3 = list(itertools.permutations(range(3)))
+        for urutan_stack in perm3:
+            for dalam in itertools.product(perm3, repeat=3):
+                PERMUTASI_KOLOM_9.append(tuple(urutan_stack[s] * 3 + dalam[s][j] for s in range(3) for j in range(3)))
+    return PERMUTASI_KOLOM_9
+
+
+def label_baris(baris, urutan_kolom, peta, label_berikut):
+    '''
+    Tulis satu baris dengan urutan kolom tertentu, angka diganti label sesuai urutan kemunculan pertama.
+    peta (angka asli -> label) tidak diubah; kalau ada angka baru, dibuat salinan.
+    Return (tuple_baris, peta, label_berikut).
+    '''
+    keluar = []
+    for kolom in urutan_kolom:
+        angka = baris[kolom]
+        if angka:
+            label = peta.get(angka)
+            if label is None:
+                peta = dict(peta)
+                peta[angka] = label = label_berikut
+                label_berikut += 1
+            keluar.append(label)
+        else:
+            keluar.append(0)
+    return tuple(keluar), peta, label_berikut
+
+
+def kanonisasi(papan):
+    '''
+    Bentuk kanonik papan: minimum leksikografis (dibaca per baris, 0 paling kecil) atas semua
+    transformasi yang menjaga validitas Sudoku 9x9: transpose, urutan band + baris di dalam band,
+    urutan stack + kolom di dalam stack, dan relabel angka (label 1, 2, ... sesuai kemunculan pertama).
+    Puzzle yang setara (hasil permutasi/relabel puzzle lain) mendapat string kanonik yang sama.
+
+    Pencarian dilakukan per baris output: semua kandidat yang seri dipertahankan (eksak, bukan heuristik),
+    kandidat yang barisnya lebih besar langsung dibuang. Biaya sekitar 1-15 ms per papan 9x9,
+    jadi hanya layak dipakai di depan solve yang lebih mahal dari itu.
+    Ukuran lain (16x16, 25x25) hanya di-relabel, tanpa permutasi geometri (ruang permutasinya terlalu besar).
+    Begitu juga papan 9x9 dengan petunjuk kurang dari BATAS_PETUNJUK_KANONIK, atau yang kandidat serinya
+    melebihi BATAS_KANDIDAT_KANONIK: hasilnya tetap kunci yang sah (papan setara dengan aslinya),
+    hanya saja puzzle yang setara belum tentu mendapat kunci yang sama.
+
+    Return (string_kanonik, transformasi) dengan transformasi = (transpose, urutan_baris, urutan_kolom, peta)
+    untuk terapkan_transformasi / balik_transformasi.
+    '''
+    n = len(papan)
+    if n != 9 or sum(1 for baris in papan for angka in baris if angka) < BATAS_PETUNJUK_KANONIK:
+        return kanonisasi_relabel(papan)
+
+    grid = (papan, [list(kolom) for kolom in zip(*papan)])  # Orientasi asli dan transpose
+    # Angka dalam satu baris berbeda semua dan dilabel berurutan, jadi isi terbaik baris pertama hanya
+    # bergantung pada pola 0-nya: stack diurutkan dari petunjuk paling sedikit, 0 di depan tiap stack.
+    # Pola itu ditentukan oleh jumlah petunjuk per stack yang diurutkan; hanya baris dengan pola
+    # terkecil yang bisa menghasilkan baris pertama terkecil (belum tentu baris dengan petunjuk paling sedikit).
+    pola = [[tuple(sorted(sum(1 for angka in baris[s:s + 3] if angka) for s in (0, 3, 6))) for baris in g]
+            for g in grid]
+    pola_terkecil = min(min(p) for p in pola)
+
+    # Kandidat: (transpose, urutan_baris sejauh ini, urutan_kolom, peta, label_berikut)
+    terbaik, kandidat = None, []
+    for t in (0, 1):
+        for r in range(9):
+            if pola[t][r] != pola_terkecil:
+                continue
+            for urutan_kolom in permutasi_kolom_9():
+                isi, peta, label = label_baris(grid[t][r], urutan_kolom, {}, 1)
+                if terbaik is None or isi < terbaik:
+                    terbaik, kandidat = isi, [(t, (r,), urutan_kolom, peta, label)]
+                elif isi == terbaik:
+                    kandidat.append((t, (r,), urutan_kolom, peta, label))
+                    if len(kandidat) > BATAS_KANDIDAT_KANONIK:
+                        return kanonisasi_relabel(papan)
+
+    for i in range(1, 9):
+        terbaik, berikut = None, []
+        for t, urutan_baris, urutan_kolom, peta, label in kandidat:
+            if i % 3 == 0:
+                # Awal band baru: boleh baris mana saja dari band yang belum dipakai
+                band_terpakai = {r // 3 for r in urutan_baris}
+                pilihan = [r for r in range(9) if r // 3 not in band_terpakai]
+            else:
+                band = urutan_baris[-1] // 3
+                pilihan = [r for r in range(band * 3, band * 3 + 3) if r not in urutan_baris]
+            for r in pilihan:
+                isi, peta_baru, label_baru = label_baris(grid[t][r], urutan_kolom, peta, label)
+                if terbaik is None or isi < terbaik:
+                    terbaik, berikut = isi, [(t, urutan_baris + (r,), urutan_kolom, peta_baru, label_baru)]
+                elif isi == terbaik:
+                    berikut.append((t, urutan_baris + (r,), urutan_kolom, peta_baru, label_baru))
+                    if len(berikut) > BATAS_KANDIDAT_KANONIK:
+                        return kanonisasi_relabel(papan)
+        kandidat = berikut
+
+    # Kandidat yang tersisa semuanya menghasilkan string yang sama (automorfisme), ambil yang pertama
+    t, urutan_baris, urutan_kolom, peta, _ = kandidat[0]
+    transformasi = (bool(t), urutan_baris, urutan_kolom, lengkapi_peta(peta, 9))
+    return papan_ke_string(terapkan_transformasi(papan, transformasi)), transformasi
+
+
+def kanonisasi_relabel(papan):
+    '''Bentuk cadangan kanonisasi: hanya relabel angka (urutan kemunculan pertama), tanpa permutasi geometri.'''
+    n = len(papan)
+    identitas = tuple(range(n))
+    peta, label = {}, 1
+    for baris in papan:
+        _, peta, label = label_baris(baris, identitas, peta, label)
+    transformasi = (False, identitas, identitas, lengkapi_peta(peta, n))
+    return papan_ke_string(terapkan_transformasi(papan, transformasi)), transformasi
+
+
+def lengkapi_peta(peta, n):
+    '''
+    Lengkapi peta relabel jadi bijeksi 1..n: angka yang tidak muncul di puzzle mendapat label sisa
+    secara berurutan. Untuk puzzle, angka-angka itu saling bisa ditukar, jadi solusi tetap valid.
+    '''
+    sisa_label = iter(range(len(peta) + 1, n + 1))
+    peta = dict(peta)
+    for angka in range(1, n + 1):
+        if angka not in peta:
+            peta[angka] = next(sisa_label)
+    return peta
+
+
+def terapkan_transformasi(papan, transformasi):
+    '''Papan asli -> orientasi kanonik (sel kosong tetap 0).'''
+    transpose, urutan_baris, urutan_kolom, peta = transformasi
+    if transpose:
+        papan = [list(kolom) for kolom in zip(*papan)]
+    return [[peta[papan[r][c]] if papan[r][c] else 0 for c in urutan_kolom] for r in urutan_baris]
+
+
+def balik_transformasi(papan_kanonik, transformasi):
+    '''Kebalikan terapkan_transformasi: papan (misal solusi dari cache) di orientasi kanonik -> orientasi asli.'''
+    transpose, urutan_baris, urutan_kolom, peta = transformasi
+    balik = {label: angka for angka, label in peta.items()}
+    n = len(papan_kanonik)
+    papan = [[0] * n for _ in range(n)]
+    for i, r in enumerate(urutan_baris):
+        for j, c in enumerate(urutan_kolom):
+            label = papan_kanonik[i][j]
+            papan[r][c] = balik[label] if label else 0
+    if transpose:
+        papan = [list(kolom) for kolom in zip(*papan)]
+    return papan
+
+
+class CacheKanonik:
+    '''
+    Cache solusi per bentuk kanonik: string kanonik -> (jumlah_solusi, solusi_kanonik).
+    jumlah_solusi None berarti baru diketahui satu solusi (dari solve biasa, belum dicek keunikannya);
+    jumlah_solusi 0 berarti puzzle tidak punya solusi (solusi_kanonik "").
+    Di memori berupa LRU (OrderedDict) dengan kapasitas terbatas; kalau path diisi, entri juga
+    disimpan ke tabel SQLite supaya tetap ada antar run (dan bisa dipakai bersama oleh worker --jobs).
+    '''
+
+    def __init__(self, kapasitas=4096, path=None):
+        from collections import OrderedDict
+
+        self.lru = OrderedDict()
+        self.kapasitas = kapasitas
+        self.db = None
+        if path:
+            import sqlite3  # Hanya dibutuhkan kalau cache disimpan ke disk
+            self.db = sqlite3.connect(path, timeout=30)
+            # WAL + synchronous NORMAL: commit murah dan banyak proses worker bisa menulis bergantian.
+            # Isinya hanya cache, jadi kehilangan commit terakhir saat crash tidak masalah.
+            self.db.execute("PRAGMA journal_mode = WAL")
+            self.db.execute("PRAGMA synchronous = NORMAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS solusi_kanonik ("
+                " kanonik TEXT PRIMARY KEY, jumlah_solusi INTEGER, solusi TEXT NOT NULL)"
+            )
+            self.db.commit()
+
+    def ingat(self, kunci, data):
+        '''Masukkan entri ke LRU, buang entri yang paling lama tidak dipakai kalau penuh.'''
+        self.lru[kunci] = data
+        self.lru.move_to_end(kunci)
+        if len(self.lru) > self.kapasitas:
+            self.lru.popitem(last=False)
+
+    def ambil(self, kanonik):
+        '''Return (jumlah_solusi, solusi_kanonik) atau None kalau belum ada.'''
+        data = self.lru.get(kanonik)
+        if data is not None:
+            self.lru.move_to_end(kanonik)
+        elif self.db is not None:
+            data = self.db.execute(
+                "SELECT jumlah_solusi, solusi FROM solusi_kanonik WHERE kanonik = ?", (kanonik,)
+            ).fetchone()
+            if data is not None:
+                self.ingat(kanonik, data)
+        return data
+
+    def simpan(self, kanonik, jumlah_solusi, solusi):
+        '''Simpan satu entri; jumlah_solusi None tidak menimpa jumlah yang sudah diketahui.'''
+        lama = self.lru.get(kanonik)
+        if jumlah_solusi is None and lama is not None:
+            jumlah_solusi = lama[0]
+        self.ingat(kanonik, (jumlah_solusi, solusi))
+        if self.db is not None:
+            self.db.execute(
+                "INSERT INTO solusi_kanonik VALUES (?, ?, ?) ON CONFLICT(kanonik) DO UPDATE SET"
+                " jumlah_solusi = COALESCE(excluded.jumlah_solusi, jumlah_solusi), solusi = excluded.solusi",
+                (kanonik, jumlah_solusi, solusi)
+            )
+            self.db.commit()
+
+    def tutup(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+# Cache kanonik aktif (None = nonaktif); diisi pakai_cache_kanonik, dipakai cek_keunikan dan selesaikan_satu
+CACHE_SOLUSI = None
+
+
+def pakai_cache_kanonik(path=None, kapasitas=4096):
+    '''Aktifkan cache kanonik global (path None = hanya di memori).'''
+    global CACHE_SOLUSI
+    CACHE_SOLUSI = CacheKanonik(kapasitas, path)
+    return CACHE_SOLUSI
+
+
+# Batas langkah DLX untuk satu cek keunikan saat generate; lewat dari ini sel tetap dipertahankan sebagai petunjuk
+BATAS_LANGKAH_GENERATOR = 2000
+
+
+def buat_grid_penuh(ukuran, rng):
+    '''
+    Buat grid Sudoku penuh secara acak (n x n).
+    Kotak-kotak di diagonal tidak saling berbagi baris/kolom, jadi bisa langsung diisi permutasi acak;
+    sisanya dilengkapi DLX. Hasilnya ditentukan sepenuhnya oleh rng (seed).
+    '''
+    k = geometri(ukuran).k
+    papan = [[0] * ukuran for _ in range(ukuran)]
+    for kotak in range(k):
+        for i, angka in enumerate(rng.sample(range(1, ukuran + 1), ukuran)):
+            papan[kotak * k + i // k][kotak * k + i % k] = angka
+
+    solver = SolverDLX(papan)
+    solver.cari(batas=1, tulis=False)
+    return solver.solusi_pertama
+
+
+def buat_puzzle_native(ukuran, jumlah_petunjuk, seed, tunggu=None):
+    '''
+    Generator puzzle native yang menjaga keunikan di setiap langkah:
+    1. Buat grid penuh acak (buat_grid_penuh).
+    2. Kosongkan sel satu per satu dengan urutan acak. Sel hanya boleh dikosongkan kalau puzzle
+       tetap unik: untuk setiap kandidat lain (selain angka solusi) di sel itu, DLX dicek apakah
+       masih ada solusi. Kalau ada, sel dikembalikan dan tetap jadi petunjuk.
+    3. Berhenti begitu jumlah petunjuk mencapai target (atau semua sel sudah dicoba).
+
+    Karena setiap penghapusan sudah terbukti aman, tidak ada puzzle yang dibuang seperti pola
+    generate-lalu-tolak sebelumnya. Return (papan_puzzle, papan_solusi).
+
+    tunggu: callable opsional yang dipanggil sebelum setiap sel dicoba dikosongkan (boleh memblok),
+    misal boleh_jalan.wait milik AntreanPuzzle supaya jeda() berlaku di tengah generate satu puzzle.
+    Hasilnya tidak berubah: seed yang sama tetap menghasilkan puzzle yang sama.
+    '''
+    import random  # Generator saja yang butuh random
+
+    rng = random.Random(seed)
+    n = ukuran
+    solusi = buat_grid_penuh(n, rng)
+    papan = [list(baris) for baris in solusi]
+    status = PapanBitmask(papan)  # Mask kandidat diperbarui inkremental tiap sel dikosongkan
+    sisa_petunjuk = n * n
+
+    for idx in rng.sample(range(n * n), n * n):
+        if sisa_petunjuk <= jumlah_petunjuk:
+            break
+        if tunggu is not None:
+            tunggu()
+        baris, kolom = divmod(idx, n)
+        angka = papan[baris][kolom]
+        status.hapus(baris, kolom)
+
+        unik = True
+        for alternatif in angka_dari_mask(status.kandidat(baris, kolom) & ~(1 << angka)):
+            papan[baris][kolom] = alternatif
+            solver = SolverDLX(papan)
+            if solver.cari(batas=1, tulis=False, batas_langkah=BATAS_LANGKAH_GENERATOR) or solver.terpotong:
+                unik = False  # Ada solusi lain (atau belum terbukti tidak ada): sel tetap diisi
+                break
+        papan[baris][kolom] = 0
+
+        if unik:
+            sisa_petunjuk -= 1
+        else:
+            status.isi(baris, kolom, angka)
+
+    return papan, solusi
+
+
+# File SQLite default untuk PenyimpananPuzzle (dibuat di folder kerja, sama seperti log_sudoku.csv)
+FILE_STORE_PUZZLE = "puzzle_store.sqlite"
+VERSI_STORE = 2  # 2 = generator native (buat_puzzle_native)
+
+
+class PenyimpananPuzzle:
+    '''
+    Penyimpanan puzzle persisten berbasis SQLite dengan key (tingkat, seed, ukuran).
+    Setiap entri menyimpan puzzle (string papan_ke_string), solusi yang sudah diverifikasi,
+    dan jumlah_solusi (1 = unik; selain itu seed ditolak), jadi seed yang sama tidak perlu di-generate ulang.
+    Versi skema disimpan di PRAGMA user_version; kalau generator berubah (seed yang sama menghasilkan
+    puzzle lain), VERSI_STORE dinaikkan dan isi store lama dibuang.
+
+    Di depan database ada cache LRU di memori (OrderedDict, kapasitas terbatas) supaya
+    seed yang sering dipakai tidak perlu query ke disk.
+    '''
+
+    def __init__(self, path=FILE_STORE_PUZZLE, kapasitas=256):
+        import sqlite3  # Hanya dibutuhkan kalau store dipakai
+        from collections import OrderedDict
+
+        # Producer AntreanPuzzle dan thread utama membuka koneksi sendiri ke file yang sama:
+        # WAL supaya pembaca tidak terblok penulis, timeout supaya penulis bergantian menunggu lock
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != VERSI_STORE:
+            self.db.execute("DROP TABLE IF EXISTS puzzle")  # Isi store hanya cache, aman dibuang
+            self.db.execute(f"PRAGMA user_version = {VERSI_STORE}")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS puzzle ("
+            " tingkat REAL NOT NULL, seed INTEGER NOT NULL, ukuran INTEGER NOT NULL,"
+            " puzzle TEXT NOT NULL, solusi TEXT NOT NULL, jumlah_solusi INTEGER NOT NULL,"
+            " PRIMARY KEY (tingkat, seed, ukuran))"
+        )
+        self.db.commit()
+        self.lru = OrderedDict()  # (tingkat, seed, ukuran) -> (puzzle, solusi, jumlah_solusi)
+        self.kapasitas = kapasitas
+
+    def ingat(self, kunci, data):
+        '''Masukkan entri ke LRU, buang entri yang paling lama tidak dipakai kalau penuh.'''
+        self.lru[kunci] = data
+        self.lru.move_to_end(kunci)
+        if len(self.lru) > self.kapasitas:
+            self.lru.popitem(last=False)
+
+    def ambil(self, tingkat, seed, ukuran=9):
+        '''Return (puzzle, solusi, jumlah_solusi) atau None kalau seed belum pernah disimpan.'''
+        kunci = (tingkat, seed, ukuran)
+        data = self.lru.get(kunci)
+        if data is not None:
+            self.lru.move_to_end(kunci)
+            return data
+
+        data = self.db.execute(
+            "SELECT puzzle, solusi, jumlah_solusi FROM puzzle WHERE tingkat = ? AND seed = ? AND ukuran = ?",
+            kunci
+        ).fetchone()
+        if data is not None:
+            self.ingat(kunci, data)
+        return data
+
+    def simpan(self, tingkat, seed, ukuran, puzzle, solusi, jumlah_solusi, commit=True):
+        '''Simpan (atau timpa) satu entri. commit=False dipakai saat isi massal (prewarm).'''
+        data = (puzzle, solusi, jumlah_solusi)
+        self.db.execute("INSERT OR REPLACE INTO puzzle VALUES (?, ?, ?, ?, ?, ?)", (tingkat, seed, ukuran, *data))
+        if commit:
+            self.db.commit()
+        self.ingat((tingkat, seed, ukuran), data)
+
+    def tutup(self):
+        self.db.commit()
+        self.db.close()
+
+
+def buat_puzzle_seed(tingkat, seed, ukuran=9, store=None, tunggu=None):
+    '''
+    Generate puzzle untuk satu seed tertentu dengan buat_puzzle_native.
+    tingkat adalah rasio sel kosong, jadi target petunjuk = n*n*(1 - tingkat).
+    Return tuple (papan, jumlah_solusi, solusi) dengan arti jumlah_solusi sama seperti
+    di PenyimpananPuzzle (hanya 1 yang berarti puzzle valid).
+
+    Jika store diberikan, hasil diambil dari store kalau seed sudah pernah diproses
+    (generate dilewati sepenuhnya), dan hasil baru langsung disimpan.
+    tunggu diteruskan ke buat_puzzle_native.
+    '''
+    if store is not None:
+        data = store.ambil(tingkat, seed, ukuran)
+        if data is not None:
+            puzzle, solusi, jumlah = data
+            if jumlah < 0 or not puzzle:
+                return None, jumlah, solusi
+            ingat_keunikan(puzzle, (jumlah, solusi))  # Supaya hitung_solusi di main() tidak menghitung ulang
+            return string_ke_papan(puzzle), jumlah, solusi
+
+    jumlah_petunjuk = round(ukuran * ukuran * (1 - tingkat))
+    contoh_papan, papan_solusi = buat_puzzle_native(ukuran, jumlah_petunjuk, seed, tunggu)
+
+    # Keunikan sudah dijamin oleh generator, jadi hasilnya langsung dicatat di memo cek_keunikan
+    puzzle, solusi, jumlah = papan_ke_string(contoh_papan), papan_ke_string(papan_solusi), 1
+    ingat_keunikan(puzzle, (jumlah, solusi))
+
+    if store is not None:
+        store.simpan(tingkat, seed, ukuran, puzzle, solusi, jumlah)
+    return contoh_papan, jumlah, solusi
+
+
+def generate_valid_puzzle(tingkat, seed_input=None, max_attempts=100, ukuran=9, store=None):
+    '''
+    Fungsi ini bertugas untuk menghasilkan puzzle Sudoku yang valid dan hanya memiliki satu solusi.
+    
+    Puzzle dibuat oleh generator native (buat_puzzle_native) berdasarkan seed: sel dikosongkan
+    satu per satu dan hanya jika puzzle tetap punya tepat 1 solusi, jadi setiap seed menghasilkan
+    puzzle valid (percobaan ulang hanya terjadi kalau ada error).
+
+    Parameter ukuran menentukan sisi papan (9, 16, atau 25).
+    Jika store (PenyimpananPuzzle) diberikan, seed yang sudah pernah diproses diambil dari store.
+
+    jika gagal nemu puzzle valid setelah sejumlah percobaan, fungsi akan mengembalikan None.
+    '''
+
+    import random
+
+    for _ in range(max_attempts):  # Batas maksimal percobaan
+        try:
+            seed = seed_input if seed_input is not None else random.randint(0, 99999)  # Tentukan seed random
+
+            contoh_papan, jumlah_solusi, _ = buat_puzzle_seed(tingkat, seed, ukuran, store)
+            if jumlah_solusi == 1:
+                return contoh_papan, seed  # Puzzle valid dikembalikan
+
+        except Exception as e:
+            print(f"Error saat generate puzzle: {str(e)}")
+
+        if seed_input is not None:
+            break  # jika seed input manual, kita gak mau ulang-ulang (hanya 1 percobaan)
+
+    print(f"❌ Gagal menemukan puzzle valid setelah {max_attempts} percobaan")
+    return None, None  # Gagal menghasilkan puzzle valid
+
+
+class AntreanPuzzle:
+    '''
+    Producer puzzle di background thread: menjaga antrean puzzle valid per (tingkat, ukuran)
+    tetap terisi (maksimal 'kapasitas' puzzle), jadi ronde berikutnya tidak perlu menunggu generate.
+
+    - minta(tingkat, ukuran): daftarkan level yang perlu dijaga terisi.
+    - ambil(tingkat, ukuran): ambil (papan, seed) tanpa menunggu, atau None kalau antrean kosong
+      (pemanggil lalu generate secara sinkron seperti biasa).
+    - jeda() / lanjut(): hentikan sementara producer, misal saat solver sedang diukur waktunya.
+      Jeda berlaku juga di tengah generate satu puzzle (dicek tiap sel yang dicoba dikosongkan).
+
+    Antrean hanya dipakai menu interaktif main(), yang seed-nya acak. Perintah lain tidak mengambil
+    dari sini: solve/serve membaca puzzle dari input, sedangkan bench dan prewarm butuh seed tertentu
+    (hasilnya harus bisa direproduksi), jadi puzzle acak dari antrean tidak bisa dipakai.
+
+    Thread dipakai (bukan proses) karena producer kebanyakan jalan saat thread utama menunggu input
+    user atau tidur di animasi, jadi GIL praktis tidak berebut. Producer membuka koneksi store
+    sendiri (koneksi SQLite tidak boleh dipakai lintas thread).
+    '''
+
+    def __init__(self, kapasitas=3, store_path=None):
+        self.kapasitas = kapasitas
+        self.store_path = store_path
+
+        self.antrean = {}  # (tingkat, ukuran) -> queue.Queue berisi (papan, seed)
+        self.perlu_isi = threading.Event()  # Di-set saat ada antrean yang belum penuh
+        self.boleh_jalan = threading.Event()  # Di-clear oleh jeda()
+        self.boleh_jalan.set()
+        self.berhenti = False
+        self.thread = threading.Thread(target=self.produksi, name="produsen-puzzle", daemon=True)
+        self.thread.start()
+
+    def minta(self, tingkat, ukuran=9):
+        kunci = (tingkat, ukuran)
+        if kunci not in self.antrean:
+            import queue
+            self.antrean[kunci] = queue.Queue(self.kapasitas)
+        self.perlu_isi.set()
+
+    def ambil(self, tingkat, ukuran=9):
+        import queue
+
+        self.minta(tingkat, ukuran)
+        try:
+            hasil = self.antrean[(tingkat, ukuran)].get_nowait()
+        except queue.Empty:
+            return None
+        self.perlu_isi.set()  # Ada slot kosong, bangunkan producer
+        return hasil
+
+    def jeda(self):
+        self.boleh_jalan.clear()
+
+    def lanjut(self):
+        self.boleh_jalan.set()
+
+    def hentikan(self):
+        self.berhenti = True
+        self.boleh_jalan.set()
+        self.perlu_isi.set()
+
+    def produksi(self):
+        '''Loop thread producer: isi antrean yang belum penuh secara bergiliran, lalu tidur sampai dibangunkan.'''
+        store = None
+        if self.store_path:
+            try:
+                store = PenyimpananPuzzle(self.store_path)
+            except Exception:
+                store = None  # Tanpa store pun producer tetap jalan
+        import queue
+        import random
+        rng = random.Random()  # Generator acak sendiri, tidak mengganggu random global thread utama
+
+        while not self.berhenti:
+            self.perlu_isi.wait()
+            self.perlu_isi.clear()
+            while not self.berhenti:
+                kurang = [(kunci, q) for kunci, q in list(self.antrean.items()) if not q.full()]
+                if not kurang:
+                    break  # Semua antrean penuh, tidur lagi
+                for (tingkat, ukuran), q in kurang:
+                    self.boleh_jalan.wait()
+                    seed = rng.randint(0, 99999)
+                    try:
+                        contoh_papan, jumlah_solusi, _ = buat_puzzle_seed(tingkat, seed, ukuran, store,
+                                                                         tunggu=self.boleh_jalan.wait)
+                    except Exception:
+                        continue
+                    if jumlah_solusi == 1:
+                        try:
+                            q.put_nowait((contoh_papan, seed))
+                        except queue.Full:
+                            pass
+
+        if store is not None:
+            store.tutup()
+
+
+# Escape code ANSI untuk kontrol layar tanpa memanggil shell (clear/cls)
+ANSI_BERSIH_LAYAR = "\x1b[2J\x1b[H"  # Hapus layar + kursor ke pojok kiri atas
+ANSI_HAPUS_BARIS = "\x1b[2K"  # Hapus isi baris tempat kursor berada
+
+
+def format_sel(papan, i, j, pos_terakhir, papan_awal, lebar, warna):
+    '''Teks satu sel papan (rata kanan selebar 'lebar'), lengkap dengan warnanya jika warna=True.'''
+    angka = papan[i][j]
+    teks = (str(angka) if angka != 0 else '.').rjust(lebar)
+    if not warna:
+        return teks  # Tanpa warna: angka biasa atau titik untuk kosong
+
+    from colorama import Fore, Style  # Hanya dibutuhkan kalau terminal mendukung warna
+
+    # Tentukan warna berdasarkan kondisi posisi dan sumber angka
+    if pos_terakhir and (i, j) == pos_terakhir:
+        color = Fore.RED  # Posisi terakhir yang dicoba solver
+    elif papan_awal and papan_awal[i][j] == 0 and angka != 0:
+        color = Fore.GREEN  # Angka hasil solver (bukan angka awal)
+    else:
+        color = Fore.WHITE  # Angka asli dari puzzle
+    return color + teks + Style.RESET_ALL
+
+
+def format_papan(papan, pos_terakhir=None, papan_awal=None):
+    '''
+    Susun seluruh papan jadi satu string (baris dipisah newline), supaya bisa ditulis
+    ke terminal dengan satu kali write, bukan satu print per sel.
+    '''
+    warna = apakah_support_warna()  # Cukup dicek sekali per papan
+    if warna:
+        from colorama import Fore, Style
+    k = math.isqrt(len(papan))  # Sisi kotak
+    lebar = len(str(len(papan)))  # Lebar kolom angka (1 untuk 9x9, 2 untuk 16x16 ke atas)
+    panjang_garis = len(papan) * (lebar + 1) + (k - 1) * 2 - 1  # 21 untuk papan 9x9
+    garis = Fore.WHITE + "-" * panjang_garis + Style.RESET_ALL if warna else "-" * panjang_garis
+    pemisah = Fore.WHITE + "|" + Style.RESET_ALL + " " if warna else "| "
+
+    hasil = []
+    for i in range(len(papan)):  # Loop baris
+        # Setiap k baris, tampilkan garis horizontal pembatas antar kotak
+        if i % k == 0 and i != 0:
+            hasil.append(garis + "\n")
+        for j in range(len(papan)):  # Loop kolom
+            # Setiap k kolom, tampilkan garis vertikal pembatas antar kotak
+            if j % k == 0 and j != 0:
+                hasil.append(pemisah)
+            hasil.append(format_sel(papan, i, j, pos_terakhir, papan_awal, lebar, warna) + " ")
+        hasil.append("\n")  # Ganti baris setelah satu baris selesai
+    return "".join(hasil)
+
+
+def tampilkan_papan(papan, pos_terakhir=None, papan_awal=None):
+    '''
+    Fungsi ini bertugas untuk menampilkan papan Sudoku ke terminal dengan format rapi.
+    Jika terminal mendukung warna, akan ditampilkan dengan:
+    - Warna merah untuk posisi sel yang terakhir diisi
+    - Warna hijau untuk angka hasil isian solver
+    - Warna putih untuk angka asli dari puzzle awal
+
+    Fungsi ini juga menambahkan garis pemisah antar kotak (3x3, 4x4, ...) agar lebih mudah dibaca.
+    Untuk papan 16x16 / 25x25, setiap angka dicetak rata kanan selebar 2 karakter.
+    Seluruh papan disusun dulu oleh format_papan lalu ditulis sekaligus.
+    '''
+    sys.stdout.write(format_papan(papan, pos_terakhir, papan_awal))
+    sys.stdout.flush()
+
+
+def header_mode(deskripsi_mode):
+    '''Teks deskripsi mode + garis pemisah yang tampil di atas papan saat animasi.'''
+    if not apakah_support_warna():
+        return deskripsi_mode + "\n" + "-" * 30 + "\n\n"
+    from colorama import Fore, Style
+    garis = Fore.WHITE + "-" * 30 + Style.RESET_ALL
+    return deskripsi_mode + "\n" + garis + "\n\n"
+
+    
+def tampilkan_hasil_akhir(papan, papan_awal=None, deskripsi_mode=None):
+    '''
+    Fungsi ini menampilkan papan hasil akhir setelah solver selesai (layar dibersihkan dulu).
+    Jika deskripsi_mode None, berarti solver dipanggil secara headless (misal dari mode batch),
+    jadi tidak ada clear screen, cek warna, maupun print sama sekali.
+    '''
+
+    if deskripsi_mode is None:
+        return  # Mode headless: jangan sentuh terminal
+
+    # Bersihkan layar pakai escape ANSI lalu tulis header + papan dalam satu write
+    sys.stdout.write(ANSI_BERSIH_LAYAR + header_mode(deskripsi_mode) + format_papan(papan, None, papan_awal))
+    sys.stdout.flush()
+
+
+def animasi_cli(papan, pos_terakhir=None, delay=0.03, papan_awal=None, deskripsi_mode=None):
+    '''
+    Fungsi ini menampilkan satu frame animasi penuh di terminal (dipakai untuk frame tunggal).
+    - Membersihkan layar (escape ANSI, tanpa memanggil shell)
+    - Menampilkan deskripsi mode solver (misal: Naive, MRV)
+    - Menampilkan papan saat ini (dengan warna jika didukung)
+    - Delay kecil antar langkah agar terlihat seperti animasi
+    Animasi solver sendiri memakai RendererANSI yang hanya menggambar ulang sel yang berubah.
+    '''
+
+    frame = ANSI_BERSIH_LAYAR + (header_mode(deskripsi_mode) if deskripsi_mode else "")
+    sys.stdout.write(frame + format_papan(papan, pos_terakhir, papan_awal))  # Satu write per frame
+    sys.stdout.flush()
+    time.sleep(delay)  # Kasih jeda animasi biar keliatan step-by-step
+
+
+class RendererANSI:
+    '''
+    Renderer animasi berbasis selisih (diff) untuk terminal.
+    - Frame pertama: layar dibersihkan sekali, header + papan lengkap digambar.
+    - Frame berikutnya: hanya sel yang berubah (plus sel sorotan lama/baru) yang ditulis ulang
+      dengan escape code posisi kursor, lalu baris status (pesan langkah) diperbarui.
+    - Setiap frame dikirim dengan satu sys.stdout.write.
+    - fps membatasi jumlah frame per detik: frame di antaranya dibuang (bukan ditunggu),
+      jadi solver tetap jalan dengan kecepatan penuh.
+    Kalau stdout bukan terminal (tidak support warna/escape), frame digambar penuh tanpa
+    escape posisi, tetap dengan batas fps yang sama.
+    '''
+
+    def __init__(self, papan, papan_awal=None, deskripsi_mode=None, fps=30):
+        self.papan = papan
+        self.papan_awal = papan_awal
+        self.deskripsi_mode = deskripsi_mode
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.warna = apakah_support_warna()
+        self.n = n = len(papan)
+        self.k = math.isqrt(n)
+        self.lebar = len(str(n))
+        self.tampil = None  # Isi papan yang terakhir digambar (None = belum ada frame)
+        self.sorot = None  # Posisi sel yang terakhir disorot merah
+        self.frame_terakhir = 0.0
+        self.jumlah_frame = 0
+        self.frame_dibuang = 0
+        header = header_mode(deskripsi_mode) if deskripsi_mode else ""
+        self.baris_awal = header.count("\n") + 1  # Baris layar (1-based) tempat papan dimulai
+        self.baris_status = self.baris_awal + n + self.k - 1  # Baris pesan langkah, tepat di bawah papan
+
+    def posisi(self, i, j):
+        '''Escape code untuk memindah kursor ke sel (i, j), memperhitungkan garis pemisah kotak.'''
+        baris = self.baris_awal + i + i // self.k
+        kolom = 1 + j * (self.lebar + 1) + (j // self.k) * 2
+        return f"\x1b[{baris};{kolom}H"
+
+    def perlu_gambar(self):
+        '''
+        True jika jatah fps sudah tersedia untuk frame baru. Dipanggil sebelum menyusun pesan
+        langkah, jadi event yang framenya dibuang hampir tidak ada biayanya.
+        '''
+        if self.tampil is not None and time.perf_counter() - self.frame_terakhir < self.interval:
+            self.frame_dibuang += 1
+            return False
+        return True
+
+    def gambar(self, pos_terakhir=None, pesan=""):
+        '''Gambar frame sekarang juga (diff terhadap frame terakhir).'''
+        self.frame_terakhir = time.perf_counter()
+        self.jumlah_frame += 1
+        papan = self.papan
+
+        if self.tampil is None or not self.warna:
+            # Frame penuh: frame pertama, atau output bukan terminal
+            frame = [ANSI_BERSIH_LAYAR if self.warna else "",
+                     header_mode(self.deskripsi_mode) if self.deskripsi_mode else "",
+                     format_papan(papan, pos_terakhir, self.papan_awal), pesan + "\n"]
+        else:
+            frame = []
+            berubah = set()
+            for i in range(self.n):
+                baris_baru, baris_lama = papan[i], self.tampil[i]
+                if baris_baru != baris_lama:
+                    berubah.update((i, j) for j in range(self.n) if baris_baru[j] != baris_lama[j])
+            if self.sorot is not None:
+                berubah.add(self.sorot)  # Sorotan lama harus dikembalikan ke warna normal
+            if pos_terakhir is not None:
+                berubah.add(pos_terakhir)
+            for i, j in berubah:
+                frame.append(self.posisi(i, j) + format_sel(papan, i, j, pos_terakhir, self.papan_awal,
+                                                            self.lebar, True))
+            frame.append(f"\x1b[{self.baris_status};1H" + ANSI_HAPUS_BARIS + pesan + "\n")
+
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
+        self.tampil = [list(baris) for baris in papan]
+        self.sorot = pos_terakhir
+        return True
+
+
+# Kode jenis event di file trace (2 bit terbawah tiap record)
+JENIS_TRACE = ('isi', 'hapus', 'propagasi')
+KODE_TRACE = {jenis: kode for kode, jenis in enumerate(JENIS_TRACE)}
+MAGIC_TRACE = b"SDKT"
+VERSI_TRACE = 1
+
+
+class RekamanTrace:
+    '''
+    Trace event solver dalam bentuk padat: satu event = satu uint32 di array,
+    dengan layout (indeks_sel << 7) | (angka << 2) | kode_jenis. Cukup untuk papan sampai 25x25
+    (indeks sel < 1024, angka < 32).
+
+    Format file: header struct '<4sBBI' (magic, versi, ukuran, jumlah_event), lalu puzzle awal
+    (string papan_ke_string, n*n byte ASCII), lalu isi array little-endian.
+    Solver cukup memanggil catat(); menggambar dan jeda animasi dilakukan terpisah saat replay.
+    '''
+
+    def __init__(self, papan):
+        self.n = len(papan)
+        self.puzzle = papan_ke_string(papan)  # Puzzle awal, titik mulai replay
+        self.data = array('I')
+
+    def catat(self, jenis, baris, kolom, angka):
+        self.data.append(((baris * self.n + kolom) << 7) | (angka << 2) | KODE_TRACE[jenis])
+
+    def event(self, mulai=0):
+        '''Generator (jenis, baris, kolom, angka) mulai dari indeks event 'mulai'.'''
+        n = self.n
+        for i in range(mulai, len(self.data)):
+            record = self.data[i]
+            baris, kolom = divmod(record >> 7, n)
+            yield JENIS_TRACE[record & 3], baris, kolom, (record >> 2) & 31
+
+    def simpan(self, path):
+        data = self.data
+        if sys.byteorder == 'big':
+            data = array('I', data)
+            data.byteswap()  # File selalu little-endian
+        with open(path, "wb") as f:
+            f.write(struct.pack('<4sBBI', MAGIC_TRACE, VERSI_TRACE, self.n, len(data)))
+            f.write(self.puzzle.encode('ascii'))
+            data.tofile(f)
+
+    @classmethod
+    def baca(cls, path):
+        with open(path, "rb") as f:
+            magic, versi, n, jumlah = struct.unpack('<4sBBI', f.read(struct.calcsize('<4sBBI')))
+            if magic != MAGIC_TRACE or versi != VERSI_TRACE:
+                raise ValueError(f"{path} bukan file trace yang dikenali")
+            trace = cls(string_ke_papan(f.read(n * n).decode('ascii')))
+            trace.data.fromfile(f, jumlah)
+        if sys.byteorder == 'big':
+            trace.data.byteswap()
+        return trace
+
+    def ringkasan(self):
+        '''Statistik trace tanpa perlu replay visual: jumlah tiap jenis event, ukuran file, dll.'''
+        jumlah = dict.fromkeys(JENIS_TRACE, 0)
+        for record in self.data:
+            jumlah[JENIS_TRACE[record & 3]] += 1
+        return {
+            'ukuran': f"{self.n}x{self.n}",
+            'sel_kosong': self.puzzle.count('0'),
+            'event': len(self.data),
+            'langkah': jumlah['isi'],
+            'backtrack': jumlah['hapus'],
+            'propagasi': jumlah['propagasi'],
+            'byte': struct.calcsize('<4sBBI') + self.n * self.n + len(self.data) * self.data.itemsize,
+        }
+
+
+def jalankan_replay(args):
+    '''
+    Putar ulang file trace: python main2.py replay trace.sdt --delay 0.05 --lewati 10 --mulai 500
+    - --mulai N   : lompat langsung ke langkah (tebakan) ke-N tanpa menggambar langkah sebelumnya
+    - --lewati K  : hanya gambar setiap K event (mempercepat replay trace panjang)
+    - --delay D   : jeda antar frame (animasi_cli)
+    - --diam      : cukup tampilkan papan di langkah --mulai, tanpa animasi
+    - --ringkasan : cetak statistik trace saja
+    '''
+    trace = RekamanTrace.baca(args.file)
+    if args.ringkasan:
+        for kunci, nilai in trace.ringkasan().items():
+            print(f"{kunci}: {nilai}")
+        return
+
+    from colorama import init
+    init(autoreset=True, strip=False)  # Inisialisasi ANSI color di terminal
+    papan = string_ke_papan(trace.puzzle)
+    papan_awal = salin_papan(papan)
+    pesan = {'isi': "Coba {angka} di", 'hapus': "Backtrack dari", 'propagasi': "Propagasi {angka} di"}
+
+    # Seek: terapkan event tanpa menggambar sampai langkah ke-N tercapai
+    langkah = indeks = 0
+    pos = None
+    for indeks, (jenis, baris, kolom, angka) in enumerate(trace.event()):
+        if langkah >= args.mulai:
+            break
+        papan[baris][kolom] = angka
+        langkah += jenis == 'isi'
+        pos = (baris, kolom)
+    else:
+        indeks = len(trace.data)
+
+    if args.diam:
+        print(f"🎬 Replay {args.file} - langkah {langkah}")
+        tampilkan_papan(papan, pos, papan_awal)
+        return
+
+    for i, (jenis, baris, kolom, angka) in enumerate(trace.event(indeks)):
+        papan[baris][kolom] = angka
+        langkah += jenis == 'isi'
+        if i % args.lewati == 0:
+            deskripsi = (f"🎬 Replay {args.file} | Langkah {langkah}: "
+                         + pesan[jenis].format(angka=angka) + f" ({baris}, {kolom})")
+            animasi_cli(papan, (baris, kolom), args.delay, papan_awal, deskripsi)
+    tampilkan_hasil_akhir(papan, papan_awal, f"🎬 Replay {args.file} selesai ({langkah} langkah)")
+
+
+# Titik instrumentasi --profile: (nama objek di modul ini, nama atribut). Objek "" = fungsi level modul.
+TITIK_PROFIL = [
+    ("", "cari_sel_kosong_biasa"),
+    ("", "cari_sel_kosong_mrv"),
+    ("", "salin_papan"),
+    ("", "pecahkan_sudoku_anim"),
+    ("", "pecahkan_sudoku_dlx"),
+    ("", "format_papan"),
+    ("", "tampilkan_hasil_akhir"),
+    ("", "animasi_cli"),
+    ("PapanBitmask", "kandidat"),
+    ("PapanBitmask", "isi"),
+    ("PapanBitmask", "hapus"),
+    ("PapanMRV", "isi"),
+    ("PapanMRV", "hapus"),
+    ("PapanMRV", "pilih_sel"),
+    ("PropagasiKendala", "jalankan"),
+    ("PropagasiKendala", "singles"),
+    ("PropagasiKendala", "locked_candidates"),
+    ("PropagasiKendala", "kembalikan"),
+    ("SolverDLX", "cari"),
+    ("RendererANSI", "gambar"),
+    ("PencarianCBJ", "konflik_sel"),
+    ("PencarianCBJ", "langgar_nogood"),
+    ("PencarianCBJ", "geser_pantauan"),
+    ("PencarianCBJ", "pelajari"),
+]
+
+
+class ProfilSolver:
+    '''
+    Profiler ringan untuk jalur panas solver (switch --profile).
+
+    Instrumentasi tidak ditulis di dalam solver: pasang() mengganti fungsi/method di TITIK_PROFIL
+    dengan pembungkus yang mencatat jumlah panggilan, waktu total, dan waktu sendiri (self time,
+    perf_counter_ns), lalu lepas() mengembalikan aslinya. Tanpa --profile tidak ada pembungkus sama sekali,
+    jadi biayanya nol.
+
+    Yang dikumpulkan:
+    - statistik per fungsi: [panggilan, total_ns, sendiri_ns]
+    - collapsed stack ("a;b;c nilai", nilai = mikrodetik self time) untuk flamegraph.pl / inferno / speedscope
+    - per kedalaman pencarian (PencarianIteratif): histogram branching factor (jumlah kandidat sel
+      yang dipilih) dan waktu yang dihabiskan generator pencarian di kedalaman itu
+
+    Hanya thread yang memanggil pasang() yang dicatat, jadi producer AntreanPuzzle tidak mengacaukan stack.
+    '''
+
+    def __init__(self):
+        self.asli = {}  # (objek, atribut) -> fungsi asli
+        self.reset()
+
+    def reset(self):
+        self.statistik = {}  # label -> [panggilan, total_ns, sendiri_ns]
+        self.terlipat = {}  # jalur stack "a;b;c" -> sendiri_ns
+        self.cabang = {}  # kedalaman -> {branching factor: jumlah node}
+        self.waktu_kedalaman = {}  # kedalaman -> ns di dalam generator pencarian
+        self.tumpukan = []  # Frame aktif: [jalur, waktu_anak_ns]
+
+    def masuk(self, label):
+        jalur = self.tumpukan[-1][0] + ";" + label if self.tumpukan else label
+        frame = [jalur, 0]
+        self.tumpukan.append(frame)
+        return frame
+
+    def keluar(self, frame, label, total):
+        self.tumpukan.pop()
+        if self.tumpukan:
+            self.tumpukan[-1][1] += total  # Waktu anak tidak dihitung sebagai self time induknya
+        sendiri = total - frame[1]
+        data = self.statistik.get(label)
+        if data is None:
+            data = self.statistik[label] = [0, 0, 0]
+        data[0] += 1
+        data[1] += total
+        data[2] += sendiri
+        self.terlipat[frame[0]] = self.terlipat.get(frame[0], 0) + sendiri
+
+    def bungkus(self, fungsi, label):
+        profil, waktu, thread_ini = self, time.perf_counter_ns, threading.get_ident()
+
+        def pembungkus(*args, **kwargs):
+            if threading.get_ident() != thread_ini:
+                return fungsi(*args, **kwargs)
+            frame = profil.masuk(label)
+            mulai = waktu()
+            try:
+                return fungsi(*args, **kwargs)
+            finally:
+                profil.keluar(frame, label, waktu() - mulai)
+        return pembungkus
+
+    def bungkus_event(self, event_asli):
+        '''
+        Pembungkus generator PencarianIteratif.event: waktu dihitung hanya selama generator berjalan
+        (bukan selama pemanggil menggambar animasi) dan dibagi per kedalaman stack keputusan.
+        '''
+        profil, waktu, label = self, time.perf_counter_ns, "PencarianIteratif.event"
+
+        def event(pencarian, *args, **kwargs):
+            generator = event_asli(pencarian, *args, **kwargs)
+            while True:
+                frame = profil.masuk(label)
+                mulai = waktu()
+                try:
+                    hasil = next(generator, None)
+                finally:
+                    total = waktu() - mulai
+                    profil.keluar(frame, label, total)
+                    profil.waktu_kedalaman[pencarian.kedalaman] = \
+                        profil.waktu_kedalaman.get(pencarian.kedalaman, 0) + total
+                if hasil is None:
+                    return
+                yield hasil
+        return event
+
+    def bungkus_pilih_sel(self, pilih_asli):
+        '''Pembungkus PencarianIteratif.pilih_sel: catat branching factor sel terpilih per kedalaman.'''
+        profil = self
+
+        def pilih_sel(pencarian):
+            baris, kolom = pilih_asli(pencarian)
+            if baris is not None:
+                sumber = pencarian.prop or pencarian.status
+                faktor = pencarian.status.geo.jumlah_bit[sumber.kandidat(baris, kolom)]
+                histogram = profil.cabang.setdefault(pencarian.kedalaman + 1, {})  # Node baru ada di kedalaman +1
+                histogram[faktor] = histogram.get(faktor, 0) + 1
+            return baris, kolom
+        return pilih_sel
+
+    def pasang(self):
+        '''Ganti semua titik instrumentasi dengan pembungkus (panggil lepas() untuk mengembalikan).'''
+        modul = sys.modules[__name__]
+        for nama_objek, atribut in TITIK_PROFIL:
+            objek = getattr(modul, nama_objek) if nama_objek else modul
+            fungsi = objek.__dict__[atribut] if nama_objek else getattr(modul, atribut)
+            self.asli[(objek, atribut)] = fungsi
+            setattr(objek, atribut, self.bungkus(fungsi, f"{nama_objek}.{atribut}" if nama_objek else atribut))
+        for atribut, pembungkus in (("event", self.bungkus_event), ("pilih_sel", self.bungkus_pilih_sel)):
+            fungsi = PencarianIteratif.__dict__[atribut]
+            self.asli[(PencarianIteratif, atribut)] = fungsi
+            setattr(PencarianIteratif, atribut, pembungkus(fungsi))
+
+    def lepas(self):
+        for (objek, atribut), fungsi in self.asli.items():
+            setattr(objek, atribut, fungsi)
+        self.asli.clear()
+
+    def simpan_terlipat(self, path):
+        '''Tulis collapsed stack (satu baris "jalur mikrodetik"), input untuk flamegraph.pl / inferno / speedscope.'''
+        with open(path, "w") as file:
+            for jalur, ns in sorted(self.terlipat.items()):
+                if ns >= 1000:
+                    file.write(f"{jalur} {ns // 1000}\n")
+
+    def laporan(self, file=None):
+        '''Cetak tabel fungsi terpanas (urut self time) dan histogram per kedalaman (default ke stderr).'''
+        file = file or sys.stderr
+        total_sendiri = sum(data[2] for data in self.statistik.values()) or 1
+        print(f"\n🔬 Profil solver (urut waktu sendiri)", file=file)
+        print(f"{'Fungsi':36} {'Panggilan':>10} {'Total ms':>11} {'Sendiri ms':>11} {'%':>6}", file=file)
+        for label, (panggilan, total, sendiri) in sorted(self.statistik.items(), key=lambda x: -x[1][2]):
+            print(f"{label:36} {panggilan:>10} {total / 1e6:>11.3f} {sendiri / 1e6:>11.3f} "
+                  f"{sendiri * 100 / total_sendiri:>5.1f}%", file=file)
+
+        if self.cabang or self.waktu_kedalaman:
+            print(f"\n{'Kedalaman':>9} {'Node':>8} {'Rata cabang':>12} {'Waktu ms':>10}  Histogram cabang", file=file)
+            for d in sorted(set(self.cabang) | set(self.waktu_kedalaman)):
+                histogram = self.cabang.get(d, {})
+                node = sum(histogram.values())
+                rata = sum(f * j for f, j in histogram.items()) / node if node else 0
+                sebaran = " ".join(f"{f}:{j}" for f, j in sorted(histogram.items()))
+                print(f"{d:>9} {node:>8} {rata:>12.2f} {self.waktu_kedalaman.get(d, 0) / 1e6:>10.3f}  {sebaran}",
+                      file=file)
+
+
+# Urutan kolom file log CSV (kolom baru selalu ditambahkan di belakang supaya visualisasi.py tetap jalan)
+# Kolom *Ns memakai time.perf_counter_ns: waktu generate, cek keunikan, dan solve dicatat terpisah
+# Status = sukses / budget (STATUS_SOLVE), JalurMode = urutan mode yang dicoba saat eskalasi (misal "1>2>4")
+# Backjump / PangkasNogood = lompatan mundur non-kronologis dan tebakan yang ditolak nogood (mode 5, lainnya 0)
+KOLOM_LOG = ["Timestamp", "Level", "Mode", "Langkah", "Durasi", "Seed", "Animasi", "Propagasi", "Ukuran",
+             "Versi", "GenerateNs", "CekUnikNs", "SolveNs", "Backtrack", "KedalamanMaks", "CekValiditas",
+             "Status", "JalurMode", "Backjump", "PangkasNogood"]
+VERSI_SKEMA_LOG = 4  # Naikkan kalau arti/urutan kolom berubah (baris tanpa Versi = skema 1)
+
+
+def siapkan_log_csv(log_file):
+    '''
+    Memastikan file log CSV punya header KOLOM_LOG terbaru.
+    - Jika file belum ada, header KOLOM_LOG ditulis dulu.
+    - Jika file lama masih memakai header versi sebelumnya (kolom lebih sedikit),
+      file di-upgrade sekali: header diganti dan baris lama diberi kolom kosong di belakang.
+    '''
+    import csv
+
+    if os.path.isfile(log_file):
+        with open(log_file, newline='') as file:
+            header = next(csv.reader(file), None)
+        if header != KOLOM_LOG:
+            # Upgrade format log lama ke header terbaru
+            with open(log_file, newline='') as file:
+                baris_lama = list(csv.reader(file))[1:]
+            with open(log_file, mode='w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(KOLOM_LOG)
+                for baris in baris_lama:
+                    writer.writerow(baris + [""] * (len(KOLOM_LOG) - len(baris)))
+    else:
+        with open(log_file, mode='w', newline='') as file:
+            csv.writer(file).writerow(KOLOM_LOG)  # Tulis header jika file belum ada
+
+
+def tulis_log_csv(log_file, baris_log):
+    '''
+    Fungsi ini menambahkan satu baris hasil solving ke file log CSV (header di-upgrade dulu bila perlu).
+    Untuk banyak baris sekaligus pakai PenulisLog supaya file tidak dibuka ulang per puzzle.
+    '''
+
+    import csv
+
+    siapkan_log_csv(log_file)
+    with open(log_file, mode='a', newline='') as file:
+        csv.writer(file).writerow(baris_log)
+
+
+class PenulisLog:
+    '''
+    Penulis log metrik yang di-buffer: baris dikumpulkan di memori lalu ditulis sekaligus
+    ke CSV (kolom KOLOM_LOG, dibaca visualisasi.py) dan JSON Lines (satu objek per solve).
+
+    - Header CSV dicek/di-upgrade sekali saat dibuat, bukan setiap baris.
+    - Buffer di-flush kalau sudah berisi ukuran_batch baris, dan saat tutup()
+      (tutup() juga didaftarkan ke atexit, jadi sys.exit di menu tidak membuang log).
+    - path_jsonl=None untuk menulis CSV saja.
+    '''
+
+    def __init__(self, path_csv="log_sudoku.csv", path_jsonl="log_sudoku.jsonl", ukuran_batch=32):
+        import atexit
+        self.path_csv = path_csv
+        self.path_jsonl = path_jsonl
+        self.ukuran_batch = ukuran_batch
+        self.buffer = []  # List dict baris (kunci = KOLOM_LOG)
+        siapkan_log_csv(path_csv)
+        atexit.register(self.tutup)
+
+    def tulis(self, **kolom):
+        '''Tambah satu baris (kunci = nama kolom KOLOM_LOG, kolom yang tidak diisi dibiarkan kosong).'''
+        from datetime import datetime
+
+        kolom.setdefault("Timestamp", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        kolom.setdefault("Versi", VERSI_SKEMA_LOG)
+        self.buffer.append(kolom)
+        if len(self.buffer) >= self.ukuran_batch:
+            self.flush()
+
+    def flush(self):
+        '''Tulis semua baris di buffer ke file (satu kali buka per file).'''
+        if not self.buffer:
+            return
+        import csv
+        import json
+        with open(self.path_csv, mode='a', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerows([baris.get(nama, "") for nama in KOLOM_LOG] for baris in self.buffer)
+        if self.path_jsonl:
+            with open(self.path_jsonl, mode='a') as file:
+                file.writelines(json.dumps(baris, ensure_ascii=False) + "\n" for baris in self.buffer)
+        self.buffer.clear()
+
+    def tutup(self):
+        self.flush()
+
+
+def landing_page():
+    os.system('cls' if os.name == 'nt' else 'clear')  # clear terminal screen
+    print("╔══════════════════════════════════════════════╗")
+    print("║                                              ║")
+    print("║     🧠 Sudoku Solver CLI with Animation      ║")
+    print("║                                              ║") 
+    print("║   📌 Dibuat oleh Kelompok 6 - DAA 2025       ║")
+    print("║   🔍 Pilih level dan lihat cara solve-nya!   ║")
+    print("║                                              ║")
+    print("╚══════════════════════════════════════════════╝")
+    print()
+    time.sleep(0.2)  # biar ga langsung lompat ke menu
+
+
+# Mapping pilihan level ke (nama level, persentase sel kosong), dipakai menu interaktif dan prewarm
+TINGKAT_KESULITAN = {
+    '1': ('mudah', 0.3),      # Mudah → 30% sel kosong
+    '2': ('menengah', 0.4),   # Menengah → 40% sel kosong
+    '3': ('sulit', 0.60)      # Sulit → 60% sel kosong
+}
+
+# Nama mode untuk CLI batch -> kode mode yang dipakai pecahkan_sudoku_anim
+MODE_BATCH = {
+    'naive': '1',
+    'mrv': '2',
+    'mrv-inc': '3',
+    'dlx': '4',
+    'cbj': '5',
+}
+
+# Nama mode yang dicatat di log (sama dengan mode interaktif)
+NAMA_MODE = {
+    '1': "Naive",
+    '2': "BT + MRV",
+    '3': "BT + MRV Inc",
+    '4': "DLX",
+    '5': "CBJ + Nogood"
+}
+
+
+def baca_puzzle(sumber, ukuran=9):
+    '''
+    Generator yang membaca puzzle satu per satu dari file/stdin (lazy, memori konstan).
+    Format yang diterima (n = ukuran papan):
+    - Satu baris n*n simbol (angka 1-9, lalu huruf A-Z untuk 10 ke atas, '0' atau '.' untuk sel kosong)
+    - Grid n baris x n simbol (spasi, '|', '-', '+' diabaikan)
+    - Grid n baris berisi n bilangan dipisah spasi/koma (misal "12 0 3 16 ...") untuk papan 16x16/25x25
+    Baris kosong dan baris yang diawali '#' dilewati; puzzle yang petunjuknya saling bentrok
+    (angka sama di satu baris/kolom/kotak) juga dilewati dengan peringatan, tidak pernah sampai ke solver.
+    Yield tuple (nomor_baris, papan) dengan nomor_baris = baris terakhir puzzle di input.
+    '''
+
+    n = ukuran
+    sel = []  # Penampung sel untuk format grid multi-baris
+    for nomor_baris, baris in enumerate(sumber, 1):
+        baris = baris.strip()
+        if not baris or baris.startswith('#'):
+            continue
+
+        token = baris.replace(',', ' ').replace('|', ' ').split()
+        if n > 9 and any(len(t) > 1 and t.isdigit() for t in token):
+            isi = [int(t) for t in token if t.isdigit()]  # Format bilangan dipisah spasi/koma
+        else:
+            isi = [0 if c == '.' else int(c, 36) for c in baris
+                   if c == '.' or c.isdigit() or (n > 9 and c.isalpha())]
+        if not isi:
+            continue  # Baris pemisah grid seperti "------+-------"
+        if len(isi) == n * n and not sel and max(isi) <= n:
+            papan = [isi[i:i + n] for i in range(0, n * n, n)]
+        elif len(isi) == n and max(isi) <= n:
+            sel.extend(isi)
+            if len(sel) < n * n:
+                continue
+            papan = [sel[i:i + n] for i in range(0, n * n, n)]
+            sel = []
+        else:
+            print(f"⚠️ Baris {nomor_baris}: format puzzle tidak dikenali, dilewati.", file=sys.stderr)
+            sel = []
+            continue
+
+        bentrok = PapanBitmask(papan).bentrok
+        if bentrok is not None:
+            b, k = bentrok
+            print(f"⚠️ Baris {nomor_baris}: petunjuk bentrok (angka {papan[b][k]} di baris {b + 1} kolom {k + 1} "
+                  f"sudah ada di baris/kolom/kotaknya), dilewati.", file=sys.stderr)
+            continue
+        yield nomor_baris, papan
+
+
+SIMBOL = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"  # Simbol sel; huruf dipakai untuk angka 10 ke atas
+
+
+def papan_ke_string(papan):
+    '''Ubah papan n x n jadi string n*n simbol (0 untuk sel kosong, A=10, B=11, ...).'''
+    if isinstance(papan, PapanDatar):
+        return papan.ke_string()
+    return ''.join(SIMBOL[angka] for baris in papan for angka in baris)
+
+
+def string_ke_papan(teks):
+    '''Kebalikan papan_ke_string: string n*n simbol jadi papan n x n.'''
+    n = math.isqrt(len(teks))
+    return [[int(c, 36) for c in teks[i:i + n]] for i in range(0, n * n, n)]
+
+
+# Tabel translate byte nilai sel (0-35) -> simbol ASCII, dan sebaliknya (juga '.' -> 0)
+TABEL_KE_SIMBOL = bytes.maketrans(bytes(range(len(SIMBOL))), SIMBOL.encode('ascii'))
+TABEL_DARI_SIMBOL = bytes.maketrans(SIMBOL.encode('ascii') + SIMBOL.lower().encode('ascii')[10:] + b'.',
+                                    bytes(range(len(SIMBOL))) + bytes(range(10, len(SIMBOL))) + b'\0')
+
+
+class PapanDatar:
+    '''
+    Papan n x n dalam satu buffer datar, 1 byte per sel (baris demi baris), untuk corpus besar:
+    papan 9x9 cukup 81 byte (list-of-list butuh belasan objek list + pointer per sel).
+    data boleh bytearray (milik sendiri) atau memoryview (view zero-copy, misal ke record KorpusBiner).
+    salin() selalu menghasilkan bytearray baru (satu memcpy, tanpa deepcopy).
+
+    Solver tetap bekerja dengan list-of-list (akses papan[baris][kolom] di loop panas lebih cepat):
+    pakai ke_list() / dari_list() sebagai adapter, atau sebagai_list() untuk papan yang jenisnya bebas.
+    '''
+
+    __slots__ = ('n', 'data')
+
+    def __init__(self, data, n=None):
+        self.data = data
+        self.n = n or math.isqrt(len(data))
+
+    @classmethod
+    def dari_list(cls, papan):
+        return cls(bytearray(angka for baris in papan for angka in baris), len(papan))
+
+    @classmethod
+    def dari_string(cls, teks):
+        return cls(bytearray(teks.encode('ascii').translate(TABEL_DARI_SIMBOL)))
+
+    def ke_list(self):
+        n, data = self.n, self.data
+        return [list(data[i:i + n]) for i in range(0, n * n, n)]
+
+    def ke_string(self):
+        return bytes(self.data).translate(TABEL_KE_SIMBOL).decode('ascii')
+
+    def salin(self):
+        return PapanDatar(bytearray(self.data), self.n)
+
+    def isi_dari(self, papan):
+        '''Timpa isi buffer (in-place, view ikut berubah) dari papan list-of-list atau PapanDatar lain.'''
+        self.data[:] = papan.data if isinstance(papan, PapanDatar) else bytes(a for baris in papan for a in baris)
+
+    def __len__(self):
+        return self.n  # Sama seperti list-of-list: len(papan) = ukuran papan
+
+    def __getitem__(self, posisi):
+        baris, kolom = posisi
+        return self.data[baris * self.n + kolom]
+
+    def __setitem__(self, posisi, angka):
+        baris, kolom = posisi
+        self.data[baris * self.n + kolom] = angka
+
+    def __eq__(self, lain):
+        return isinstance(lain, PapanDatar) and self.data == lain.data
+
+
+def sebagai_list(papan):
+    '''Adapter untuk fungsi berbasis list-of-list: PapanDatar diubah ke list, list dikembalikan apa adanya.'''
+    return papan.ke_list() if isinstance(papan, PapanDatar) else papan
+
+
+MAGIC_KORPUS = b"SDKK"
+VERSI_KORPUS = 1
+FORMAT_HEADER_KORPUS = '<4sHHQ'  # magic, versi, ukuran papan, jumlah record (16 byte)
+FORMAT_META_KORPUS = '<BBHIQ'  # status, kode mode, cadangan, langkah, solve_ns (16 byte)
+KODE_STATUS_KORPUS = {None: 0, 'sukses': 1, 'gagal': 2, 'budget': 3}  # 0 = belum diselesaikan
 
-    # Mengecek apakah sys.stdout memiliki atribut/fungsi isatty
-    # Ini penting karena jika output di-redirect ke file atau objek lain, bisa saja nggak ada isatty
-    return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
-    # sys.stdout.isatty() akan True jika output mengarah ke terminal asli
-    # Jika False, berarti output ke file/pipe dan sebaiknya hindari print dengan warna
 
+class KorpusBiner:
+    '''
+    Corpus puzzle biner dengan record berukuran tetap, dibuka lewat mmap (tidak dibaca ke memori).
+    Layout file: header FORMAT_HEADER_KORPUS, lalu 'jumlah' record berurutan:
+    - puzzle: n*n byte (1 byte per sel, 0 = kosong)
+    - solusi: n*n byte (semua 0 kalau belum diselesaikan)
+    - meta: FORMAT_META_KORPUS (status, mode, langkah, solve_ns)
+    Untuk 9x9 satu record = 178 byte, jadi record ke-i bisa langsung dihitung offset-nya.
 
-def apakah_valid(papan, tebakan, baris, kolom):
+    papan(i) / solusi(i) mengembalikan PapanDatar berupa view zero-copy ke mmap; view hanya valid
+    selama korpus masih terbuka. Dengan tulis=True, hasil ditulis langsung ke file lewat tulis_hasil().
     '''
-    Fungsi ini digunakan untuk mengecek apakah angka 'tebakan' valid 
-    jika dimasukkan ke posisi (baris, kolom) di papan Sudoku.
-    Valid artinya tidak melanggar tiga aturan utama Sudoku:
-    - Tidak boleh ada angka yang sama di baris
-    - Tidak boleh ada angka yang sama di kolom
-    - Tidak boleh ada angka yang sama di dalam kotak 3x3 tempat sel itu berada
 
-    jika lolos semua pengecekan, fungsi ini return True, artinya tebakan sah.
-    jika ada yang dilanggar, langsung return False.
+    def __init__(self, path, tulis=False):
+        import mmap  # Hanya dibutuhkan kalau corpus biner dipakai
+
+        self.file = open(path, "r+b" if tulis else "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_WRITE if tulis else mmap.ACCESS_READ)
+        magic, versi, self.n, self.jumlah = struct.unpack_from(FORMAT_HEADER_KORPUS, self.mm)
+        if magic != MAGIC_KORPUS or versi != VERSI_KORPUS:
+            self.tutup()
+            raise ValueError(f"{path} bukan file corpus yang dikenali")
+        self.sel = self.n * self.n
+        self.awal = struct.calcsize(FORMAT_HEADER_KORPUS)
+        self.ukuran_record = 2 * self.sel + struct.calcsize(FORMAT_META_KORPUS)
+        self.buffer = memoryview(self.mm)
+
+    @classmethod
+    def buat(cls, path, jumlah, ukuran=9):
+        '''Buat file corpus kosong (sudah dialokasikan penuh untuk 'jumlah' record) dan buka untuk ditulis.'''
+        with open(path, "wb") as f:
+            f.write(struct.pack(FORMAT_HEADER_KORPUS, MAGIC_KORPUS, VERSI_KORPUS, ukuran, jumlah))
+            f.truncate(struct.calcsize(FORMAT_HEADER_KORPUS)
+                       + jumlah * (2 * ukuran * ukuran + struct.calcsize(FORMAT_META_KORPUS)))
+        return cls(path, tulis=True)
+
+    def __len__(self):
+        return self.jumlah
+
+    def offset(self, i):
+        if not 0 <= i < self.jumlah:
+            raise IndexError(f"record {i} di luar corpus ({self.jumlah} record)")
+        return self.awal + i * self.ukuran_record
+
+    def papan(self, i):
+        o = self.offset(i)
+        return PapanDatar(self.buffer[o:o + self.sel], self.n)
+
+    def solusi(self, i):
+        o = self.offset(i) + self.sel
+        return PapanDatar(self.buffer[o:o + self.sel], self.n)
+
+    def meta(self, i):
+        '''Return (kode_status, kode_mode, langkah, solve_ns) record ke-i.'''
+        status, mode, _, langkah, solve_ns = struct.unpack_from(FORMAT_META_KORPUS, self.mm,
+                                                                self.offset(i) + 2 * self.sel)
+        return status, mode, langkah, solve_ns
+
+    def tulis_puzzle(self, i, papan):
+        self.papan(i).isi_dari(papan)
+
+    def tulis_hasil(self, i, solusi, status, mode, langkah, solve_ns):
+        '''
+        Tulis hasil solve record ke-i langsung ke mmap. solusi: string papan_ke_string ("" = tidak ada),
+        list-of-list, atau PapanDatar; status salah satu kunci KODE_STATUS_KORPUS; mode '1'-'5' (kode MODE_BATCH).
+        '''
+        o = self.offset(i) + self.sel
+        if isinstance(solusi, str):
+            self.buffer[o:o + self.sel] = (solusi.encode('ascii').translate(TABEL_DARI_SIMBOL) if solusi
+                                           else bytes(self.sel))
+        else:
+            self.solusi(i).isi_dari(solusi)
+        struct.pack_into(FORMAT_META_KORPUS, self.mm, o + self.sel, KODE_STATUS_KORPUS[status],
+                         int(mode or 0), 0, langkah, solve_ns)
+
+    def tutup(self):
+        # View yang masih dipegang pemanggil harus sudah dilepas, kalau tidak mmap menolak ditutup
+        if getattr(self, 'buffer', None) is not None:
+            self.buffer.release()
+            self.buffer = None
+        if not self.mm.closed:
+            self.mm.flush()
+            self.mm.close()
+        self.file.close()
+
+
+def baca_korpus(path):
+    '''Versi baca_puzzle untuk corpus biner: yield (nomor_record mulai 1, papan list-of-list).'''
+    korpus = KorpusBiner(path)
+    try:
+        for i in range(len(korpus)):
+            yield i + 1, korpus.papan(i).ke_list()
+    finally:
+        korpus.tutup()
+
+
+def selesaikan_satu(papan, mode, propagasi=False, trace=None, budget=None, split=None):
     '''
-    
-    # Cek apakah tebakan sudah ada di baris yang sama
-    if tebakan in papan[baris]:  # Cek duplikat di baris
-        return False
-    
-    # Cek apakah tebakan sudah ada di kolom yang sama
-    if any(papan[i][kolom] == tebakan for i in range(9)):  # Cek duplikat di kolom
-        return False
-    
-    # Cari posisi kiri-atas dari kotak 3x3 tempat sel (baris, kolom) berada
-    box_baris, box_kolom = (baris // 3) * 3, (kolom // 3) * 3  # Menghitung indeks awal kotak 3x3
-    
-    # Loop untuk mengecek seluruh isi kotak 3x3
-    for i in range(3):
-        for j in range(3):
-            # Cek apakah tebakan sudah ada di kotak 3x3
-            if papan[box_baris + i][box_kolom + j] == tebakan:
-                return False
-    
-    # Jika lolos semua pengecekan, berarti tebakan valid
-    return True
+    Selesaikan satu puzzle secara headless dan kembalikan ringkasan hasilnya:
+    (sukses, langkah, durasi, jumlah_propagasi, solusi_string, jalur_mode).
+    Dipakai bersama oleh jalur batch sekuensial maupun worker paralel.
+    trace (RekamanTrace) opsional diteruskan ke solver untuk merekam event.
+    budget: dict opsional {'batas_node', 'batas_waktu', 'eskalasi'} untuk pecahkan_dengan_eskalasi;
+    sukses None berarti budget habis.
+    Kalau cache kanonik aktif (CACHE_SOLUSI) dan tidak sedang merekam trace, puzzle yang setara dengan
+    puzzle yang pernah diselesaikan langsung dijawab dari cache (langkah 0, jalur_mode "cache").
+    split: jumlah proses untuk pecahkan_sudoku_split (satu puzzle dipecah ke beberapa proses);
+    tidak bisa digabung dengan trace / budget.
+    papan boleh PapanDatar (misal view record KorpusBiner): diselesaikan lewat adapter list-of-list,
+    lalu solusinya disalin balik ke buffer-nya.
+    '''
+    if isinstance(papan, PapanDatar):
+        papan_list = papan.ke_list()
+        hasil = selesaikan_satu(papan_list, mode, propagasi, trace, budget, split)
+        if hasil[0]:
+            papan.isi_dari(papan_list)
+        return hasil
 
+    cache = CACHE_SOLUSI if trace is None else None
+    if cache is not None:
+        mulai = time.perf_counter_ns()
+        kanonik, transformasi = kanonisasi(papan)
+        data = cache.ambil(kanonik)
+        durasi_kanonik = (time.perf_counter_ns() - mulai) / 1e9  # Ikut dihitung di durasi, hit maupun miss
+        if data is not None:
+            if not data[1]:
+                return (False, 0, durasi_kanonik, 0, "", "cache")
+            solusi = balik_transformasi(string_ke_papan(data[1]), transformasi)
+            for baris, baris_solusi in zip(papan, solusi):
+                baris[:] = baris_solusi  # Sama seperti solver: papan diisi in-place
+            return (True, 0, durasi_kanonik, 0, papan_ke_string(papan), "cache")
 
-def cari_sel_kosong_biasa(papan):
+    statistik = {}
+    if split:
+        sukses, langkah, durasi = pecahkan_sudoku_split(papan, mode, propagasi, split, statistik)
+        statistik['jalur_mode'] = mode
+    else:
+        sukses, langkah, durasi = pecahkan_dengan_eskalasi(
+            papan,
+            mode,
+            delay=0,
+            deskripsi_mode=None,  # Headless: tanpa clear screen maupun tampilan papan
+            propagasi=propagasi,
+            statistik=statistik,
+            trace=trace,
+            **(budget or {'eskalasi': False})
+        )
+    if cache is not None:
+        durasi += durasi_kanonik
+    if cache is not None and sukses is not None:
+        # Budget habis tidak disimpan: belum ada jawaban. Gagal = pencarian tuntas tanpa solusi (0 solusi).
+        cache.simpan(kanonik, None if sukses else 0,
+                     papan_ke_string(terapkan_transformasi(papan, transformasi)) if sukses else "")
+    return (sukses, langkah, durasi, statistik.get('propagasi', 0), papan_ke_string(papan) if sukses else "",
+            statistik['jalur_mode'])
+
+
+def tabel_bit_vektor():
+    '''Tabel NumPy (popcount, posisi_bit) untuk mask 10-bit, dibuat sekali lalu disimpan.'''
+    if not TABEL_BIT_VEKTOR:
+        import numpy as np
+        TABEL_BIT_VEKTOR.append(np.array(JUMLAH_BIT, dtype=np.int8))
+        TABEL_BIT_VEKTOR.append(np.array([m.bit_length() - 1 if m else 0 for m in range(1 << 10)], dtype=np.int8))
+    return TABEL_BIT_VEKTOR
+
+
+TABEL_BIT_VEKTOR = []
+
+
+def ke_kotak_vektor(x):
+    '''(m, 9, 9) baris-kolom -> (m, 9, 9) kotak-isi, supaya kotak bisa direduksi seperti baris.'''
+    return x.reshape(-1, 3, 3, 3, 3).transpose(0, 1, 3, 2, 4).reshape(-1, 9, 9)
+
+
+def dari_kotak_vektor(x):
+    '''Sebar nilai per kotak (m, 9) ke tiap sel (m, 9, 9).'''
+    return x.reshape(-1, 3, 3).repeat(3, axis=1).repeat(3, axis=2)
+
+
+def kandidat_vektor(papan):
     '''
-    Fungsi ini digunakan untuk mencari posisi sel kosong (yang bernilai 0) 
-    di papan Sudoku secara urut dari kiri ke kanan, atas ke bawah (Naive/Basic).
-    Jika ditemukan, fungsi langsung mengembalikan indeks (baris, kolom) dari sel kosong pertama.
-    jika tidak ada sel kosong lagi, berarti papan sudah penuh, dan fungsi return (None, None).
+    Mask kandidat semua sel untuk banyak papan (m, 9, 9) sekaligus, versi vektor dari PapanBitmask.kandidat.
+    Return (kosong, mask_baris, mask_kolom, mask_kotak, kandidat); kandidat sel terisi = 0.
     '''
-    
-    # Looping baris dari 0 sampai 8
-    for baris in range(9):
-        # Looping kolom dari 0 sampai 8
-        for kolom in range(9):
-            # Cek apakah sel ini kosong (bernilai 0)
-            if papan[baris][kolom] == 0:
-                return (baris, kolom)  # Return posisi sel kosong pertama
+    import numpy as np
 
-    # jika tidak ada sel kosong, return (None, None) sebagai penanda papan sudah penuh
-    return (None, None)
+    semua = np.int16(SEMUA_ANGKA)
+    kosong = papan == 0
+    bit = np.left_shift(np.int16(1), papan.astype(np.int16)) & semua  # Sel kosong -> 0
+    mask_baris = np.bitwise_or.reduce(bit, axis=2)
+    mask_kolom = np.bitwise_or.reduce(bit, axis=1)
+    mask_kotak = np.bitwise_or.reduce(ke_kotak_vektor(bit), axis=2)
+    terpakai = mask_baris[:, :, None] | mask_kolom[:, None, :] | dari_kotak_vektor(mask_kotak)
+    kandidat = np.where(kosong, ~terpakai & semua, 0).astype(np.int16)
+    return kosong, mask_baris, mask_kolom, mask_kotak, kandidat
 
 
-def cari_sel_kosong_mrv(papan):
+def propagasi_singles_vektor(papan_np):
     '''
-    Fungsi ini menerapkan heuristik Minimum Remaining Value (MRV),
-    yaitu mencari sel kosong yang memiliki kemungkinan tebakan paling sedikit.
-    Tujuannya adalah meminimalkan kemungkinan salah, karena semakin sedikit opsi,
-    semakin besar kemungkinan kita memilih angka yang benar di awal.
-    
-    Fungsi akan mengembalikan posisi (baris, kolom) dari sel kosong
-    dengan jumlah opsi terkecil. Jika ada sel dengan hanya 1 kemungkinan valid,
-    langsung dikembalikan karena itu paling prioritas.
-    jika tidak ada sel kosong, fungsi akan return (None, None).
+    Jalankan naked single + hidden single untuk banyak papan sekaligus dengan NumPy.
+    papan_np: array int8 berbentuk (N, 9, 9), diubah in-place.
+
+    Idenya sama dengan PapanBitmask, tapi versi vektor: mask baris/kolom/kotak dihitung untuk
+    semua papan dengan bitwise_or.reduce, kandidat tiap sel jadi array int16 (N, 9, 9), dan
+    jumlah kandidat diambil lewat tabel popcount. Hanya papan yang masih berubah yang
+    diproses di putaran berikutnya.
+
+    Return array bool (N,) yang menandai papan kontradiksi/bentrok; papan seperti ini
+    dikembalikan ke isi awalnya supaya nanti diperiksa ulang oleh solver skalar.
     '''
+    import numpy as np
 
-    min_opsi = 10  # Jumlah kemungkinan minimum, inisialisasi dengan nilai maksimal
-    kandidat = None  # Menyimpan posisi kandidat terbaik (sel dengan opsi paling sedikit)
+    popcount, posisi_bit = tabel_bit_vektor()
+    semua = np.int16(SEMUA_ANGKA)
+    ke_kotak, dari_kotak = ke_kotak_vektor, dari_kotak_vektor
 
-    # Looping semua baris dan kolom
-    for baris in range(9):
-        for kolom in range(9):
-            # Cek hanya sel yang kosong (bernilai 0)
-            if papan[baris][kolom] == 0:
-                # Hitung jumlah kemungkinan angka valid untuk sel ini
-                opsi = [tebakan for tebakan in range(1, 10) if apakah_valid(papan, tebakan, baris, kolom)]
+    def tunggal(x, sumbu):
+        # Bit angka yang muncul tepat sekali di sepanjang sumbu, plus gabungan semua bit
+        sekali = np.zeros(x.shape[:sumbu] + x.shape[sumbu + 1:], dtype=np.int16)
+        dua_kali = sekali.copy()
+        for i in range(9):
+            nilai = np.take(x, i, axis=sumbu)
+            dua_kali |= sekali & nilai
+            sekali |= nilai
+        return sekali & ~dua_kali, sekali
 
-                # Update jika jumlah opsi lebih sedikit dari sebelumnya
-                if len(opsi) < min_opsi:
-                    min_opsi = len(opsi)
-                    kandidat = (baris, kolom)
+    n = papan_np.shape[0]
+    awal = papan_np.copy()
+    bentrok = np.zeros(n, dtype=bool)
+    aktif = np.arange(n)  # Indeks papan yang masih perlu diproses
 
-                    # Jika cuma punya 1 opsi, langsung balikin (paling optimal)
-                    if min_opsi == 1:
-                        return kandidat
-                    
-    # Return kandidat terbaik, atau (None, None) jika tidak ada sel kosong
-    return kandidat if kandidat else (None, None)
+    while aktif.size:
+        papan = papan_np[aktif]
+        kosong, mask_baris, mask_kolom, mask_kotak, kandidat = kandidat_vektor(papan)
+
+        # Duplikat: jumlah bit unik di unit lebih sedikit dari jumlah sel yang terisi
+        terisi = ~kosong
+        buntu = (
+            (popcount[mask_baris] != terisi.sum(axis=2)).any(axis=1)
+            | (popcount[mask_kolom] != terisi.sum(axis=1)).any(axis=1)
+            | (popcount[mask_kotak] != ke_kotak(terisi).sum(axis=2)).any(axis=1)
+        )
+
+        jumlah = popcount[kandidat]
+        buntu |= (kosong & (jumlah == 0)).any(axis=(1, 2))
+
+        # Hidden single per unit; sekalian cek angka yang tidak punya tempat sama sekali
+        tunggal_baris, ada_baris = tunggal(kandidat, 2)
+        tunggal_kolom, ada_kolom = tunggal(kandidat, 1)
+        tunggal_kotak, ada_kotak = tunggal(ke_kotak(kandidat), 2)
+        buntu |= ((ada_baris | mask_baris) != semua).any(axis=1)
+        buntu |= ((ada_kolom | mask_kolom) != semua).any(axis=1)
+        buntu |= ((ada_kotak | mask_kotak) != semua).any(axis=1)
+
+        # Gabungkan naked single dan hidden single jadi satu mask isian per sel
+        isi = np.where(jumlah == 1, kandidat, 0).astype(np.int16)
+        isi |= kandidat & (tunggal_baris[:, :, None] | tunggal_kolom[:, None, :] | dari_kotak(tunggal_kotak))
+
+        # Sel yang kebagian lebih dari satu angka berarti kontradiksi
+        buntu |= (popcount[isi] > 1).any(axis=(1, 2))
+        ada_isi = (isi != 0) & ~buntu[:, None, None]
 
+        papan[ada_isi] = posisi_bit[isi[ada_isi]]
+        papan_np[aktif] = papan
 
-def pecahkan_sudoku_anim(papan, delay=0.03, papan_awal=None, deskripsi_mode=None, mode='1'):
+        bentrok[aktif[buntu]] = True
+        aktif = aktif[~buntu & ada_isi.any(axis=(1, 2))]  # Lanjut hanya papan yang masih berubah
+
+    papan_np[bentrok] = awal[bentrok]  # Papan bermasalah dikembalikan ke puzzle aslinya
+    return bentrok
+
+
+# Batas cabang hidup per puzzle di cari_cabang_vektor; puzzle yang melebihinya diserahkan ke solver skalar
+BATAS_CABANG_VEKTOR = 64
+
+
+def cari_cabang_vektor(papan_np, indeks, batas_cabang=BATAS_CABANG_VEKTOR):
     '''
-    Fungsi utama untuk menyelesaikan Sudoku dengan metode backtracking, 
-    sekaligus menampilkan animasi proses solving-nya di terminal.
-    
-    Parameter:
-    - papan: papan sudoku 9x9 yang ingin dipecahkan.
-    - delay: waktu tunda antar langkah animasi (0 = tanpa animasi).
-    - papan_awal: referensi posisi angka asli (tidak bisa diubah).
-    - deskripsi_mode: label yang menunjukkan mode solving (Naive / MRV).
-    - mode: '1' untuk Backtracking Biasa, selain itu pakai MRV heuristik.
+    Pencarian bercabang serentak untuk papan yang masih buntu setelah propagasi_singles_vektor.
+    Tiap putaran, setiap cabang hidup memilih sel kosong dengan kandidat paling sedikit (MRV, urutan baris
+    untuk seri) dan dipecah jadi satu cabang per kandidat; semua cabang baru dipropagasi sekaligus dan
+    cabang yang kontradiksi dibuang. Urutan cabang dijaga sama dengan urutan DFS (cabang induk, lalu angka),
+    jadi puzzle dengan banyak solusi tetap mendapat solusi yang deterministik (yang pertama di urutan itu).
 
-    Return:
-    - sukses: apakah puzzle berhasil dipecahkan
-    - langkah: jumlah langkah percobaan angka
-    - durasi: waktu total eksekusi solving
+    indeks: array indeks papan_np yang dicari. Return (hasil, sisa):
+    - hasil: dict indeks -> (papan_solusi (9, 9) atau None kalau terbukti tanpa solusi, tebakan, kedalaman)
+    - sisa: list indeks yang cabangnya melebihi batas_cabang (diteruskan ke solver skalar)
     '''
+    import numpy as np
 
-    langkah = 0  # Untuk mencatat berapa banyak langkah/percobaan angka yang dilakukan
-    start = time.time()  # Mulai stopwatch
+    popcount, _ = tabel_bit_vektor()
+    cabang = papan_np[indeks].copy()
+    asal = np.asarray(indeks)
+    dalam = np.zeros(len(asal), dtype=np.int32)  # Jumlah tebakan di jalur tiap cabang
+    tebakan = dict.fromkeys(asal.tolist(), 0)
+    hasil, sisa = {}, []
 
-    def backtrack():
-        nonlocal langkah  # Agar variabel langkah bisa dimodifikasi dari dalam fungsi ini
-        if delay > 0:
-            animasi_cli(papan, None, 0, papan_awal, deskripsi_mode)  # Tampilkan papan awal
+    while len(cabang):
+        _, _, _, _, kandidat = kandidat_vektor(cabang)
+        datar = kandidat.reshape(len(cabang), 81)
+        jumlah = np.where(datar != 0, popcount[datar], 10)
+        sel = jumlah.argmin(axis=1)  # argmin = indeks pertama yang minimum
+        opsi = datar[np.arange(len(cabang)), sel]
 
-        # Pilih sel kosong berikutnya menggunakan:
-        # - strategi biasa (urutan kiri ke kanan, atas ke bawah)
-        # - atau heuristik MRV (pilih sel dengan kemungkinan angka paling sedikit)
-        baris, kolom = cari_sel_kosong_biasa(papan) if mode == '1' else cari_sel_kosong_mrv(papan)
+        # Anak diurutkan per (cabang induk, angka) supaya urutan DFS tetap terjaga
+        induk, angka = np.nonzero((opsi[:, None] >> np.arange(1, 10)) & 1)
+        angka = angka + 1
+        anak = cabang[induk].reshape(-1, 81)
+        anak[np.arange(len(induk)), sel[induk]] = angka
+        anak = anak.reshape(-1, 9, 9)
+        asal_anak, dalam_anak = asal[induk], dalam[induk] + 1
+        for i, banyak in zip(*np.unique(asal_anak, return_counts=True)):
+            tebakan[int(i)] += int(banyak)
 
-        # jika tidak ada sel kosong, artinya sudah selesai
-        if baris is None or kolom is None:
-            os.system('cls' if os.name == 'nt' else 'clear')  # Bersihin terminal
-            print(
-                deskripsi_mode + "\n" +
-                (Fore.WHITE + "-"*30 + Style.RESET_ALL if apakah_support_warna() else "-"*30 + "\n")
-            )
-            tampilkan_papan(papan, None, papan_awal)  # Tampilkan hasil akhir
-            return True
+        bentrok = propagasi_singles_vektor(anak)
+        hidup = ~bentrok
+        selesai = hidup & ~(anak == 0).any(axis=(1, 2))
+        if selesai.any():
+            # Solusi pertama per puzzle (urutan DFS); semua cabang lain puzzle itu dibuang
+            posisi = np.nonzero(selesai)[0]
+            terpecahkan, pertama = np.unique(asal_anak[posisi], return_index=True)
+            for i, p in zip(terpecahkan.tolist(), posisi[pertama].tolist()):
+                hasil[i] = (anak[p], tebakan[i], int(dalam_anak[p]))
+            hidup &= ~np.isin(asal_anak, terpecahkan)
+
+        cabang, asal, dalam = anak[hidup], asal_anak[hidup], dalam_anak[hidup]
+        hitung = np.bincount(asal, minlength=len(papan_np)) if len(asal) else np.zeros(len(papan_np), dtype=int)
+        terlalu_lebar = np.nonzero(hitung > batas_cabang)[0]
+        if len(terlalu_lebar):
+            sisa.extend(terlalu_lebar.tolist())
+            jaga = ~np.isin(asal, terlalu_lebar)
+            cabang, asal, dalam = cabang[jaga], asal[jaga], dalam[jaga]
 
-        # Percobaan angka dari 1 sampai 9 untuk sel saat ini
-        for tebakan in range(1, 10):
-            if apakah_valid(papan, tebakan, baris, kolom):  # Cek apakah tebakan ini valid
-                papan[baris][kolom] = tebakan  # Isi sel dengan angka
-                langkah += 1  # Tambah hitungan langkah
+    # Puzzle yang semua cabangnya habis tanpa solusi: terbukti tidak punya solusi
+    for i in indeks.tolist():
+        if i not in hasil and i not in sisa:
+            hasil[i] = (None, tebakan[i], 0)
+    return hasil, sisa
 
-                if delay > 0:
-                    print(f"Langkah {langkah}: Coba {tebakan} di ({baris}, {kolom})")
-                    animasi_cli(papan, (baris, kolom), delay, papan_awal, deskripsi_mode)
 
-                if backtrack():  # Lanjut ke langkah berikutnya secara rekursif
-                    return True  # Jika solusi ditemukan, propagasi True ke atas
+def selesaikan_batch_vektor(daftar_papan, mode, propagasi=False, budget=None):
+    '''
+    Selesaikan banyak puzzle sekaligus: propagasi singles dijalankan serentak untuk semua
+    papan dengan NumPy sampai tidak ada yang berubah, lalu papan yang masih butuh tebakan dicari
+    bersama-sama dengan cari_cabang_vektor. Hanya papan yang cabangnya terlalu lebar (atau semua
+    papan yang belum selesai, kalau ada budget) yang diteruskan ke solver skalar
+    (pecahkan_sudoku_anim dengan mode yang dipilih). Langkah papan yang selesai di tahap vektor =
+    jumlah cabang tebakan yang dibuat untuknya; papan yang terbukti tanpa solusi dilaporkan gagal.
+
+    Return list tuple (sukses, langkah, durasi, jumlah_propagasi, solusi_string, jalur_mode) dengan urutan
+    sama seperti input, format sama dengan selesaikan_satu. Durasi tahap vektor dibagi rata
+    ke semua papan di batch.
+    '''
+    import numpy as np
 
-                # Jika tebakan ini gagal, kembalikan sel ke 0 (backtrack)
-                papan[baris][kolom] = 0  # Reset sel
-                if delay > 0:
-                    print(f"Langkah {langkah}: Backtrack dari ({baris}, {kolom})")
-                    animasi_cli(papan, (baris, kolom), delay, papan_awal, deskripsi_mode)
+    if not daftar_papan:
+        return []
+    if len(daftar_papan[0]) != 9:
+        # Kernel NumPy hanya untuk papan 9x9; ukuran lain langsung ke solver skalar
+        return [selesaikan_satu(papan, mode, propagasi, budget=budget) for papan in daftar_papan]
 
-        return False  # Jika semua angka gagal, return False untuk trigger backtrack
+    start = time.perf_counter_ns()
+    papan_np = np.array(daftar_papan, dtype=np.int8)
+    kosong_awal = (papan_np == 0).sum(axis=(1, 2))
+    bentrok = propagasi_singles_vektor(papan_np)
+    terisi_vektor = np.where(bentrok, 0, kosong_awal - (papan_np == 0).sum(axis=(1, 2)))
+    selesai = ~bentrok & ~(papan_np == 0).any(axis=(1, 2))
+    cabang = {}
+    if budget is None:
+        # Budget (batas langkah/waktu, eskalasi) hanya dimengerti solver skalar
+        cabang, _ = cari_cabang_vektor(papan_np, np.nonzero(~bentrok & ~selesai)[0])
+    durasi_vektor = (time.perf_counter_ns() - start) / 1e9 / len(daftar_papan)
 
-    sukses = backtrack()  # Mulai solving
-    durasi = time.time() - start  # Hitung durasi total
-    return sukses, langkah, durasi  # Return hasil solving
+    hasil = []
+    for i, papan in enumerate(papan_np.tolist()):
+        if selesai[i]:
+            hasil.append((True, 0, durasi_vektor, int(terisi_vektor[i]), papan_ke_string(papan), mode))
+        elif i in cabang:
+            solusi, langkah, kedalaman = cabang[i]
+            if solusi is None:
+                hasil.append((False, langkah, durasi_vektor, 0, "", mode))
+            else:
+                hasil.append((True, langkah, durasi_vektor, int(kosong_awal[i]) - kedalaman,
+                              papan_ke_string(solusi.tolist()), mode))
+        else:
+            # Sisa pekerjaan (tebakan) diserahkan ke solver skalar
+            sukses, langkah, durasi, prop, solusi, jalur = selesaikan_satu(papan, mode, propagasi, budget=budget)
+            hasil.append((sukses, langkah, durasi_vektor + durasi, int(terisi_vektor[i]) + prop, solusi, jalur))
+    return hasil
 
 
-def apakah_satu_solusi(papan):
+def siapkan_worker(cache_kanonik=None):
     '''
-    Fungsi ini digunakan untuk mengecek apakah sebuah puzzle Sudoku 
-    masih memungkinkan punya satu solusi yang unik.
-    
-    Ide utamanya: jika jumlah sel kosong terlalu banyak (di atas 58), 
-    besar kemungkinan puzzle itu terlalu ambigu, dan solver bisa 
-    menghasilkan banyak solusi berbeda. Jadi kita tolak aja sejak awal.
-    
-    Angka 58 ini threshold konservatif—berdasarkan eksperimen,
-    puzzle dengan lebih dari 58 sel kosong cenderung tidak unik solusinya.
+    Initializer worker pool: siapkan tabel geometri sekali supaya worker sudah "hangat".
+    cache_kanonik: None = tanpa cache, "" = cache kanonik di memori worker, path = file SQLite bersama.
     '''
+    geometri(9)
+    if cache_kanonik is not None:
+        pakai_cache_kanonik(cache_kanonik or None)
 
-    sel_kosong = sum(1 for row in papan for num in row if num == 0)  # Hitung jumlah sel kosong
 
-    if sel_kosong > 58:  # Threshold kasar: lebih dari 58 sel kosong, kemungkinan lebih dari 1 solusi
-        return False
-    return True  # Masih mungkin punya solusi unik
+def selesaikan_chunk(chunk, mode, propagasi, vektor=False, budget=None):
+    '''
+    Dijalankan di dalam proses worker. Chunk berisi list (nomor_baris, puzzle_string);
+    puzzle dikirim sebagai string n*n simbol supaya pickling antar proses tetap murah.
+    Jika vektor=True, satu chunk diselesaikan sekaligus dengan selesaikan_batch_vektor.
+    Return (pid_worker, list hasil) agar statistik per worker bisa dihitung di proses utama.
+    '''
+    if vektor:
+        ringkasan = selesaikan_batch_vektor([string_ke_papan(teks) for _, teks in chunk], mode, propagasi, budget)
+        hasil = [(nomor, *r) for (nomor, _), r in zip(chunk, ringkasan)]
+    else:
+        hasil = [(nomor, *selesaikan_satu(string_ke_papan(teks), mode, propagasi, budget=budget))
+                 for nomor, teks in chunk]
+    return os.getpid(), hasil
 
 
-def hitung_solusi(papan):
+def selesaikan_paralel(daftar_puzzle, mode, propagasi, jobs, chunksize=64, urut=True, statistik_worker=None,
+                       vektor=False, budget=None, cache_kanonik=None):
     '''
-    Fungsi ini digunakan untuk menghitung jumlah solusi dari sebuah papan Sudoku.
-    
-    Tujuannya adalah untuk memastikan bahwa puzzle yang kita proses hanya punya 
-    satu solusi (unik). Kita gunakan teknik backtracking, tapi dengan early stop
-    ketika sudah ketemu lebih dari 1 solusi, jadi hemat waktu juga.
+    Generator yang menyebar puzzle ke ProcessPoolExecutor dalam bentuk chunk.
+    - Jumlah chunk yang sedang diproses dibatasi (2x jumlah worker), jadi input tetap dibaca
+      secara lazy dan memori tidak membengkak walaupun corpus-nya jutaan baris.
+    - urut=True: hasil di-yield sesuai urutan input (deterministik).
+      urut=False: hasil di-yield begitu chunk selesai (jalur cepat, urutan bebas).
+    - statistik_worker: dict opsional pid -> [jumlah_puzzle, total_durasi_solve].
+    - vektor: setiap chunk diselesaikan dengan engine NumPy (selesaikan_batch_vektor).
+    - budget: diteruskan ke selesaikan_satu di worker.
+    - cache_kanonik: diteruskan ke siapkan_worker (cache kanonik per worker / file SQLite bersama).
+    Yield tuple (nomor_baris, sukses, langkah, durasi, propagasi, solusi, jalur_mode).
     '''
+    import itertools
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
-    count = 0  # Inisialisasi jumlah solusi
-    papan_copy = copy.deepcopy(papan)  # Salin papan supaya tidak mengubah papan asli
+    iterator = ((nomor, papan_ke_string(papan)) for nomor, papan in daftar_puzzle)
+    maks_antre = jobs * 2  # Batas chunk in-flight (backpressure ke pembaca input)
 
-    def solve(papan_copy):
-        nonlocal count  # Supaya bisa update variabel count dari dalam fungsi lokal
+    def catat(future):
+        pid, hasil = future.result()
+        if statistik_worker is not None:
+            data = statistik_worker.setdefault(pid, [0, 0.0])
+            data[0] += len(hasil)
+            data[1] += sum(baris[3] for baris in hasil)
+        return hasil
 
-        if count > 1:  # jika udah dapet 2 solusi, kita stop aja langsung (early exit)
-            return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=siapkan_worker, initargs=(cache_kanonik,)) as pool:
+        antre = deque()
+        habis = False
+        while antre or not habis:
+            # Isi antrean sampai penuh
+            while not habis and len(antre) < maks_antre:
+                chunk = list(itertools.islice(iterator, chunksize))
+                if not chunk:
+                    habis = True
+                    break
+                antre.append(pool.submit(selesaikan_chunk, chunk, mode, propagasi, vektor, budget))
+            if not antre:
+                break
 
-        baris, kolom = cari_sel_kosong_mrv(papan_copy)  # Cari sel kosong pakai MRV untuk efisiensi
+            if urut:
+                yield from catat(antre.popleft())  # Tunggu chunk paling tua dulu
+            else:
+                selesai, _ = wait(antre, return_when=FIRST_COMPLETED)
+                for future in selesai:
+                    antre.remove(future)
+                    yield from catat(future)
+
+
+def selesaikan_vektor_stream(daftar_puzzle, mode, propagasi, chunksize, budget=None):
+    '''
+    Generator versi sekuensial dari jalur NumPy: puzzle dibaca per chunk (lazy),
+    diselesaikan dengan selesaikan_batch_vektor, lalu di-yield satu per satu.
+    '''
+    import itertools
 
-        if baris is None:  # jika tidak ada sel kosong lagi, berarti solusi ditemukan
-            count += 1
+    while True:
+        chunk = list(itertools.islice(daftar_puzzle, chunksize))
+        if not chunk:
             return
+        daftar_papan = [papan for _, papan in chunk]
+        for (nomor, _), ringkasan in zip(chunk, selesaikan_batch_vektor(daftar_papan, mode, propagasi, budget)):
+            yield (nomor, *ringkasan)
 
-        for tebakan in random.sample(range(1, 10), 9):  # Coba angka 1–9 secara acak
-            if apakah_valid(papan_copy, tebakan, baris, kolom):  # Cek apakah tebakan valid
-                papan_copy[baris][kolom] = tebakan  # Isi sel dengan tebakan
-                solve(papan_copy)  # Rekursi untuk lanjut ke langkah berikutnya
-                papan_copy[baris][kolom] = 0  # Backtrack: kosongkan lagi
-                if count > 1:  # Early exit kedua, buat jaga-jaga
-                    return
 
-    solve(papan_copy)  # Mulai solve
-    return count  # Kembalikan jumlah solusi yang ditemukan
+def selesaikan_dengan_trace(daftar_puzzle, mode, propagasi, folder, budget=None):
+    '''Versi sekuensial yang juga merekam trace tiap puzzle ke folder/baris_<nomor>.sdt.'''
+    for nomor, papan in daftar_puzzle:
+        trace = RekamanTrace(papan)
+        hasil = selesaikan_satu(papan, mode, propagasi, trace, budget)
+        trace.simpan(os.path.join(folder, f"baris_{nomor}.sdt"))
+        yield (nomor, *hasil)
 
 
-def generate_valid_puzzle(tingkat, seed_input=None, max_attempts=100):
+def jalankan_korpus(args):
     '''
-    Fungsi ini bertugas untuk menghasilkan puzzle Sudoku yang valid dan hanya memiliki satu solusi.
-    
-    Prosesnya dilakukan dengan mencoba generate puzzle secara acak berdasarkan seed.
-    Puzzle yang dihasilkan akan dicek:
-    1. Apakah jumlah sel kosongnya masih memungkinkan punya 1 solusi?
-    2. Apakah hasilnya benar-benar hanya punya 1 solusi?
-
-    jika gagal nemu puzzle valid setelah sejumlah percobaan, fungsi akan mengembalikan None.
+    Perintah 'korpus':
+    - pack: ubah file puzzle teks (format apa pun yang diterima baca_puzzle) jadi corpus biner KorpusBiner.
+      Record ditulis berurutan, jumlah record di header diisi setelah semua puzzle terbaca (streaming).
+    - dump: cetak isi corpus (puzzle, solusi, dan meta hasil solve) sebagai CSV.
     '''
-
-    for _ in range(max_attempts):  # Batas maksimal percobaan
+    if args.aksi == "pack":
+        sel = args.ukuran * args.ukuran
+        kosong = bytes(sel + struct.calcsize(FORMAT_META_KORPUS))  # Solusi + meta belum diisi
+        jumlah = 0
+        sumber = sys.stdin if args.input == "-" else open(args.input, newline='')
         try:
-            seed = seed_input if seed_input is not None else random.randint(0, 99999)  # Tentukan seed random
-            puzzle = Sudoku(3, seed=seed).difficulty(tingkat)  # Generate puzzle pakai library sudoku
-            
-            if puzzle is None: # Handle case ketika gagal generate puzzle
-                print(f"❌ Gagal generate puzzle setelah {max_attempts} percobaan. Seed: {seed}")
+            with open(args.output, "wb") as f:
+                f.write(struct.pack(FORMAT_HEADER_KORPUS, MAGIC_KORPUS, VERSI_KORPUS, args.ukuran, 0))
+                for _, papan in baca_puzzle(sumber, args.ukuran):
+                    f.write(bytes(angka for baris in papan for angka in baris))
+                    f.write(kosong)
+                    jumlah += 1
+                f.seek(0)
+                f.write(struct.pack(FORMAT_HEADER_KORPUS, MAGIC_KORPUS, VERSI_KORPUS, args.ukuran, jumlah))
+        finally:
+            if sumber is not sys.stdin:
+                sumber.close()
+        print(f"📦 {jumlah} puzzle ditulis ke {args.output}", file=sys.stderr)
+        return
+
+    import csv
+
+    korpus = KorpusBiner(args.input)
+    nama_status = {kode: nama or "belum" for nama, kode in KODE_STATUS_KORPUS.items()}
+    try:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(["Record", "Status", "Mode", "Langkah", "SolveNs", "Puzzle", "Solusi"])
+        akhir = len(korpus) if args.jumlah is None else min(len(korpus), args.mulai + args.jumlah)
+        for i in range(args.mulai, akhir):
+            status, mode, langkah, solve_ns = korpus.meta(i)
+            writer.writerow([i + 1, nama_status[status], NAMA_MODE.get(str(mode), ""), langkah, solve_ns,
+                             korpus.papan(i).ke_string(), korpus.solusi(i).ke_string() if status == 1 else ""])
+    finally:
+        korpus.tutup()
+
+
+def jalankan_prewarm(args):
+    '''
+    Isi store puzzle secara massal: untuk tiap level, seed dicoba berurutan mulai --seed-awal
+    sampai --jumlah puzzle valid tersedia di store. Seed yang sudah ada di store tidak di-generate ulang,
+    jadi prewarm bisa dijalankan berkali-kali (misal setelah dihentikan di tengah jalan).
+    Batas seed yang dicoba = 50x jumlah, supaya level yang sulit dipenuhi tidak jalan selamanya.
+    '''
+    store = PenyimpananPuzzle(args.store)
+    try:
+        for nama, tingkat in TINGKAT_KESULITAN.values():
+            if args.level not in ("semua", nama):
                 continue
 
-            contoh_papan = [[num if num else 0 for num in row] for row in puzzle.board]  # Ubah jadi list biasa dengan 0 untuk sel kosong
+            start = time.perf_counter_ns()
+            valid = baru = ditolak = 0
+            seed = args.seed_awal
+            while valid < args.jumlah and seed < args.seed_awal + args.jumlah * 50:
+                data = store.ambil(tingkat, seed, args.ukuran)
+                if data is None:
+                    contoh_papan, jumlah_solusi, solusi = buat_puzzle_seed(tingkat, seed, args.ukuran)
+                    store.simpan(tingkat, seed, args.ukuran, papan_ke_string(contoh_papan) if contoh_papan else "",
+                                 solusi, jumlah_solusi, commit=False)
+                    baru += 1
+                    if baru % 100 == 0:
+                        store.db.commit()  # Commit berkala, progres tidak hilang kalau dihentikan
+                else:
+                    jumlah_solusi = data[2]
+
+                if jumlah_solusi == 1:
+                    valid += 1
+                else:
+                    ditolak += 1
+                seed += 1
+
+            store.db.commit()
+            print(f"🗄️ {nama}: {valid} puzzle valid ({baru} seed baru diproses, {ditolak} seed ditolak) "
+                  f"dalam {(time.perf_counter_ns() - start) / 1e9:.2f} detik", file=sys.stderr)
+    finally:
+        store.tutup()
+
+
+# Puzzle 9x9 sulit yang dikenal, selalu ikut benchmark supaya kasus terburuk tiap mode ikut terukur
+PUZZLE_SULIT_BENCH = {
+    "inkala-2012": "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "ai-escargot": "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    "easter-monster": "100000002090400050006000700050903000000070000000850040700000600030009080002000001",
+    "golden-nugget": "000000039000001005003050800008090006070002000100400000009080050020000600400700000",
+    "platinum-blonde": "000000012000000003002300400001800005060070800000009000008500000900040500470006000",
+    "norvig-hardest": "400000805030000000000700000020000060000080400000010000000603070500200000104000000",
+    "champagne-17": "000000012000035000000600070700000300000400800100000000000120000080000040050000600",
+    "tarek-17": "000000000000003085001020000000507000004000100090000000500000073002010000000040009",
+}
+VERSI_BENCH = 1  # Versi format file JSON baseline
+
 
-            # Validasi puzzle: hanya diterima jika masih mungkin unik dan jumlah solusi tepat 1
-            if not apakah_satu_solusi(contoh_papan):
+def persentil(data_urut, p):
+    '''Persentil metode nearest-rank dari list yang sudah diurutkan (p dalam persen).'''
+    if not data_urut:
+        return 0
+    return data_urut[max(0, math.ceil(p / 100 * len(data_urut)) - 1)]
+
+
+def jalankan_bench(args):
+    '''
+    Benchmark semua mode solver dengan puzzle yang bisa direproduksi:
+    - untuk tiap level TINGKAT_KESULITAN, seed --seed-awal .. --seed-awal + --jumlah - 1 (generator native, 9x9)
+    - ditambah PUZZLE_SULIT_BENCH (kelompok "dikenal-sulit")
+
+    Tiap puzzle dijalankan --warmup kali tanpa diukur, lalu --ulang kali diukur (solve_ns dari perf_counter_ns).
+    Per kombinasi mode/kelompok dicatat median, p95, p99 waktu, median langkah & backtrack, dan throughput.
+    Hasil ditulis sebagai JSON (--output) dan bisa dibandingkan dengan perintah compare.
+    Mode naive dilewati untuk kelompok dikenal-sulit (bisa ratusan detik per puzzle) kecuali --naive-sulit.
+    '''
+    import gc
+    import json
+    import platform
+    from datetime import datetime
+
+    store = PenyimpananPuzzle(args.store) if args.store else None
+    try:
+        kelompok = {}
+        for nama, tingkat in TINGKAT_KESULITAN.values():
+            if args.level not in ("semua", nama):
                 continue
+            daftar = []
+            for seed in range(args.seed_awal, args.seed_awal + args.jumlah):
+                papan, jumlah_solusi, _ = buat_puzzle_seed(tingkat, seed, 9, store)
+                if papan is not None and jumlah_solusi == 1:
+                    daftar.append(papan_ke_string(papan))
+            kelompok[nama] = daftar
+        if not args.tanpa_dikenal:
+            kelompok["dikenal-sulit"] = list(PUZZLE_SULIT_BENCH.values())
+    finally:
+        if store is not None:
+            store.tutup()
 
-            if hitung_solusi(contoh_papan) == 1:
-                return contoh_papan, seed  # Puzzle valid dikembalikan
+    mode_dipakai = list(MODE_BATCH) if args.mode == "semua" else [args.mode]
+    hasil = {}
+    for nama_mode in mode_dipakai:
+        mode = MODE_BATCH[nama_mode]
+        for nama_kelompok, daftar in kelompok.items():
+            if nama_mode == "naive" and nama_kelompok == "dikenal-sulit" and not args.naive_sulit:
+                continue
+            waktu_ns, langkah, backtrack, backjump = [], [], [], []
+            gc.collect()
+            gc.disable()  # GC dimatikan selama pengukuran supaya jeda koleksi tidak jadi noise
+            for teks in daftar:
+                for ulang in range(args.warmup + args.ulang):
+                    papan = string_ke_papan(teks)
+                    statistik = {}
+                    sukses, n_langkah, _ = pecahkan_sudoku_anim(papan, delay=0, mode=mode,
+                                                                 propagasi=args.propagasi, statistik=statistik)
+                    if ulang < args.warmup:
+                        continue  # Warmup: isi cache geometri/memori, tidak diukur
+                    waktu_ns.append(statistik['solve_ns'])
+                    langkah.append(n_langkah)
+                    backtrack.append(statistik['backtrack'])
+                    backjump.append(statistik.get('backjump', 0))
+            gc.enable()
 
-        except Exception as e:
-            print(f"Error saat generate puzzle: {str(e)}")
+            waktu_ns.sort()
+            langkah.sort()
+            backtrack.sort()
+            backjump.sort()
+            total_ns = sum(waktu_ns)
+            kunci = f"{nama_mode}{'+cp' if args.propagasi else ''}/{nama_kelompok}"
+            hasil[kunci] = {
+                "puzzle": len(daftar),
+                "sampel": len(waktu_ns),
+                "median_ms": persentil(waktu_ns, 50) / 1e6,
+                "p95_ms": persentil(waktu_ns, 95) / 1e6,
+                "p99_ms": persentil(waktu_ns, 99) / 1e6,
+                "median_langkah": persentil(langkah, 50),
+                "maks_langkah": langkah[-1] if langkah else 0,
+                "median_backtrack": persentil(backtrack, 50),
+                "median_backjump": persentil(backjump, 50),
+                "puzzle_per_detik": len(waktu_ns) / (total_ns / 1e9) if total_ns else 0,
+            }
+            print(f"⏱️ {kunci:28} median {hasil[kunci]['median_ms']:9.3f} ms | p95 {hasil[kunci]['p95_ms']:9.3f} ms"
+                  f" | p99 {hasil[kunci]['p99_ms']:9.3f} ms | langkah {hasil[kunci]['median_langkah']:>8}"
+                  f" | {hasil[kunci]['puzzle_per_detik']:8.1f} puzzle/detik", file=sys.stderr)
 
-        if seed_input is not None:
-            break  # jika seed input manual, kita gak mau ulang-ulang (hanya 1 percobaan)
+    laporan = {
+        "versi": VERSI_BENCH,
+        "waktu": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameter": {"seed_awal": args.seed_awal, "jumlah": args.jumlah, "warmup": args.warmup,
+                      "ulang": args.ulang, "propagasi": args.propagasi},
+        "hasil": hasil,
+    }
+    if args.output == "-":
+        json.dump(laporan, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as file:
+            json.dump(laporan, file, indent=2)
+        print(f"📄 Hasil benchmark disimpan di {args.output}", file=sys.stderr)
 
-    print(f"❌ Gagal menemukan puzzle valid setelah {max_attempts} percobaan")
-    return None, None  # Gagal menghasilkan puzzle valid
+    if args.baseline:
+        with open(args.baseline) as file:
+            return bandingkan_bench(json.load(file), laporan, args.ambang)
+    return 0
 
 
-def tampilkan_papan(papan, pos_terakhir=None, papan_awal=None):
+def bandingkan_bench(baseline, baru, ambang=10.0):
     '''
-    Fungsi ini bertugas untuk menampilkan papan Sudoku ke terminal dengan format rapi.
-    Jika terminal mendukung warna, akan ditampilkan dengan:
-    - Warna merah untuk posisi sel yang terakhir diisi
-    - Warna hijau untuk angka hasil isian solver
-    - Warna putih untuk angka asli dari puzzle awal
+    Bandingkan dua laporan benchmark (dict dari JSON). Regresi = median/p95 waktu atau median langkah
+    naik lebih dari ambang persen dibanding baseline. Perubahan langkah selalu dilaporkan karena
+    langkah itu deterministik: beda langkah berarti perilaku algoritma (heuristik, validasi) berubah.
+    Return jumlah kombinasi mode/kelompok yang regresi (0 = aman, dipakai untuk exit code).
+    '''
+    from colorama import Fore, Style
+
+    if baseline.get("parameter") != baru.get("parameter"):
+        print("⚠️ Parameter benchmark berbeda, perbandingan mungkin tidak adil: "
+              f"{baseline.get('parameter')} vs {baru.get('parameter')}")
 
-    Fungsi ini juga menambahkan garis pemisah antar kotak 3x3 agar lebih mudah dibaca.
+    regresi = 0
+    for kunci, lama in baseline.get("hasil", {}).items():
+        sekarang = baru.get("hasil", {}).get(kunci)
+        if sekarang is None:
+            print(f"   {kunci:28} tidak ada di hasil baru")
+            continue
+        catatan = []
+        naik = False
+        for metrik in ("median_ms", "p95_ms", "median_langkah"):
+            nilai_lama, nilai_baru = lama[metrik], sekarang[metrik]
+            persen = (nilai_baru - nilai_lama) / nilai_lama * 100 if nilai_lama else 0.0
+            if persen > ambang:
+                catatan.append(Fore.RED + f"{metrik} +{persen:.1f}%" + Style.RESET_ALL)
+                naik = True
+            elif persen < -ambang:
+                catatan.append(Fore.GREEN + f"{metrik} {persen:.1f}%" + Style.RESET_ALL)
+            elif metrik == "median_langkah" and nilai_baru != nilai_lama:
+                catatan.append(f"langkah {nilai_lama} -> {nilai_baru}")
+        regresi += naik
+        print(f"{'❌' if naik else '✅'} {kunci:28} "
+              f"median {lama['median_ms']:.3f} -> {sekarang['median_ms']:.3f} ms  " + ", ".join(catatan))
+
+    print(f"\n{'❌' if regresi else '✅'} {regresi} regresi (ambang {ambang:g}%)")
+    return regresi
+
+
+def jalankan_compare(args):
+    '''Entry point perintah compare: python main2.py compare baseline.json hasil.json --ambang 10'''
+    import json
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.hasil) as file:
+        baru = json.load(file)
+    return bandingkan_bench(baseline, baru, args.ambang)
+
+
+def papan_dari_permintaan(puzzle, ukuran=None):
+    '''
+    Ubah field "puzzle" dari permintaan server jadi papan n x n.
+    Diterima string n*n simbol (format papan_ke_string, '.' atau '0' untuk sel kosong)
+    atau list-of-list bilangan. Ukuran ditebak dari panjangnya kalau tidak diberikan.
+    Petunjuk yang saling bentrok (angka sama di satu baris/kolom/kotak) ditolak dengan ValueError.
     '''
+    if isinstance(puzzle, str):
+        teks = puzzle.strip().replace('.', '0')
+        n = ukuran or math.isqrt(len(teks))
+        if n not in (9, 16, 25) or len(teks) != n * n:
+            raise ValueError(f"puzzle string harus 81, 256, atau 625 simbol, bukan {len(teks)}")
+        papan = string_ke_papan(teks)
+    elif isinstance(puzzle, list):
+        papan = [list(baris) for baris in puzzle]
+        n = len(papan)
+        if n not in (9, 16, 25) or (ukuran and n != ukuran) or any(len(baris) != n for baris in papan):
+            raise ValueError("puzzle list harus persegi 9x9, 16x16, atau 25x25")
+    else:
+        raise ValueError("puzzle harus string atau list-of-list")
+    if any(not isinstance(angka, int) or not 0 <= angka <= n for baris in papan for angka in baris):
+        raise ValueError(f"isi sel harus bilangan 0-{n}")
+    bentrok = PapanBitmask(papan).bentrok
+    if bentrok is not None:
+        baris, kolom = bentrok
+        raise ValueError(f"petunjuk bentrok: angka {papan[baris][kolom]} di baris {baris + 1} kolom {kolom + 1} "
+                         f"sudah ada di baris/kolom/kotaknya")
+    return papan
 
-    for i, baris in enumerate(papan):  # Loop baris
-        # Setiap 3 baris, tampilkan garis horizontal pembatas antar kotak
-        if i % 3 == 0 and i != 0:
-            print(Fore.WHITE + "-" * 21 + Style.RESET_ALL if apakah_support_warna() else "-" * 21)
-        
-        for j, angka in enumerate(baris):  # Loop kolom
-            # Setiap 3 kolom, tampilkan garis vertikal pembatas antar kotak
-            if j % 3 == 0 and j != 0:
-                print(Fore.WHITE + "|" + Style.RESET_ALL if apakah_support_warna() else "|", end=" ")
-
-            if not apakah_support_warna():
-                # jika warna tidak disupport terminal, tampilkan angka biasa atau titik untuk kosong
-                print(str(angka) if angka != 0 else '.', end=" ")
-            else:
-                # Tentukan warna berdasarkan kondisi posisi dan sumber angka
-                if pos_terakhir and (i, j) == pos_terakhir:
-                    color = Fore.RED  # Posisi terakhir yang dicoba solver
-                elif papan_awal and papan_awal[i][j] == 0 and papan[i][j] != 0:
-                    color = Fore.GREEN  # Angka hasil solver (bukan angka awal)
-                else:
-                    color = Fore.WHITE  # Angka asli dari puzzle
-                print(color + (str(angka) if angka != 0 else '.') + Style.RESET_ALL, end=" ")
-            
-        print()  # Ganti baris setelah satu baris selesai ditampilkan
 
-    
-def animasi_cli(papan, pos_terakhir=None, delay=0.03, papan_awal=None, deskripsi_mode=None):
+def budget_dari_permintaan(permintaan, nama, bulat):
     '''
-    Fungsi ini menampilkan animasi step-by-step di terminal saat solver berjalan.
-    - Membersihkan layar setiap langkah
-    - Menampilkan deskripsi mode solver (misal: Naive, MRV)
-    - Menampilkan papan saat ini (dengan warna jika didukung)
-    - Delay kecil antar langkah agar terlihat seperti animasi
+    Ambil field budget ("batas_node" / "batas_waktu") dari permintaan server, None kalau tidak ada.
+    bulat=True: harus bilangan bulat >= 0 (jumlah langkah); selain itu bilangan >= 0 (detik, jadi float).
+    Nilai lain (string, bool, negatif) ditolak dengan ValueError yang jelas.
     '''
+    nilai = permintaan.get(nama)
+    if nilai is None:
+        return None
+    jenis = (int,) if bulat else (int, float)
+    if isinstance(nilai, bool) or not isinstance(nilai, jenis) or nilai < 0:
+        raise ValueError(f"{nama} harus {'bilangan bulat' if bulat else 'bilangan'} >= 0, bukan {nilai!r}")
+    return nilai if bulat else float(nilai)
 
-    os.system('cls' if os.name == 'nt' else 'clear')  # Bersihkan layar (Windows: cls, Linux/macOS: clear)
 
-    if deskripsi_mode:
-        # Tampilkan deskripsi mode + garis pemisah
-        print(
-            deskripsi_mode + "\n" + 
-            (Fore.WHITE + "-"*30 + Style.RESET_ALL + "\n" if apakah_support_warna() else "-"*30 + "\n")
-        )
+def proses_permintaan(permintaan):
+    '''
+    Layani satu permintaan server (dict hasil parse satu baris JSON) dan kembalikan dict balasan.
+    Operasi ("op"):
+    - solve: {"puzzle", "mode" (naive/mrv/mrv-inc/dlx/cbj, default mrv), "propagasi",
+      "batas_node", "batas_waktu", "eskalasi"} -> status, solusi, langkah, durasi_ns, jalur_mode
+    - count: {"puzzle"} -> jumlah_solusi (0, 1, atau 2 = lebih dari satu), unik, solusi
+    - generate: {"level" (mudah/menengah/sulit), "seed" (opsional), "ukuran"} -> puzzle, solusi, seed
+    Field "id" dikembalikan apa adanya supaya balasan bisa dicocokkan dengan permintaannya.
+    Error apa pun dijadikan balasan {"ok": false, "error": ...}, server tetap jalan.
+    Dipakai langsung oleh proses server (tanpa --pipeline) maupun oleh worker pool.
+    '''
+    balasan = {"id": permintaan.get("id") if isinstance(permintaan, dict) else None, "ok": True}
+    try:
+        if not isinstance(permintaan, dict):
+            raise ValueError("permintaan harus object JSON")
+        op = permintaan.get("op", "solve")
+        mulai = time.perf_counter_ns()
+        if op == "solve":
+            mode = MODE_BATCH.get(permintaan.get("mode", "mrv"))
+            if mode is None:
+                raise ValueError(f"mode tidak dikenal, pilih salah satu: {', '.join(sorted(MODE_BATCH))}")
+            budget = None
+            batas_node = budget_dari_permintaan(permintaan, "batas_node", bulat=True)
+            batas_waktu = budget_dari_permintaan(permintaan, "batas_waktu", bulat=False)
+            if batas_node is not None or batas_waktu is not None or permintaan.get("eskalasi"):
+                budget = {'batas_node': batas_node, 'batas_waktu': batas_waktu,
+                          'eskalasi': bool(permintaan.get("eskalasi"))}
+            papan = papan_dari_permintaan(permintaan.get("puzzle"))
+            sukses, langkah, durasi, propagasi, solusi, jalur = selesaikan_satu(
+                papan, mode, bool(permintaan.get("propagasi")), budget=budget)
+            balasan.update(status=STATUS_SOLVE[sukses], solusi=solusi, langkah=langkah,
+                           durasi_ns=round(durasi * 1e9), propagasi=propagasi, jalur_mode=jalur)
+        elif op == "count":
+            jumlah, solusi = cek_keunikan(papan_dari_permintaan(permintaan.get("puzzle")))
+            balasan.update(jumlah_solusi=jumlah, unik=jumlah == 1, solusi=solusi)
+        elif op == "generate":
+            level = {nama: rasio for nama, rasio in TINGKAT_KESULITAN.values()}
+            if permintaan.get("level") not in level:
+                raise ValueError(f"level tidak dikenal, pilih salah satu: {', '.join(level)}")
+            ukuran = permintaan.get("ukuran", 9)
+            if ukuran not in (9, 16, 25):
+                raise ValueError("ukuran harus 9, 16, atau 25")
+            seed = permintaan.get("seed")
+            if seed is None:
+                import random
+                seed = random.randint(0, 99999)  # Sama seperti seed acak di menu interaktif
+            papan, _, solusi = buat_puzzle_seed(level[permintaan["level"]], int(seed), ukuran)
+            balasan.update(puzzle=papan_ke_string(papan), solusi=solusi, seed=int(seed))
+        else:
+            raise ValueError(f"op tidak dikenal: {op!r} (solve, count, generate)")
+        balasan.setdefault("durasi_ns", time.perf_counter_ns() - mulai)
+    except Exception as e:
+        balasan.update(ok=False, error=str(e))
+    return balasan
 
-    tampilkan_papan(papan, pos_terakhir, papan_awal)  # Tampilkan state terkini papan
-    time.sleep(delay)  # Kasih jeda animasi biar keliatan step-by-step
 
+async def layani_aliran(baca_baris, tulis, pool=None, maks_antre=1):
+    '''
+    Layani satu aliran JSON-lines (stdin atau satu koneksi socket) sampai EOF.
+    baca_baris: coroutine function yang mengembalikan satu baris bytes (b"" = EOF).
+    tulis: coroutine function yang menulis satu dict balasan sebagai satu baris JSON.
+    Tanpa pool, permintaan dikerjakan berurutan di proses ini (memo keunikan / cache tetap hangat).
+    Dengan pool (ProcessPoolExecutor), sampai maks_antre permintaan dikerjakan bersamaan dan
+    balasan ditulis begitu selesai (urutan bebas, cocokkan lewat "id").
+    '''
+    import asyncio
+    import json
 
-def landing_page():
-    os.system('cls' if os.name == 'nt' else 'clear')  # clear terminal screen
-    print("╔══════════════════════════════════════════════╗")
-    print("║                                              ║")
-    print("║     🧠 Sudoku Solver CLI with Animation      ║")
-    print("║                                              ║") 
-    print("║   📌 Dibuat oleh Kelompok 6 - DAA 2025       ║")
-    print("║   🔍 Pilih level dan lihat cara solve-nya!   ║")
-    print("║                                              ║")
-    print("╚══════════════════════════════════════════════╝")
-    print()
-    time.sleep(0.2)  # biar ga langsung lompat ke menu
+    loop = asyncio.get_running_loop()
+    slot = asyncio.Semaphore(maks_antre)  # Backpressure: baris berikutnya tidak dibaca kalau antrean penuh
+    berjalan = set()
+
+    async def kerjakan(permintaan):
+        try:
+            balasan = await loop.run_in_executor(pool, proses_permintaan, permintaan)
+        except Exception as e:  # Misal worker mati: tetap balas supaya klien tidak menunggu selamanya
+            balasan = {"id": permintaan.get("id") if isinstance(permintaan, dict) else None,
+                       "ok": False, "error": str(e)}
+        finally:
+            slot.release()
+        await tulis(balasan)
+
+    while True:
+        baris = await baca_baris()
+        if not baris:
+            break
+        if not baris.strip():
+            continue
+        try:
+            permintaan = json.loads(baris)
+        except ValueError as e:
+            await tulis({"id": None, "ok": False, "error": f"JSON tidak valid: {e}"})
+            continue
+        if pool is None:
+            await tulis(proses_permintaan(permintaan))
+            continue
+        await slot.acquire()
+        tugas = asyncio.create_task(kerjakan(permintaan))
+        berjalan.add(tugas)
+        tugas.add_done_callback(berjalan.discard)
+    if berjalan:
+        await asyncio.gather(*berjalan)
+
+
+def jalankan_server(args):
+    '''
+    Perintah 'serve': proses persisten yang menjawab permintaan JSON-lines (lihat proses_permintaan),
+    dari stdin ke stdout, atau dari Unix socket (--socket PATH, satu aliran per koneksi).
+    Import, tabel geometri, memo keunikan, dan cache kanonik cukup dibayar sekali untuk semua permintaan.
+    --pipeline N: permintaan dikerjakan N proses worker bersamaan (balasan urut selesai, bukan urut masuk).
+    '''
+    import asyncio
+    import json
+
+    if args.cache_kanonik is not None and not args.pipeline:
+        pakai_cache_kanonik(args.cache_kanonik or None)
+    geometri(9)
+
+    def ke_baris(balasan):
+        return (json.dumps(balasan, ensure_ascii=False) + "\n").encode()
+
+    async def utama(pool):
+        loop = asyncio.get_running_loop()
+        maks_antre = args.pipeline * 2 if pool else 1  # Worker tidak pernah menganggur menunggu baris berikutnya
+
+        if args.socket is None:
+            stdout = sys.stdout.buffer
+
+            async def tulis(balasan):
+                stdout.write(ke_baris(balasan))
+                stdout.flush()
+
+            # Dibaca lewat thread supaya stdin berupa file biasa juga bisa (pipe transport hanya untuk pipe/tty)
+            await layani_aliran(lambda: loop.run_in_executor(None, sys.stdin.buffer.readline),
+                                tulis, pool, maks_antre)
+            return
+
+        async def koneksi(reader, writer):
+            async def tulis(balasan):
+                writer.write(ke_baris(balasan))
+                await writer.drain()
+
+            try:
+                await layani_aliran(reader.readline, tulis, pool, maks_antre)
+            except (ConnectionError, ValueError) as e:  # Klien putus / baris melebihi limit reader
+                print(f"⚠️ Koneksi ditutup: {e}", file=sys.stderr)
+            finally:
+                writer.close()
+
+        if os.path.exists(args.socket):
+            os.remove(args.socket)  # Sisa socket dari server sebelumnya
+        server = await asyncio.start_unix_server(koneksi, args.socket, limit=1 << 20)
+        print(f"🔌 Server mendengarkan di {args.socket}", file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            os.remove(args.socket)
+
+    pool = None
+    if args.pipeline:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=args.pipeline, initializer=siapkan_worker,
+                                   initargs=(args.cache_kanonik,))
+        # Worker dibuat sebelum socket dibuka: kalau di-fork saat melayani koneksi, worker ikut memegang
+        # fd koneksi itu dan klien tidak pernah menerima EOF. Sekalian worker sudah hangat di permintaan pertama.
+        pool.submit(geometri, 9).result()
+    try:
+        asyncio.run(utama(pool))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if CACHE_SOLUSI is not None:
+            CACHE_SOLUSI.tutup()
+
+
+PERINTAH_BATCH = ("solve", "prewarm", "replay", "bench", "korpus", "compare", "serve")
+
+
+def jalankan_batch(argv):
+    '''
+    Entry point non-interaktif: python main2.py solve --mode mrv --input puzzles.txt
+
+    Puzzle dibaca secara streaming dari file atau stdin, diselesaikan dengan solver yang sama
+    (pecahkan_sudoku_anim dalam mode headless), lalu hasilnya langsung ditulis per baris
+    ke stdout atau file output dalam format CSV. Tidak ada animasi, clear screen, atau cek warna.
+
+    Dengan --jobs N (N > 1) puzzle disebar ke pool N proses worker; ringkasan throughput
+    dan statistik per worker ditulis ke stderr. Dengan --format log, baris output memakai
+    kolom yang sama dengan log_sudoku.csv sehingga bisa langsung digabung.
+    '''
+    import argparse  # Hanya dibutuhkan di mode batch
+    import csv
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(prog="main2.py", description="Sudoku Solver CLI (mode batch)")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+    # Argumen hanya dibangun untuk subcommand yang dipanggil (semua kalau belum jelas, misal -h):
+    # membangun argumen semua subcommand memakan beberapa ms di setiap panggilan one-shot
+    dipilih = argv[0] if argv and argv[0] in PERINTAH_BATCH else None
+
+    def perlu(nama):
+        return dipilih is None or dipilih == nama
+
+    solve = sub.add_parser("solve", help="Selesaikan puzzle dari file/stdin secara streaming")
+    if perlu("solve"):
+        solve.add_argument("--mode", choices=sorted(MODE_BATCH), default="mrv", help="Algoritma solver")
+        solve.add_argument("--input", default="-", help="File puzzle (default '-' = stdin)")
+        solve.add_argument("--output", default="-", help="File hasil (default '-' = stdout)")
+        solve.add_argument("--propagasi", action="store_true", help="Aktifkan constraint propagation")
+        solve.add_argument("--jobs", type=int, default=1, help="Jumlah proses worker (default 1 = sekuensial)")
+        solve.add_argument("--chunksize", type=int, default=64, help="Jumlah puzzle per kiriman ke worker")
+        solve.add_argument("--unordered", action="store_true", help="Hasil paralel boleh tidak urut (lebih cepat)")
+        solve.add_argument("--vektor", action="store_true",
+                           help="Propagasi singles serentak per chunk dengan NumPy, sisanya solver skalar")
+        solve.add_argument("--format", choices=["hasil", "log"], default="hasil",
+                           help="'hasil' = solusi + statistik, 'log' = kolom log_sudoku.csv")
+        solve.add_argument("--level", default="batch", help="Isi kolom Level untuk --format log")
+        solve.add_argument("--ukuran", type=int, choices=[9, 16, 25], default=9,
+                           help="Ukuran papan (9, 16, atau 25); --vektor hanya berlaku untuk 9x9")
+        solve.add_argument("--trace-dir", help="Simpan trace biner tiap puzzle ke folder ini (hanya mode sekuensial)")
+        solve.add_argument("--batas-node", type=int, help="Budget langkah (tebakan) per puzzle")
+        solve.add_argument("--batas-waktu", type=float, help="Budget waktu solve per puzzle dalam detik")
+        solve.add_argument("--eskalasi", action="store_true",
+                           help="Kalau budget habis, ulangi dengan mode yang lebih kuat (naive -> mrv -> dlx)")
+        solve.add_argument("--korpus", action="store_true",
+                           help="--input adalah corpus biner (hasil 'korpus pack'), dibaca lewat mmap")
+        solve.add_argument("--korpus-output", metavar="PATH",
+                           help="Salin corpus input ke PATH lalu tulis solusi + meta tiap record langsung ke situ"
+                                " (mmap); tanpa --output, CSV tidak ditulis")
+        solve.add_argument("--split", type=int, metavar="N",
+                           help="Pecah pohon pencarian tiap puzzle ke N proses (untuk puzzle yang sangat berat)")
+        solve.add_argument("--cache-kanonik", nargs="?", const="", metavar="PATH",
+                           help="Cache solusi per bentuk kanonik (puzzle setara hasil permutasi/relabel langsung"
+                                " dijawab); tanpa PATH = di memori saja, dengan PATH = disimpan ke file SQLite")
+        solve.add_argument("--profile", action="store_true",
+                           help="Profil fungsi panas + histogram per kedalaman ke stderr (hanya mode sekuensial)")
+        solve.add_argument("--profile-output", help="Tulis collapsed stack (untuk flamegraph) ke file ini")
+    prewarm = sub.add_parser("prewarm", help="Isi store puzzle dengan N puzzle valid per level")
+    if perlu("prewarm"):
+        prewarm.add_argument("--jumlah", type=int, default=100, help="Jumlah puzzle valid per level")
+        prewarm.add_argument("--level", choices=["semua"] + [nama for nama, _ in TINGKAT_KESULITAN.values()],
+                             default="semua", help="Level yang diisi")
+        prewarm.add_argument("--ukuran", type=int, choices=[9, 16, 25], default=9, help="Ukuran papan")
+        prewarm.add_argument("--store", default=FILE_STORE_PUZZLE, help="File SQLite store puzzle")
+        prewarm.add_argument("--seed-awal", type=int, default=0, help="Seed pertama yang dicoba")
+    replay = sub.add_parser("replay", help="Putar ulang file trace hasil --trace-dir / mode interaktif")
+    if perlu("replay"):
+        replay.add_argument("file", help="File trace (.sdt)")
+        replay.add_argument("--delay", type=float, default=0.03, help="Jeda antar frame dalam detik")
+        replay.add_argument("--lewati", type=int, default=1, help="Gambar hanya setiap K event (K >= 1)")
+        replay.add_argument("--mulai", type=int, default=0, help="Lompat ke langkah ke-N sebelum mulai animasi")
+        replay.add_argument("--diam", action="store_true", help="Tampilkan papan di langkah --mulai saja")
+        replay.add_argument("--ringkasan", action="store_true", help="Cetak statistik trace saja")
+    bench = sub.add_parser("bench", help="Benchmark semua mode pada seed tetap + puzzle sulit yang dikenal")
+    if perlu("bench"):
+        bench.add_argument("--mode", choices=["semua"] + sorted(MODE_BATCH), default="semua", help="Mode yang diukur")
+        bench.add_argument("--level", choices=["semua"] + [nama for nama, _ in TINGKAT_KESULITAN.values()],
+                           default="semua", help="Level yang diukur")
+        bench.add_argument("--seed-awal", type=int, default=0, help="Seed pertama per level")
+        bench.add_argument("--jumlah", type=int, default=20, help="Jumlah seed per level")
+        bench.add_argument("--warmup", type=int, default=1, help="Run tanpa diukur per puzzle")
+        bench.add_argument("--ulang", type=int, default=3, help="Run yang diukur per puzzle")
+        bench.add_argument("--propagasi", action="store_true", help="Aktifkan constraint propagation")
+        bench.add_argument("--tanpa-dikenal", action="store_true", help="Jangan ikutkan puzzle sulit yang dikenal")
+        bench.add_argument("--naive-sulit", action="store_true", help="Ikutkan mode naive di puzzle sulit (lambat)")
+        bench.add_argument("--store", help="File SQLite store puzzle (opsional, mempercepat pembuatan puzzle)")
+        bench.add_argument("--output", default="-", help="File JSON hasil (default '-' = stdout)")
+        bench.add_argument("--baseline", help="Langsung bandingkan dengan file JSON baseline ini")
+        bench.add_argument("--ambang", type=float, default=10.0, help="Ambang regresi dalam persen")
+    korpus = sub.add_parser("korpus", help="Buat / baca corpus puzzle biner (record tetap, dibuka dengan mmap)")
+    if perlu("korpus"):
+        korpus.add_argument("aksi", choices=["pack", "dump"], help="pack = teks -> biner, dump = biner -> CSV")
+        korpus.add_argument("input", help="File input (pack: teks, '-' = stdin; dump: corpus biner)")
+        korpus.add_argument("output", nargs="?", help="File corpus biner hasil pack")
+        korpus.add_argument("--ukuran", type=int, choices=[9, 16, 25], default=9, help="Ukuran papan (pack)")
+        korpus.add_argument("--mulai", type=int, default=0, help="Record pertama yang dicetak (dump, mulai 0)")
+        korpus.add_argument("--jumlah", type=int, help="Jumlah record yang dicetak (dump)")
+    compare = sub.add_parser("compare", help="Bandingkan dua file JSON hasil bench dan tandai regresi")
+    if perlu("compare"):
+        compare.add_argument("baseline", help="File JSON baseline")
+        compare.add_argument("hasil", help="File JSON hasil baru")
+        compare.add_argument("--ambang", type=float, default=10.0, help="Ambang regresi dalam persen")
+    serve = sub.add_parser("serve", help="Server persisten: permintaan JSON-lines dari stdin atau Unix socket")
+    if perlu("serve"):
+        serve.add_argument("--socket", metavar="PATH", help="Dengarkan di Unix socket ini (default: stdin/stdout)")
+        serve.add_argument("--pipeline", type=int, metavar="N",
+                           help="Kerjakan sampai 2N permintaan bersamaan di N proses worker (balasan urut selesai)")
+        serve.add_argument("--cache-kanonik", nargs="?", const="", metavar="PATH",
+                           help="Cache solusi per bentuk kanonik (lihat solve --cache-kanonik)")
+    args = parser.parse_args(argv)
+
+    if args.perintah == "serve":
+        if args.socket and not hasattr(__import__("socket"), "AF_UNIX"):
+            parser.error("--socket butuh Unix socket (tidak tersedia di platform ini)")
+        jalankan_server(args)
+        return
+    if args.perintah == "prewarm":
+        jalankan_prewarm(args)
+        return
+    if args.perintah == "replay":
+        if args.lewati < 1:
+            parser.error("--lewati harus bilangan bulat >= 1")
+        jalankan_replay(args)
+        return
+    if args.perintah == "korpus":
+        if args.aksi == "pack" and not args.output:
+            parser.error("korpus pack butuh file output")
+        jalankan_korpus(args)
+        return
+    if args.perintah in ("bench", "compare"):
+        regresi = jalankan_bench(args) if args.perintah == "bench" else jalankan_compare(args)
+        sys.exit(1 if regresi else 0)  # Exit code 1 kalau ada regresi, supaya bisa dipakai di CI
+    if args.trace_dir and (args.jobs > 1 or args.vektor):
+        parser.error("--trace-dir hanya bisa dipakai tanpa --jobs dan --vektor")
+    profil = ProfilSolver() if args.profile or args.profile_output else None
+    if profil and (args.jobs > 1 or args.vektor):
+        parser.error("--profile hanya bisa dipakai tanpa --jobs dan --vektor")
+
+    if args.split and (args.jobs > 1 or args.vektor or args.trace_dir or profil or args.batas_node is not None
+                       or args.batas_waktu is not None or args.eskalasi):
+        parser.error("--split tidak bisa digabung dengan --jobs, --vektor, --trace-dir, --profile, atau budget")
+    if args.split and args.mode == "cbj":
+        parser.error("--split tidak mendukung mode cbj (backjump melintasi batas subtree)")
+
+    if args.korpus_output and not args.korpus:
+        parser.error("--korpus-output hanya bisa dipakai dengan --korpus")
+    if args.korpus and args.input == "-":
+        parser.error("--korpus butuh file --input (mmap tidak bisa dari stdin)")
+
+    mode = MODE_BATCH[args.mode]
+    mode_nama = NAMA_MODE[mode] + (" + CP" if args.propagasi else "")
+    budget = None
+    if args.batas_node is not None or args.batas_waktu is not None or args.eskalasi:
+        budget = {'batas_node': args.batas_node, 'batas_waktu': args.batas_waktu, 'eskalasi': args.eskalasi}
+    if args.cache_kanonik is not None and args.jobs <= 1:
+        pakai_cache_kanonik(args.cache_kanonik or None)
+    keluaran = None  # KorpusBiner output (--korpus-output)
+    if args.korpus:
+        sumber = None
+        header = KorpusBiner(args.input)
+        args.ukuran = header.n  # Ukuran papan diambil dari header corpus
+        header.tutup()
+        daftar_puzzle = baca_korpus(args.input)
+        if args.korpus_output:
+            import shutil
+            shutil.copyfile(args.input, args.korpus_output)  # Output sudah teralokasi penuh, berisi puzzle
+            keluaran = KorpusBiner(args.korpus_output, tulis=True)
+    else:
+        sumber = sys.stdin if args.input == "-" else open(args.input, newline='')
+        daftar_puzzle = baca_puzzle(sumber, args.ukuran)
+    tulis_csv = not (keluaran and args.output == "-")
+    tujuan = sys.stdout if args.output == "-" else open(args.output, "w", newline='')
+
+    statistik_worker = {}
+    jumlah = 0
+    jumlah_cache = 0
+    start = time.perf_counter_ns()
+
+    if profil:
+        profil.pasang()
+    try:
+        if args.jobs > 1:
+            hasil = selesaikan_paralel(daftar_puzzle, mode, args.propagasi, args.jobs,
+                                       args.chunksize, not args.unordered, statistik_worker, args.vektor, budget,
+                                       args.cache_kanonik)
+        elif args.vektor:
+            hasil = selesaikan_vektor_stream(daftar_puzzle, mode, args.propagasi, args.chunksize,
+                                             budget)
+        elif args.trace_dir:
+            os.makedirs(args.trace_dir, exist_ok=True)
+            hasil = selesaikan_dengan_trace(daftar_puzzle, mode, args.propagasi, args.trace_dir,
+                                            budget)
+        else:
+            hasil = ((nomor, *selesaikan_satu(papan, mode, args.propagasi, budget=budget, split=args.split))
+                     for nomor, papan in daftar_puzzle)
+
+        writer = csv.writer(tujuan)
+        if tulis_csv and args.format == "log":
+            writer.writerow(KOLOM_LOG)
+        elif tulis_csv:
+            writer.writerow(["Baris", "Mode", "Sukses", "Langkah", "Durasi", "Propagasi", "Solusi", "JalurMode"])
+
+        for nomor_baris, sukses, langkah, durasi, propagasi, solusi, jalur in hasil:
+            jumlah += 1
+            jumlah_cache += jalur == "cache"
+            if keluaran:
+                # Nomor dari baca_korpus = indeks record + 1
+                keluaran.tulis_hasil(nomor_baris - 1, solusi, STATUS_SOLVE[sukses], mode, langkah, round(durasi * 1e9))
+            if not tulis_csv:
+                continue
+            if args.format == "log":
+                if sukses is False:
+                    continue  # Sama seperti mode interaktif: hanya solve sukses / budget habis yang dicatat
+                # Puzzle dari file tidak punya seed dan tidak di-generate / dicek keunikannya
+                kolom = {
+                    "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "Level": args.level,
+                    "Mode": mode_nama,
+                    "Langkah": langkah,
+                    "Durasi": f"{durasi:.6f}",
+                    "Animasi": "Tidak",
+                    "Propagasi": propagasi,
+                    "Ukuran": f"{args.ukuran}x{args.ukuran}",
+                    "Versi": VERSI_SKEMA_LOG,
+                    "SolveNs": round(durasi * 1e9),
+                    "Status": STATUS_SOLVE[sukses],
+                    "JalurMode": jalur,
+                }
+                writer.writerow([kolom.get(nama, "") for nama in KOLOM_LOG])
+            else:
+                writer.writerow([
+                    nomor_baris,
+                    mode_nama,
+                    {True: "Ya", False: "Tidak", None: "Budget"}[sukses],
+                    langkah,
+                    f"{durasi:.6f}",
+                    propagasi,
+                    solusi,
+                    jalur
+                ])
+    finally:
+        if sumber is not None and sumber is not sys.stdin:
+            sumber.close()
+        if tujuan is not sys.stdout:
+            tujuan.close()
+        if keluaran:
+            keluaran.tutup()
+        if profil:
+            profil.lepas()
+
+    if profil:
+        profil.laporan()
+        if args.profile_output:
+            profil.simpan_terlipat(args.profile_output)
+            print(f"🔥 Collapsed stack disimpan di {args.profile_output} (flamegraph.pl / speedscope)", file=sys.stderr)
 
+    # Ringkasan throughput ke stderr supaya tidak mencampuri output CSV
+    total = (time.perf_counter_ns() - start) / 1e9
+    print(f"🧩 {jumlah} puzzle dalam {total:.2f} detik ({jumlah / total if total else 0:.1f} puzzle/detik)",
+          file=sys.stderr)
+    for pid, (banyak, durasi_solve) in sorted(statistik_worker.items()):
+        print(f"   worker {pid}: {banyak} puzzle, waktu solve {durasi_solve:.2f} detik", file=sys.stderr)
+    if args.cache_kanonik is not None:
+        print(f"🗃️  Cache kanonik: {jumlah_cache} dari {jumlah} puzzle dijawab dari cache", file=sys.stderr)
+    if CACHE_SOLUSI is not None:
+        CACHE_SOLUSI.tutup()
 
-def main():
+
+def main(profil=None):
     '''
     Fungsi utama program CLI Sudoku Solver.
     Menampilkan landing page, meminta input level kesulitan, seed puzzle, serta mode algoritma yang diinginkan.
     Melakukan solving dengan animasi opsional, dan mencatat hasil solving ke file log.
+    profil (ProfilSolver) opsional dari 'python main2.py --profile': setiap solve diprofil,
+    laporannya dicetak dan collapsed stack disimpan ke profil_{seed}_mode{mode}.folded.
     '''
+    from colorama import init, Fore, Style  # Mode interaktif selalu butuh warna
+
     try:
         init(autoreset=True, strip=False) # Inisialisasi ANSI color di terminal
         if sys.platform == 'win32': os.system('color') # Fix warna di CMD Windows
 
+        # Buka store puzzle (seed yang pernah dipakai tidak perlu di-generate ulang)
+        try:
+            store = PenyimpananPuzzle()
+        except Exception as e:
+            print(f"⚠️ Store puzzle tidak bisa dibuka ({e}), puzzle akan selalu di-generate ulang.")
+            store = None
+
+        # Producer background: puzzle 9x9 untuk semua level langsung disiapkan selagi user memilih menu
+        antrean = AntreanPuzzle(store_path=FILE_STORE_PUZZLE if store is not None else None)
+        for _, tingkat in TINGKAT_KESULITAN.values():
+            antrean.minta(tingkat)
+
+        # Log metrik di-buffer: file tidak dibuka ulang per puzzle, sisa buffer ditulis saat program keluar
+        log = PenulisLog()
+
         while True:
             landing_page() # Tampilkan fungsi landing_page()
         
@@ -409,20 +4348,20 @@ def main():
                 print("Keluar Program!.")
                 sys.exit(0) # Keluar program jika user pilih opsi ke-4
 
-            # Mapping level input ke tingkat kesulitan dan persentase angka kosong
-            tingkat_kesulitan = {
-                '1': ('mudah', 0.3),      # Mudah → 30% sel kosong
-                '2': ('menengah', 0.4),   # Menengah → 40% sel kosong
-                '3': ('sulit', 0.60)      # Sulit → 60% sel kosong
-            }
-
-            # Cek apakah input level valid (ada di dictionary tingkat_kesulitan)
-            if level_input not in tingkat_kesulitan:
+            # Cek apakah input level valid (ada di dictionary TINGKAT_KESULITAN)
+            if level_input not in TINGKAT_KESULITAN:
                 print("❌ Level tidak dikenali. Coba lagi!.")
                 continue  # Balik ke atas loop untuk minta input ulang
 
             # Ambil label level dan persentase angka kosong berdasarkan input user
-            level, tingkat = tingkat_kesulitan[level_input]
+            level, tingkat = TINGKAT_KESULITAN[level_input]
+
+            # Pilih ukuran papan (9x9 klasik atau varian besar untuk uji beban solver)
+            print("\n- Pilih ukuran papan:")
+            print("1. 9x9 (klasik)")
+            print("2. 16x16")
+            print("3. 25x25")
+            ukuran = {'2': 16, '3': 25}.get(input("Pilihan (1-3, default 1): ").strip(), 9)
 
             print("\n- Pilih Seed?")
             print("1. 🎲 Acak (Random)")
@@ -456,22 +4395,31 @@ def main():
                 Jika gagal menemukan puzzle setelah 100 kali percobaan, user akan disuruh ulangi.
                 Puzzle yang valid lalu ditampilkan ke layar sebagai papan awal.
                 '''
-                # Generate puzzle valid dengan tingkat kesulitan yang dipilih user, dan seed (acak atau manual)
-                contoh_papan, seed = generate_valid_puzzle(tingkat, seed_user)
+                # Seed acak: pakai puzzle yang sudah disiapkan producer background kalau ada
+                mulai_ns = time.perf_counter_ns()  # Waktu generate (termasuk ambil dari antrean/store)
+                siap = antrean.ambil(tingkat, ukuran) if seed_user is None else None
+                if siap is not None:
+                    contoh_papan, seed = siap
+                else:
+                    # Generate puzzle valid dengan tingkat kesulitan yang dipilih user, dan seed (acak atau manual)
+                    contoh_papan, seed = generate_valid_puzzle(tingkat, seed_user, ukuran=ukuran, store=store)
+                generate_ns = time.perf_counter_ns() - mulai_ns
 
                 # jika gagal generate puzzle (hasil None), ulangi proses
                 if contoh_papan is None:
                     print("❌ Gagal menemukan puzzle dengan 1 solusi setelah 100 percobaan.")
                     continue
 
-                # Hitung jumlah solusi dari puzzle yang berhasil dibuat (seharusnya selalu 1)
+                # Jumlah solusi dari puzzle yang berhasil dibuat (seharusnya selalu 1), diambil dari memo cek_keunikan
+                mulai_ns = time.perf_counter_ns()
                 solusi = hitung_solusi(contoh_papan)
+                cek_unik_ns = time.perf_counter_ns() - mulai_ns
 
                 # Tampilkan info seed dan jumlah solusi
                 print(f"\n🧬 Seed yang digunakan: ({seed}) dan memiliki {solusi} solusi.")
 
                 # Salin papan awal untuk referensi saat animasi/visualisasi
-                papan_awal = copy.deepcopy(contoh_papan)
+                papan_awal = salin_papan(contoh_papan)
 
                 # Tampilkan puzzle Sudoku ke user di terminal
                 print("\nPuzzle Sudoku:")
@@ -481,13 +4429,19 @@ def main():
                 print("\n- Pilih mode algoritma:")
                 print("1. 🔁 (Backtracking Naive)")
                 print("2. 🔁 + 🧠 (Backtracking + MRV)")
+                print("3. 🔁 + ⚡ (Backtracking + MRV Incremental)")
+                print("4. 🔗 (Dancing Links / Algorithm X)")
+                print("5. 🔁 + 🦘 (Backtracking + Backjumping & Nogood)")
                 print("q. 🔙 Kembali ke pilihan level")
-                mode = input("Masukkan mode (1/2/q): ").strip() # Input mode
+                mode = input("Masukkan mode (1/2/3/4/5/q): ").strip() # Input mode
 
                 '''
                 Bagian ini menangani input user untuk memilih mode algoritma yang akan digunakan:
                 1. Backtracking biasa
                 2. Backtracking dengan MRV heuristic
+                3. Backtracking dengan MRV incremental (bucket + tie-break derajat)
+                4. Dancing Links (Algorithm X, exact cover)
+                5. Conflict-directed backjumping + nogood learning (MRV)
 
                 jika input tidak valid, user diminta ulang. jika input 'q', kembali ke pemilihan level.
                 '''
@@ -495,15 +4449,18 @@ def main():
                 if mode == 'q':
                     break  # kembali ke pemilihan level/kesulitan
 
-                # Validasi input mode (hanya boleh 1 atau 2)
-                if mode not in ['1', '2']:
+                # Validasi input mode (hanya boleh 1 sampai 5)
+                if mode not in ['1', '2', '3', '4', '5']:
                     print("❌ Mode tidak valid. Coba lagi!.")
                     continue  # ulangi input mode
 
                 # Deskripsi mode yang akan ditampilkan di CLI (pakai warna biar menarik)
                 deskripsi_mode = {
                     '1': Fore.YELLOW + "\n🔁 Mode: Backtracking Biasa" + Style.RESET_ALL,
-                    '2': Fore.CYAN + "\n🔁 + 🧠 Mode: BT + MRV" + Style.RESET_ALL
+                    '2': Fore.CYAN + "\n🔁 + 🧠 Mode: BT + MRV" + Style.RESET_ALL,
+                    '3': Fore.MAGENTA + "\n🔁 + ⚡ Mode: BT + MRV Incremental" + Style.RESET_ALL,
+                    '4': Fore.BLUE + "\n🔗 Mode: Dancing Links" + Style.RESET_ALL,
+                    '5': Fore.GREEN + "\n🔁 + 🦘 Mode: Backjumping + Nogood" + Style.RESET_ALL
                 }.get(mode, "")  # jika mode tidak dikenali, default ke string kosong
 
 
@@ -517,21 +4474,66 @@ def main():
                 jawab = input("Aktifkan animasi? (y/n): ").strip().lower()
                 animasi = jawab == 'y'  # True kalau jawab 'y', False kalau tidak
 
+                # Tanya user apakah ingin memakai constraint propagation (singles + locked candidates)
+                jawab = input("Aktifkan propagasi kendala? (y/n): ").strip().lower()
+                propagasi = jawab == 'y'
+
+                # Trace biner: semua langkah solver direkam ke file, bisa diputar ulang dengan perintah replay
+                jawab = input("Simpan trace solving untuk replay? (y/n): ").strip().lower()
+                trace = RekamanTrace(contoh_papan) if jawab == 'y' else None
+
+                # Budget waktu per solve: kalau habis, solve diulang dengan mode yang lebih kuat (ESKALASI_MODE)
+                batas_waktu = None
+                jawab = input("Batas waktu solve dalam detik (Enter = tanpa batas): ").strip()
+                if jawab:
+                    try:
+                        batas_waktu = float(jawab)
+                    except ValueError:
+                        print("❌ Batas waktu tidak valid, solve dijalankan tanpa batas.")
+
                 langkah = 0  # Inisialisasi penghitung langkah
-                start = time.time()  # Catat waktu mulai
+                statistik = {}  # Diisi solver: propagasi, backtrack, kedalaman_maks, cek_validitas, solve_ns
+
+                # Tanpa animasi, durasi yang dicatat murni waktu solver: producer background dijeda dulu
+                if not animasi:
+                    antrean.jeda()
+
+                if profil:
+                    profil.reset()
+                    profil.pasang()  # Instrumentasi hanya terpasang selama solve ini
 
                 # Jalankan solver animasi berdasarkan mode yang dipilih
-                sukses, langkah, durasi = pecahkan_sudoku_anim(
-                    contoh_papan,
-                    delay=0.03 if animasi else 0,  # Delay animasi jika aktif
-                    papan_awal=papan_awal,
-                    deskripsi_mode=deskripsi_mode,
-                    mode=mode
-                )
+                try:
+                    sukses, langkah, durasi = pecahkan_dengan_eskalasi(
+                        contoh_papan,
+                        mode,
+                        eskalasi=batas_waktu is not None,
+                        delay=0.03 if animasi else 0,  # Delay animasi jika aktif
+                        papan_awal=papan_awal,
+                        deskripsi_mode=deskripsi_mode,
+                        propagasi=propagasi,
+                        statistik=statistik,
+                        trace=trace,
+                        batas_waktu=batas_waktu
+                    )
+                finally:
+                    if profil:
+                        profil.lepas()
+                antrean.lanjut()
+
+                if profil:
+                    profil.laporan(sys.stdout)
+                    file_profil = f"profil_{seed}_mode{mode}.folded"
+                    profil.simpan_terlipat(file_profil)
+                    print(f"\n🔥 Collapsed stack disimpan di {file_profil} (flamegraph.pl / speedscope)")
+
+                if trace is not None:
+                    file_trace = f"trace_{seed}_mode{mode}.sdt"
+                    trace.simpan(file_trace)
+                    print(f"\n🎬 Trace disimpan di {file_trace} (putar ulang: python main2.py replay {file_trace})")
 
                 # Cek apakah solving berhasil
                 if sukses:
-                    durasi = time.time() - start  # Hitung durasi waktu solving
                     print(f"\n🧬 Seed yang digunakan: ({seed}) dan memiliki {solusi} solusi.")
                     
                     # Tampilkan emoji level kesulitan sesuai level
@@ -541,37 +4543,54 @@ def main():
                     print("\n✅ Sudoku berhasil dipecahkan!")
                     print(f"{emoji_level.get(level, '')} Kesulitan Sudoku: {level.capitalize()}")
                     print(f"🧩 Total langkah: {langkah}") # Info Langkah
-                    print(f"⏱️ Waktu: {durasi:.2f} detik") # Info Durasi
+                    if propagasi:
+                        print(f"🧲 Isian propagasi: {statistik.get('propagasi', 0)}")  # Info sel hasil deduksi
+                    print(f"⏱️ Waktu: {durasi:.6f} detik") # Info Durasi (murni solver, dari perf_counter_ns)
+                    print(f"📊 Backtrack: {statistik.get('backtrack', 0)} | "
+                          f"Kedalaman maks: {statistik.get('kedalaman_maks', 0)} | "
+                          f"Generate: {generate_ns / 1e6:.1f} ms | Cek unik: {cek_unik_ns / 1e6:.1f} ms")
+                    if 'backjump' in statistik:
+                        print(f"🦘 Backjump: {statistik['backjump']} (melewati {statistik['tingkat_dilompati']} tingkat)"
+                              f" | Nogood: {statistik['nogood']} dipelajari, {statistik['pangkas_nogood']} pangkas")
                     print(f"🎞️ Animasi aktif: {'Ya' if animasi else 'Tidak'}")  # Info animasi
+                elif sukses is None:
+                    # Semua mode di rantai eskalasi kehabisan budget waktu
+                    print(f"\n⏳ Budget waktu {batas_waktu:g} detik habis (mode dicoba: {statistik['jalur_mode']}).")
+                else:
+                    # Kalau solving gagal
+                    print("\n❌ Sudoku tidak bisa diselesaikan.")
 
-                    # Logging hasil solving ke file CSV
-                    log_file = "log_sudoku.csv"
-                    file_exists = os.path.isfile(log_file)  # Cek apakah file log sudah ada
+                if sukses is not False:
+                    if statistik['jalur_mode'] != mode:
+                        print(f"🪜 Eskalasi mode: {statistik['jalur_mode']}")
 
+                    # Logging hasil solving ke file CSV + JSON Lines (di-buffer, di-flush per batch / saat keluar)
                     # Mapping nama mode dari input ke string yang lebih readable
-                    mode_nama = {
-                        '1': "Naive",
-                        '2': "BT + MRV"
-                    }.get(mode, "Unknown")  # fallback default kalau mode gak dikenal
+                    mode_nama = NAMA_MODE.get(mode, "Unknown")  # fallback default kalau mode gak dikenal
+                    if propagasi:
+                        mode_nama += " + CP"  # Bedakan run dengan constraint propagation di grafik
 
                     # Tulis data log ke file
-                    with open(log_file, mode='a', newline='') as file:
-                        writer = csv.writer(file)
-                        if not file_exists:
-                            # Tulis header jika file belum ada
-                            writer.writerow(["Timestamp", "Level", "Mode", "Langkah", "Durasi", "Seed", "Animasi"])
-                        writer.writerow([
-                            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            level,
-                            mode_nama,
-                            langkah,
-                            f"{durasi:.2f}",
-                            seed,
-                            "Ya" if animasi else "Tidak"
-                        ])
-                else:
-                    # Kalau solving gagal
-                    print("\n❌ Sudoku tidak bisa diselesaikan.")
+                    log.tulis(
+                        Level=level,
+                        Mode=mode_nama,
+                        Langkah=langkah,
+                        Durasi=f"{durasi:.6f}",
+                        Seed=seed,
+                        Animasi="Ya" if animasi else "Tidak",
+                        Propagasi=statistik.get('propagasi', 0),
+                        Ukuran=f"{ukuran}x{ukuran}",
+                        GenerateNs=generate_ns,
+                        CekUnikNs=cek_unik_ns,
+                        SolveNs=statistik.get('solve_ns', 0),
+                        Backtrack=statistik.get('backtrack', 0),
+                        KedalamanMaks=statistik.get('kedalaman_maks', 0),
+                        Backjump=statistik.get('backjump', 0),
+                        PangkasNogood=statistik.get('pangkas_nogood', 0),
+                        CekValiditas=statistik.get('cek_validitas', 0),
+                        Status=statistik['status'],
+                        JalurMode=statistik['jalur_mode']
+                    )
 
 
                 # Main lagi atau keluar
@@ -585,6 +4604,11 @@ def main():
         print(f"Terjadi error: {str(e)}")  # Tampilkan pesan error
         sys.exit(1)  # Keluar dengan kode error
 
-# Entry point program: kalau file ini dijalankan langsung, panggil main()
+# Entry point program: tanpa argumen jalankan CLI interaktif, dengan argumen (misal 'solve') jalankan mode batch
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    if sys.argv[1:] == ["--profile"]:
+        main(ProfilSolver())  # CLI interaktif dengan profil per solve
+    elif len(sys.argv) > 1:
+        jalankan_batch(sys.argv[1:])
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,52 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def valid_lengkap(papan, awal):
+    '''Cek solusi: semua baris/kolom/kotak berisi 1..9 dan petunjuk awal tidak berubah.'''
+    lengkap = set(range(1, 10))
+    for i in range(9):
+        if set(papan[i]) != lengkap or {papan[r][i] for r in range(9)} != lengkap:
+            return False
+    for kb in range(0, 9, 3):
+        for kk in range(0, 9, 3):
+            if {papan[kb + r][kk + c] for r in range(3) for c in range(3)} != lengkap:
+                return False
+    return all(not awal[r][c] or awal[r][c] == papan[r][c] for r in range(9) for c in range(9))
+
+
+def test_nogood_satu_literal_memangkas():
+    pencarian = main2.PencarianCBJ(main2.string_ke_papan(PUZZLE))
+    jenis, baris, kolom, angka = next(pencarian.event())
+    assert jenis == 'isi'
+
+    pencarian.pelajari({0})  # Conflict set hanya berisi tingkat 0: nogood satu literal
+    idx = baris * 9 + kolom
+    assert (idx * 64 + angka,) in pencarian.nogood
+    assert pencarian.langgar_nogood(idx, angka) == set()
+
+    # Setelah tebakan dibatalkan pun literalnya tetap terlarang
+    pencarian.berlaku.discard(idx * 64 + angka)
+    assert pencarian.langgar_nogood(idx, angka) == set()
+
+
+def test_cbj_solusi_valid():
+    awal = main2.string_ke_papan(PUZZLE)
+    pencarian = main2.PencarianCBJ(main2.string_ke_papan(PUZZLE))
+    assert pencarian.jalankan()
+    assert pencarian.sukses
+    assert valid_lengkap(pencarian.solusi_pertama, awal)
+
+
+def test_cbj_petunjuk_bentrok_gagal():
+    papan = main2.string_ke_papan('55' + PUZZLE[2:])
+    pencarian = main2.PencarianCBJ(papan)
+    assert pencarian.jalankan()
+    assert not pencarian.sukses
+    assert pencarian.langkah == 0
@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def test_hitung_unik():
+    papan = main2.string_ke_papan(PUZZLE)
+    asli = main2.salin_papan(papan)
+    assert main2.hitung_solusi_dlx(papan) == 1
+    assert papan == asli
+
+
+def test_hitung_berhenti_di_batas():
+    papan = main2.string_ke_papan(PUZZLE)
+    papan[0][0] = papan[1][2] = papan[1][3] = 0
+    assert main2.hitung_solusi_dlx(papan) == 2
+    assert main2.hitung_solusi_dlx(papan, batas=5) == 5
+
+
+def test_hitung_tanpa_solusi():
+    bentrok = main2.string_ke_papan(PUZZLE)
+    bentrok[0][1] = 8  # Dua angka 8 di baris pertama
+    assert main2.hitung_solusi_dlx(bentrok) == 0
+
+    buntu = [[0] * 9 for _ in range(9)]
+    buntu[0][:8] = range(1, 9)
+    buntu[1][8] = 9  # Sel (0, 8) tidak punya kandidat
+    assert main2.hitung_solusi_dlx(buntu) == 0
+
+
+def test_tulis_meninggalkan_solusi_di_papan():
+    papan = main2.string_ke_papan(PUZZLE)
+    solver = main2.SolverDLX(papan)
+    assert solver.cari(batas=1) == 1
+    assert papan == solver.solusi_pertama
+    assert main2.PapanBitmask(papan).bentrok is None
+    assert all(all(baris) for baris in papan)
+
+
+def test_papan_besar_tanpa_rekursi():
+    # 25x25 kosong: ratusan tingkat keputusan berturut-turut, semuanya di stack eksplisit
+    papan = [[0] * 25 for _ in range(25)]
+    solver = main2.SolverDLX(papan)
+    assert solver.cari(batas=1, tulis=False) == 1
+    assert main2.PapanBitmask(solver.solusi_pertama).bentrok is None
+
+
+def test_batas_langkah_memotong_pencarian():
+    solver = main2.SolverDLX(main2.string_ke_papan(PUZZLE))
+    assert solver.cari(batas=1, tulis=False, batas_langkah=5) == 0
+    assert solver.terpotong
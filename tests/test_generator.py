@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 42])
+def test_puzzle_native_unik_dan_sesuai_solusi(seed):
+    papan, solusi = main2.buat_puzzle_native(9, 30, seed)
+    assert main2.hitung_solusi_dlx(papan) == 1
+    assert main2.PapanBitmask(solusi).bentrok is None
+    assert all(not papan[r][c] or papan[r][c] == solusi[r][c] for r in range(9) for c in range(9))
+
+    solver = main2.SolverDLX(papan)
+    solver.cari(batas=1, tulis=False)
+    assert solver.solusi_pertama == solusi
+    assert sum(1 for baris in papan for angka in baris if angka) >= 30
+
+
+def test_seed_sama_hasil_sama():
+    assert main2.buat_puzzle_native(9, 30, 7) == main2.buat_puzzle_native(9, 30, 7)
+    assert main2.buat_puzzle_native(9, 30, 7) != main2.buat_puzzle_native(9, 30, 8)
+
+
+def test_tunggu_tidak_mengubah_hasil():
+    panggilan = []
+    hasil = main2.buat_puzzle_native(9, 30, 5, tunggu=lambda: panggilan.append(1))
+    assert panggilan
+    assert hasil == main2.buat_puzzle_native(9, 30, 5)
+
+
+def test_puzzle_16x16_unik():
+    papan, solusi = main2.buat_puzzle_native(16, 160, 1)
+    assert main2.hitung_solusi_dlx(papan) == 1
+    assert all(not papan[r][c] or papan[r][c] == solusi[r][c] for r in range(16) for c in range(16))
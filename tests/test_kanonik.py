@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def acak_setara(papan, rng):
+    '''Puzzle setara hasil transpose, tukar band/baris/stack/kolom, dan relabel angka secara acak.'''
+    def urutan_acak():
+        blok = rng.sample(range(3), 3)
+        return [b * 3 + i for b in blok for i in rng.sample(range(3), 3)]
+
+    if rng.random() < 0.5:
+        papan = [list(kolom) for kolom in zip(*papan)]
+    peta = dict(zip(range(1, 10), rng.sample(range(1, 10), 9)))
+    baris, kolom = urutan_acak(), urutan_acak()
+    return [[peta[papan[r][c]] if papan[r][c] else 0 for c in kolom] for r in baris]
+
+
+def test_balik_transformasi_mengembalikan_papan_asli():
+    papan = main2.string_ke_papan(PUZZLE)
+    kunci, transformasi = main2.kanonisasi(papan)
+    kanonik = main2.terapkan_transformasi(papan, transformasi)
+    assert main2.papan_ke_string(kanonik) == kunci
+    assert main2.balik_transformasi(kanonik, transformasi) == papan
+
+
+def test_kunci_sama_untuk_puzzle_setara():
+    papan = main2.string_ke_papan(PUZZLE)
+    kunci = main2.kanonisasi(papan)[0]
+    rng = random.Random(7)
+    for _ in range(20):
+        setara = acak_setara(papan, rng)
+        kunci_setara, transformasi = main2.kanonisasi(setara)
+        assert kunci_setara == kunci
+        assert main2.balik_transformasi(main2.string_ke_papan(kunci_setara), transformasi) == setara
+
+
+def test_solusi_kanonik_bisa_dibalik_ke_orientasi_asli():
+    papan = main2.string_ke_papan(PUZZLE)
+    setara = acak_setara(papan, random.Random(3))
+    _, transformasi = main2.kanonisasi(setara)
+    solver = main2.SolverDLX(main2.terapkan_transformasi(setara, transformasi))
+    assert solver.cari(batas=1, tulis=False) == 1
+    solusi = main2.balik_transformasi(solver.solusi_pertama, transformasi)
+    assert all(not setara[r][c] or setara[r][c] == solusi[r][c] for r in range(9) for c in range(9))
+    assert main2.PapanBitmask(solusi).bentrok is None
+
+
+def test_papan_jarang_memakai_kunci_relabel():
+    # Papan hampir kosong punya kandidat seri yang meledak; kanonisasi harus jatuh ke relabel saja
+    papan = [[0] * 9 for _ in range(9)]
+    papan[4][4] = 7
+    papan[0][8] = 2
+    kunci, transformasi = main2.kanonisasi(papan)
+    assert (kunci, transformasi) == main2.kanonisasi_relabel(papan)
+    assert main2.balik_transformasi(main2.string_ke_papan(kunci), transformasi) == papan
+
+    kosong = [[0] * 9 for _ in range(9)]
+    assert main2.kanonisasi(kosong)[0] == '0' * 81
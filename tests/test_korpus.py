@@ -0,0 +1,64 @@
+import csv
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def solusi_dlx(puzzle):
+    solver = main2.SolverDLX(main2.string_ke_papan(puzzle))
+    solver.cari(batas=1, tulis=False)
+    return main2.papan_ke_string(solver.solusi_pertama)
+
+
+def test_tulis_dan_baca_ulang_record(tmp_path):
+    path = str(tmp_path / "data.bin")
+    papan = main2.string_ke_papan(PUZZLE)
+    solusi = solusi_dlx(PUZZLE)
+
+    korpus = main2.KorpusBiner.buat(path, 2)
+    korpus.tulis_puzzle(0, papan)
+    korpus.tulis_puzzle(1, papan)
+    korpus.tulis_hasil(0, solusi, 'sukses', '4', 12, 3456)
+    korpus.tulis_hasil(1, "", 'budget', '5', 99, 7)
+    korpus.tutup()
+
+    korpus = main2.KorpusBiner(path)
+    try:
+        assert len(korpus) == 2
+        assert korpus.papan(0).ke_list() == papan
+        assert korpus.solusi(0).ke_string() == solusi
+        assert korpus.meta(0) == (main2.KODE_STATUS_KORPUS['sukses'], 4, 12, 3456)
+        assert korpus.solusi(1).ke_string() == '0' * 81
+        assert korpus.meta(1) == (main2.KODE_STATUS_KORPUS['budget'], 5, 99, 7)
+    finally:
+        korpus.tutup()
+    assert list(main2.baca_korpus(path)) == [(1, papan), (2, papan)]
+
+
+def test_pack_solve_dump(tmp_path, capsys):
+    puzzle_lain = main2.papan_ke_string(main2.buat_puzzle_native(9, 30, 1)[0])
+    teks = tmp_path / "puzzle.txt"
+    teks.write_text(f"{PUZZLE}\n{puzzle_lain}\n")
+    masuk, keluar = str(tmp_path / "masuk.bin"), str(tmp_path / "keluar.bin")
+
+    main2.jalankan_batch(["korpus", "pack", str(teks), masuk])
+    main2.jalankan_batch(["solve", "--korpus", "--input", masuk, "--korpus-output", keluar, "--mode", "dlx"])
+    capsys.readouterr()
+
+    main2.jalankan_batch(["korpus", "dump", masuk])
+    baris = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert [b["Puzzle"] for b in baris] == [PUZZLE, puzzle_lain]
+    assert {b["Status"] for b in baris} == {"belum"}
+
+    main2.jalankan_batch(["korpus", "dump", keluar])
+    baris = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert [b["Puzzle"] for b in baris] == [PUZZLE, puzzle_lain]
+    assert [b["Status"] for b in baris] == ["sukses", "sukses"]
+    assert [b["Mode"] for b in baris] == [main2.NAMA_MODE['4']] * 2
+    assert [b["Solusi"] for b in baris] == [solusi_dlx(PUZZLE), solusi_dlx(puzzle_lain)]
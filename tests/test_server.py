@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+BENTROK = '88' + PUZZLE[2:]  # Dua angka 8 di baris pertama
+
+
+@pytest.mark.parametrize("permintaan, pesan", [
+    ({"id": 1, "op": "solve", "puzzle": PUZZLE, "mode": "cepat"}, "mode tidak dikenal"),
+    ({"id": 2, "op": "solve", "puzzle": PUZZLE, "batas_node": -1}, "batas_node"),
+    ({"id": 3, "op": "solve", "puzzle": PUZZLE, "batas_node": 1.5}, "batas_node"),
+    ({"id": 4, "op": "solve", "puzzle": PUZZLE, "batas_waktu": "1"}, "batas_waktu"),
+    ({"id": 5, "op": "solve", "puzzle": PUZZLE, "batas_waktu": True}, "batas_waktu"),
+    ({"id": 6, "op": "solve", "puzzle": BENTROK}, "bentrok"),
+    ({"id": 7, "op": "count", "puzzle": PUZZLE[:80]}, "81, 256, atau 625"),
+    ({"id": 8, "op": "count", "puzzle": 12}, "string atau list"),
+    ({"id": 9, "op": "generate", "level": "super"}, "level tidak dikenal"),
+    ({"id": 10, "op": "hapus"}, "op tidak dikenal"),
+])
+def test_permintaan_salah_dibalas_error(permintaan, pesan):
+    balasan = main2.proses_permintaan(permintaan)
+    assert balasan["id"] == permintaan["id"]
+    assert balasan["ok"] is False
+    assert pesan in balasan["error"]
+
+
+def test_permintaan_bukan_object():
+    assert main2.proses_permintaan([1, 2]) == {"id": None, "ok": False, "error": "permintaan harus object JSON"}
+
+
+def test_solve_dan_count():
+    solusi = main2.cek_keunikan(main2.string_ke_papan(PUZZLE))[1]
+
+    balasan = main2.proses_permintaan({"id": "a", "puzzle": PUZZLE, "mode": "dlx", "batas_waktu": 5})
+    assert balasan["ok"] and balasan["status"] == "sukses"
+    assert balasan["solusi"] == solusi
+
+    balasan = main2.proses_permintaan({"id": "b", "op": "count", "puzzle": PUZZLE.replace('0', '.')})
+    assert (balasan["jumlah_solusi"], balasan["unik"], balasan["solusi"]) == (1, True, solusi)
+
+    balasan = main2.proses_permintaan({"op": "solve", "puzzle": PUZZLE, "mode": "naive", "batas_node": 10})
+    assert balasan["ok"] and balasan["status"] == "budget"
+
+
+def test_aliran_tetap_jalan_setelah_baris_rusak():
+    baris = [b"{rusak\n", b"\n", json.dumps({"id": 1, "op": "hapus"}).encode() + b"\n",
+             json.dumps({"id": 2, "op": "count", "puzzle": PUZZLE}).encode() + b"\n"]
+    balasan = []
+
+    async def baca_baris():
+        return baris.pop(0) if baris else b""
+
+    async def tulis(data):
+        balasan.append(data)
+
+    asyncio.run(main2.layani_aliran(baca_baris, tulis))
+    assert [(b["id"], b["ok"]) for b in balasan] == [(None, False), (1, False), (2, True)]
+    assert balasan[0]["error"].startswith("JSON tidak valid")
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def papan_multi():
+    '''PUZZLE tanpa beberapa petunjuk: solusinya lebih dari satu.'''
+    papan = main2.string_ke_papan(PUZZLE)
+    papan[0][0] = papan[1][2] = papan[1][3] = 0
+    return papan
+
+
+def papan_buntu():
+    '''Tidak ada petunjuk yang bentrok, tapi sel (0, 8) tidak punya kandidat.'''
+    papan = [[0] * 9 for _ in range(9)]
+    papan[0][:8] = range(1, 9)
+    papan[1][8] = 9
+    return papan
+
+
+@pytest.mark.parametrize("papan", [main2.string_ke_papan(PUZZLE), papan_multi(), papan_buntu()],
+                         ids=["unik", "multi", "buntu"])
+def test_split_sama_dengan_sekuensial(papan):
+    asli = main2.salin_papan(papan)
+    solver = main2.SolverDLX(papan)
+    jumlah_seq = solver.cari(batas=1, tulis=False)
+
+    jumlah, solusi, _ = main2.cari_split(papan, '4', jobs=2, batas=1)
+    assert jumlah == jumlah_seq
+    assert solusi == solver.solusi_pertama
+    assert papan == asli
+
+
+@pytest.mark.parametrize("papan, harapan", [(main2.string_ke_papan(PUZZLE), 1), (papan_multi(), 2),
+                                            (papan_buntu(), 0)], ids=["unik", "multi", "buntu"])
+def test_split_hitung_batas_dua(papan, harapan):
+    assert main2.hitung_solusi_dlx(papan, batas=2) == harapan
+    assert main2.cari_split(papan, '4', jobs=2, batas=2)[0] == harapan
+    assert main2.hitung_solusi_dlx(papan, batas=2, jobs=2) == harapan
+
+
+def test_split_mode_backtracking_menemukan_solusi_yang_sama():
+    papan = main2.string_ke_papan(PUZZLE)
+    solver = main2.SolverDLX(papan)
+    solver.cari(batas=1, tulis=False)
+    for mode in ('2', '3'):
+        jumlah, solusi, _ = main2.cari_split(papan, mode, jobs=2, batas=1)
+        assert jumlah == 1
+        assert solusi == solver.solusi_pertama
@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def test_simpan_ambil_dan_buka_ulang(tmp_path):
+    path = str(tmp_path / "store.sqlite")
+    store = main2.PenyimpananPuzzle(path)
+    assert store.ambil(0.5, 1) is None
+    store.simpan(0.5, 1, 9, PUZZLE, "", 1)
+    store.simpan(0.5, 2, 9, "", "", -1)  # Seed yang ditolak tetap dicatat
+    assert store.ambil(0.5, 1) == (PUZZLE, "", 1)
+    store.tutup()
+
+    store = main2.PenyimpananPuzzle(path)
+    try:
+        assert store.lru == {}
+        assert store.ambil(0.5, 1, 9) == (PUZZLE, "", 1)
+        assert store.ambil(0.5, 2, 9) == ("", "", -1)
+        assert store.ambil(0.5, 1, 16) is None
+    finally:
+        store.tutup()
+
+
+def test_lru_dibatasi_kapasitas(tmp_path):
+    store = main2.PenyimpananPuzzle(str(tmp_path / "store.sqlite"), kapasitas=2)
+    try:
+        for seed in range(3):
+            store.simpan(0.5, seed, 9, PUZZLE, "", 1)
+        assert list(store.lru) == [(0.5, 1, 9), (0.5, 2, 9)]
+        assert store.ambil(0.5, 0) == (PUZZLE, "", 1)  # Masih ada di database
+        assert list(store.lru) == [(0.5, 2, 9), (0.5, 0, 9)]
+    finally:
+        store.tutup()
+
+
+def test_versi_skema_lama_dibuang(tmp_path):
+    path = str(tmp_path / "store.sqlite")
+    store = main2.PenyimpananPuzzle(path)
+    store.simpan(0.5, 1, 9, PUZZLE, "", 1)
+    store.tutup()
+
+    db = sqlite3.connect(path)
+    db.execute(f"PRAGMA user_version = {main2.VERSI_STORE - 1}")
+    db.commit()
+    db.close()
+
+    store = main2.PenyimpananPuzzle(path)
+    try:
+        assert store.ambil(0.5, 1) is None
+        assert store.db.execute("PRAGMA user_version").fetchone()[0] == main2.VERSI_STORE
+    finally:
+        store.tutup()
+
+
+def test_buat_puzzle_seed_memakai_store(tmp_path):
+    path = str(tmp_path / "store.sqlite")
+    store = main2.PenyimpananPuzzle(path)
+    try:
+        papan, jumlah, solusi = main2.buat_puzzle_seed(0.5, 11, store=store)
+    finally:
+        store.tutup()
+    assert jumlah == 1
+
+    store = main2.PenyimpananPuzzle(path)
+    try:
+        assert store.ambil(0.5, 11) == (main2.papan_ke_string(papan), solusi, 1)
+        assert main2.buat_puzzle_seed(0.5, 11, store=store) == (papan, 1, solusi)
+    finally:
+        store.tutup()
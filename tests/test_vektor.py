@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main2
+
+np = pytest.importorskip("numpy")
+
+PUZZLE = '800000000003600000070090200050007000000045700000100030001000068008500010090000400'
+
+
+def singles_skalar(papan):
+    '''Fixpoint naked + hidden single versi skalar; None kalau ketemu kontradiksi.'''
+    papan = main2.salin_papan(papan)
+    propagasi = main2.PropagasiKendala(main2.PapanBitmask(papan))
+    while True:
+        berubah = propagasi.singles()
+        if berubah is None:
+            return None
+        if not berubah:
+            return papan
+
+
+def test_singles_vektor_sama_dengan_skalar():
+    semua = [main2.buat_puzzle_native(9, petunjuk, seed)[0]
+             for petunjuk in (24, 28, 36, 45) for seed in range(6)]
+    semua.append(main2.string_ke_papan(PUZZLE))
+    papan_np = np.array(semua, dtype=np.int8)
+    bentrok = main2.propagasi_singles_vektor(papan_np)
+
+    assert not bentrok.any()
+    for papan, hasil in zip(semua, papan_np):
+        assert hasil.tolist() == singles_skalar(papan)
+
+
+def test_papan_bentrok_ditandai_dan_dikembalikan():
+    bentrok_awal = main2.string_ke_papan(PUZZLE)
+    bentrok_awal[0][1] = 8  # Dua angka 8 di baris pertama
+    buntu = [[0] * 9 for _ in range(9)]
+    buntu[0][:8] = range(1, 9)
+    buntu[1][8] = 9  # Sel (0, 8) tidak punya kandidat
+    semua = [bentrok_awal, main2.string_ke_papan(PUZZLE), buntu]
+
+    papan_np = np.array(semua, dtype=np.int8)
+    bentrok = main2.propagasi_singles_vektor(papan_np)
+
+    assert bentrok.tolist() == [True, False, True]
+    assert papan_np[0].tolist() == bentrok_awal
+    assert papan_np[2].tolist() == buntu
+    assert singles_skalar(buntu) is None
+
+
+def test_batch_vektor_sama_dengan_solve_skalar():
+    semua = [main2.buat_puzzle_native(9, 26, seed)[0] for seed in range(8)]
+    semua.append(main2.string_ke_papan(PUZZLE))
+    hasil = main2.selesaikan_batch_vektor([main2.salin_papan(p) for p in semua], '2', False)
+    for papan, (sukses, *_, solusi, _) in zip(semua, hasil):
+        assert sukses
+        assert solusi == main2.selesaikan_satu(main2.salin_papan(papan), '2')[4]
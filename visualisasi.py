@@ -1,58 +1,334 @@
+'''
+Analisis log_sudoku.csv secara incremental.
+
+- Log dibaca per chunk (pd.read_csv chunksize) dengan dtype eksplisit, tidak pernah dimuat utuh ke memori.
+- Hasilnya diringkas ke file rollup (log_sudoku.rollup.json): per Mode, per Mode+Level, dan per Mode+Seed
+  berisi jumlah, total (untuk rata-rata), min/maks, dan sketsa kuantil untuk Langkah & Durasi.
+- Rollup menyimpan offset byte terakhir yang sudah diproses, jadi run berikutnya hanya membaca
+  baris yang ditambahkan sejak itu. Kalau header log berubah (upgrade skema) atau file mengecil,
+  rollup dibangun ulang dari awal.
+- Grafik (boxplot, bar rata-rata, lineplot per seed) digambar dari rollup, bukan dari data mentah.
+
+Jalankan: python visualisasi.py            (update rollup + tampilkan grafik)
+          python visualisasi.py --tanpa-grafik   (update rollup + ringkasan teks saja, tanpa matplotlib)
+'''
+
+import os
+import sys
+import csv
+import json
+import math
+import argparse
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Load CSV
-df = pd.read_csv('log_sudoku.csv')
-
-# Pastikan tipe data
-df["Durasi"] = df["Durasi"].astype(float)
-df["Langkah"] = df["Langkah"].astype(int)
-
-# Set style
-sns.set(style="whitegrid", palette="muted", font_scale=1.1)
-
-# ===== 1. Boxplot Jumlah Langkah dengan Zoom + Outlier Highlight =====
-plt.figure(figsize=(8, 6))
-sns.boxplot(x="Mode", y="Langkah", data=df)
-sns.stripplot(x="Mode", y="Langkah", data=df, color="red", jitter=True, alpha=0.5)
-plt.ylim(0, 1000)  # Zoom biar distribusi lebih jelas
-plt.title("Perbandingan Jumlah Langkah: Naive vs BT + MRV (Zoom <1000)")
-plt.ylabel("Jumlah Langkah")
-plt.xlabel("Metode")
-plt.tight_layout()
-plt.show()
-
-# ===== 2. Bar Chart Rata-Rata Langkah & Durasi =====
-mean_df = df.groupby("Mode")[["Langkah", "Durasi"]].mean().reset_index()
-
-fig, ax = plt.subplots(1, 2, figsize=(12, 5))
-sns.barplot(x="Mode", y="Langkah", data=mean_df, ax=ax[0])
-ax[0].set_title("Rata-rata Langkah")
-ax[0].set_ylabel("Langkah")
-
-sns.barplot(x="Mode", y="Durasi", data=mean_df, ax=ax[1])
-ax[1].set_title("Rata-rata Durasi")
-ax[1].set_ylabel("Durasi (detik)")
-ax[1].set_xlabel("Metode")
-
-plt.tight_layout()
-plt.show()
-
-# ===== 3. Lineplot per Seed (Performa Tiap Puzzle) =====
-df_sorted = df.sort_values(by="Seed")
-
-plt.figure(figsize=(10, 6))
-sns.lineplot(x="Seed", y="Langkah", hue="Mode", data=df_sorted, marker='o')
-plt.title("Jumlah Langkah per Seed")
-plt.xlabel("Seed")
-plt.ylabel("Jumlah Langkah")
-plt.tight_layout()
-plt.show()
-
-# ===== 4. Print Outlier Info (Optional tapi penting!) =====
-threshold = 1000
-outliers = df[df["Langkah"] > threshold]
-if not outliers.empty:
-    print("⚠️ Outlier Terdeteksi (Langkah > 1000):")
-    print(outliers[["Mode", "Langkah", "Seed"]])
+
+FILE_LOG = "log_sudoku.csv"
+FILE_ROLLUP = "log_sudoku.rollup.json"
+VERSI_ROLLUP = 1  # Naikkan kalau struktur rollup berubah (rollup lama otomatis dibangun ulang)
+UKURAN_CHUNK = 100_000  # Baris per chunk pandas
+AMBANG_OUTLIER = 1000  # Langkah di atas ini dicatat sebagai outlier (sama dengan versi lama)
+MAKS_OUTLIER = 500  # Outlier yang disimpan di rollup (yang terbaru)
+
+# Tipe kolom eksplisit: pandas tidak perlu menebak tipe per chunk (lebih cepat dan konsisten antar chunk)
+DTYPE_LOG = {
+    "Timestamp": "string",
+    "Level": "string",
+    "Mode": "string",
+    "Langkah": "int64",
+    "Durasi": "float64",
+    "Seed": "float64",  # Kosong untuk puzzle dari mode batch
+    "SolveNs": "float64",  # Skema log versi 2 ke atas
+    "Status": "string",  # Skema log versi 3 ke atas: sukses / budget
+}
+KOLOM_DIPAKAI = ["Level", "Mode", "Langkah", "Durasi", "Seed", "SolveNs", "Status"]
+
+
+class SketsaKuantil:
+    '''
+    Sketsa kuantil dengan akurasi relatif (ide DDSketch): nilai x > 0 masuk bucket
+    ceil(log(x) / log(gamma)), jadi kuantil yang dikembalikan paling jauh meleset `akurasi` (1%) relatif.
+    Ukurannya kecil (satu angka per bucket), bisa digabung, dan bisa disimpan sebagai JSON.
+    '''
+
+    def __init__(self, akurasi=0.01, bucket=None, nol=0):
+        self.akurasi = akurasi
+        self.gamma = (1 + akurasi) / (1 - akurasi)
+        self.log_gamma = math.log(self.gamma)
+        self.bucket = bucket or {}  # indeks bucket -> jumlah
+        self.nol = nol  # Jumlah nilai <= 0 (misal Langkah 0 karena puzzle selesai lewat propagasi)
+
+    def tambah_banyak(self, nilai):
+        '''Tambah satu pd.Series nilai sekaligus (bucket dihitung dengan value_counts, bukan loop Python).'''
+        nilai = nilai.dropna()
+        positif = nilai[nilai > 0]
+        self.nol += len(nilai) - len(positif)
+        if len(positif):
+            indeks = (positif.map(math.log) / self.log_gamma).map(math.ceil)
+            for i, jumlah in indeks.value_counts().items():
+                self.bucket[int(i)] = self.bucket.get(int(i), 0) + int(jumlah)
+
+    def jumlah(self):
+        return self.nol + sum(self.bucket.values())
+
+    def kuantil(self, q):
+        total = self.jumlah()
+        if total == 0:
+            return float("nan")
+        target = q * (total - 1)
+        lewat = self.nol
+        if target < lewat:
+            return 0.0
+        for i in sorted(self.bucket):
+            lewat += self.bucket[i]
+            if target < lewat:
+                return 2 * self.gamma ** i / (self.gamma + 1)  # Titik tengah bucket
+        return 2 * self.gamma ** max(self.bucket) / (self.gamma + 1)
+
+    def ke_dict(self):
+        return {"akurasi": self.akurasi, "nol": self.nol, "bucket": {str(i): j for i, j in self.bucket.items()}}
+
+    @classmethod
+    def dari_dict(cls, data):
+        return cls(data["akurasi"], {int(i): j for i, j in data["bucket"].items()}, data["nol"])
+
+
+def ringkasan_baru():
+    return {"jumlah": 0, "total_langkah": 0, "total_durasi": 0.0,
+            "min_langkah": None, "maks_langkah": None,
+            "sketsa_langkah": SketsaKuantil(), "sketsa_durasi": SketsaKuantil()}
+
+
+def gabung_chunk(ringkasan, chunk):
+    '''Tambahkan satu kelompok baris (DataFrame) ke ringkasan (dict hasil ringkasan_baru).'''
+    ringkasan["jumlah"] += len(chunk)
+    ringkasan["total_langkah"] += int(chunk["Langkah"].sum())
+    ringkasan["total_durasi"] += float(chunk["Durasi"].sum())
+    kecil, besar = int(chunk["Langkah"].min()), int(chunk["Langkah"].max())
+    ringkasan["min_langkah"] = kecil if ringkasan["min_langkah"] is None else min(ringkasan["min_langkah"], kecil)
+    ringkasan["maks_langkah"] = besar if ringkasan["maks_langkah"] is None else max(ringkasan["maks_langkah"], besar)
+    ringkasan["sketsa_langkah"].tambah_banyak(chunk["Langkah"])
+    ringkasan["sketsa_durasi"].tambah_banyak(chunk["Durasi"])
+
+
+def ringkasan_ke_json(ringkasan):
+    data = dict(ringkasan)
+    data["sketsa_langkah"] = ringkasan["sketsa_langkah"].ke_dict()
+    data["sketsa_durasi"] = ringkasan["sketsa_durasi"].ke_dict()
+    return data
+
+
+def ringkasan_dari_json(data):
+    data = dict(data)
+    data["sketsa_langkah"] = SketsaKuantil.dari_dict(data["sketsa_langkah"])
+    data["sketsa_durasi"] = SketsaKuantil.dari_dict(data["sketsa_durasi"])
+    return data
+
+
+def rollup_kosong(header):
+    return {"versi": VERSI_ROLLUP, "header": header, "offset": 0,
+            "per_mode": {}, "per_mode_level": {}, "per_mode_seed": {}, "outlier": []}
+
+
+def muat_rollup(path_rollup, header):
+    '''Muat rollup lama; kalau tidak ada / versi beda / header log berubah, mulai dari kosong.'''
+    if os.path.isfile(path_rollup):
+        with open(path_rollup) as file:
+            data = json.load(file)
+        if data.get("versi") == VERSI_ROLLUP and data.get("header") == header:
+            for kunci in ("per_mode", "per_mode_level", "per_mode_seed"):
+                data[kunci] = {k: ringkasan_dari_json(v) for k, v in data[kunci].items()}
+            return data
+    return rollup_kosong(header)
+
+
+def simpan_rollup(path_rollup, rollup):
+    data = dict(rollup)
+    for kunci in ("per_mode", "per_mode_level", "per_mode_seed"):
+        data[kunci] = {k: ringkasan_ke_json(v) for k, v in rollup[kunci].items()}
+    sementara = path_rollup + ".tmp"
+    with open(sementara, "w") as file:
+        json.dump(data, file)
+    os.replace(sementara, path_rollup)  # Tulis atomik: rollup tidak pernah setengah jadi
+
+
+class BacaSampai:
+    '''Pembungkus file biner yang berhenti di batas byte tertentu (baris yang sedang ditulis tidak ikut terbaca).'''
+
+    def __init__(self, file, sisa):
+        self.file = file
+        self.sisa = sisa
+
+    def read(self, n=-1):
+        if n < 0 or n > self.sisa:
+            n = self.sisa
+        data = self.file.read(n)
+        self.sisa -= len(data)
+        return data
+
+    def __iter__(self):
+        return iter(self.read().splitlines(True))
+
+
+def batas_baris_utuh(path, ukuran):
+    '''Posisi byte setelah newline terakhir sebelum `ukuran` (baris terakhir yang belum selesai diabaikan).'''
+    with open(path, "rb") as file:
+        posisi = ukuran
+        while posisi > 0:
+            mulai = max(0, posisi - 65536)
+            file.seek(mulai)
+            blok = file.read(posisi - mulai)
+            akhir = blok.rfind(b"\n")
+            if akhir >= 0:
+                return mulai + akhir + 1
+            posisi = mulai
+    return 0
+
+
+def perbarui_rollup(path_log=FILE_LOG, path_rollup=FILE_ROLLUP, ukuran_chunk=UKURAN_CHUNK):
+    '''
+    Proses baris log yang belum pernah diproses dan perbarui rollup.
+    Return (rollup, jumlah_baris_baru).
+    '''
+    with open(path_log, newline="") as file:
+        header = next(csv.reader(file), None) or []
+    rollup = muat_rollup(path_rollup, header)
+
+    ukuran = batas_baris_utuh(path_log, os.path.getsize(path_log))
+    if ukuran < rollup["offset"]:
+        rollup = rollup_kosong(header)  # File dipotong / ditulis ulang: bangun ulang
+
+    baru = 0
+    with open(path_log, "rb") as file:
+        if rollup["offset"] == 0:
+            rollup["offset"] = len(file.readline())  # Lewati header
+        file.seek(rollup["offset"])
+        dtype = {k: v for k, v in DTYPE_LOG.items() if k in header}
+        pembaca = pd.read_csv(BacaSampai(file, ukuran - rollup["offset"]), header=None, names=header,
+                              usecols=[k for k in KOLOM_DIPAKAI if k in header], dtype=dtype,
+                              chunksize=ukuran_chunk)
+        for chunk in pembaca:
+            baru += len(chunk)
+            if "Status" in chunk:
+                # Solve yang kehabisan budget tidak ikut statistik (langkahnya terpotong); baris lama = sukses
+                chunk = chunk[chunk["Status"].fillna("sukses") == "sukses"].copy()
+            if "SolveNs" in chunk:
+                # Skema 2: waktu solve dari perf_counter_ns lebih presisi dari kolom Durasi lama
+                chunk["Durasi"] = (chunk["SolveNs"] / 1e9).fillna(chunk["Durasi"])
+            chunk["Level"] = chunk["Level"].fillna("")
+
+            for mode, kelompok in chunk.groupby("Mode"):
+                gabung_chunk(rollup["per_mode"].setdefault(mode, ringkasan_baru()), kelompok)
+            for (mode, level), kelompok in chunk.groupby(["Mode", "Level"]):
+                gabung_chunk(rollup["per_mode_level"].setdefault(f"{mode}|{level}", ringkasan_baru()), kelompok)
+            for (mode, seed), kelompok in chunk.dropna(subset=["Seed"]).groupby(["Mode", "Seed"]):
+                gabung_chunk(rollup["per_mode_seed"].setdefault(f"{mode}|{int(seed)}", ringkasan_baru()), kelompok)
+
+            outlier = chunk[chunk["Langkah"] > AMBANG_OUTLIER]
+            for mode, langkah, seed in outlier[["Mode", "Langkah", "Seed"]].itertuples(index=False):
+                rollup["outlier"].append([mode, int(langkah), None if pd.isna(seed) else int(seed)])
+            del rollup["outlier"][:-MAKS_OUTLIER]
+
+    rollup["offset"] = ukuran
+    simpan_rollup(path_rollup, rollup)
+    return rollup, baru
+
+
+def cetak_ringkasan(rollup):
+    print(f"{'Mode':22} {'Level':10} {'Jumlah':>8} {'Rata langkah':>13} {'p50':>8} {'p95':>8} {'Rata durasi':>12}")
+    for kunci, r in sorted(rollup["per_mode_level"].items()):
+        mode, level = kunci.split("|", 1)
+        print(f"{mode:22} {level:10} {r['jumlah']:>8} {r['total_langkah'] / r['jumlah']:>13.1f} "
+              f"{r['sketsa_langkah'].kuantil(0.5):>8.0f} {r['sketsa_langkah'].kuantil(0.95):>8.0f} "
+              f"{r['total_durasi'] / r['jumlah']:>12.6f}")
+
+
+def gambar_grafik(rollup):
+    '''Grafik yang sama dengan versi lama, tapi semua angka diambil dari rollup.'''
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set style
+    sns.set(style="whitegrid", palette="muted", font_scale=1.1)
+    daftar_mode = sorted(rollup["per_mode"])
+
+    # ===== 1. Boxplot Jumlah Langkah dengan Zoom (kuartil dari sketsa) =====
+    statistik_box = []
+    for mode in daftar_mode:
+        r = rollup["per_mode"][mode]
+        sketsa = r["sketsa_langkah"]
+        q1, median, q3 = sketsa.kuantil(0.25), sketsa.kuantil(0.5), sketsa.kuantil(0.75)
+        iqr = q3 - q1
+        statistik_box.append({
+            "label": mode, "q1": q1, "med": median, "q3": q3,
+            "whislo": max(r["min_langkah"], q1 - 1.5 * iqr),
+            "whishi": min(r["maks_langkah"], q3 + 1.5 * iqr),
+            "fliers": [langkah for m, langkah, _ in rollup["outlier"] if m == mode],
+        })
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.bxp(statistik_box, showfliers=True)
+    ax.set_ylim(0, 1000)  # Zoom biar distribusi lebih jelas
+    ax.set_title("Perbandingan Jumlah Langkah: Naive vs BT + MRV (Zoom <1000)")
+    ax.set_ylabel("Jumlah Langkah")
+    ax.set_xlabel("Metode")
+    plt.tight_layout()
+    plt.show()
+
+    # ===== 2. Bar Chart Rata-Rata Langkah & Durasi =====
+    mean_df = pd.DataFrame([
+        {"Mode": mode,
+         "Langkah": r["total_langkah"] / r["jumlah"],
+         "Durasi": r["total_durasi"] / r["jumlah"]}
+        for mode, r in sorted(rollup["per_mode"].items())
+    ])
+
+    fig, ax = plt.subplots(1, 2, figsize=(12, 5))
+    sns.barplot(x="Mode", y="Langkah", data=mean_df, ax=ax[0])
+    ax[0].set_title("Rata-rata Langkah")
+    ax[0].set_ylabel("Langkah")
+
+    sns.barplot(x="Mode", y="Durasi", data=mean_df, ax=ax[1])
+    ax[1].set_title("Rata-rata Durasi")
+    ax[1].set_ylabel("Durasi (detik)")
+    ax[1].set_xlabel("Metode")
+
+    plt.tight_layout()
+    plt.show()
+
+    # ===== 3. Lineplot per Seed (Performa Tiap Puzzle) =====
+    seed_df = pd.DataFrame([
+        {"Mode": kunci.split("|", 1)[0], "Seed": int(kunci.split("|", 1)[1]),
+         "Langkah": r["total_langkah"] / r["jumlah"]}
+        for kunci, r in rollup["per_mode_seed"].items()
+    ])
+    if not seed_df.empty:
+        plt.figure(figsize=(10, 6))
+        sns.lineplot(x="Seed", y="Langkah", hue="Mode", data=seed_df.sort_values(by="Seed"), marker='o')
+        plt.title("Jumlah Langkah per Seed")
+        plt.xlabel("Seed")
+        plt.ylabel("Jumlah Langkah")
+        plt.tight_layout()
+        plt.show()
+
+
+def cetak_outlier(rollup):
+    # ===== 4. Print Outlier Info (Optional tapi penting!) =====
+    if rollup["outlier"]:
+        print(f"⚠️ Outlier Terdeteksi (Langkah > {AMBANG_OUTLIER}, {MAKS_OUTLIER} terbaru):")
+        print(pd.DataFrame(rollup["outlier"], columns=["Mode", "Langkah", "Seed"]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analisis log_sudoku.csv (incremental)")
+    parser.add_argument("--log", default=FILE_LOG, help="File log CSV")
+    parser.add_argument("--rollup", default=FILE_ROLLUP, help="File rollup JSON")
+    parser.add_argument("--chunk", type=int, default=UKURAN_CHUNK, help="Baris per chunk")
+    parser.add_argument("--tanpa-grafik", action="store_true", help="Hanya update rollup + ringkasan teks")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.log):
+        sys.exit(f"File log {args.log} tidak ditemukan")
+    rollup, baru = perbarui_rollup(args.log, args.rollup, args.chunk)
+    print(f"📈 {baru} baris baru diproses (rollup: {args.rollup})")
+    cetak_ringkasan(rollup)
+    if not args.tanpa_grafik:
+        gambar_grafik(rollup)
+    cetak_outlier(rollup)